@@ -0,0 +1,148 @@
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from pathlib import Path
+
+from griptape_cloud.publish_workflow import GRIPTAPE_CLOUD_LIBRARY_CONFIG_KEY
+from griptape_cloud.utils.cache_dir import get_cache_dir
+from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+ASSET_CACHE_DIR_NAME = "assets"
+ASSET_CACHE_INDEX_FILE_NAME = "index.sqlite3"
+ASSET_CACHE_MAX_MB_SETTING = "GT_CLOUD_ASSET_CACHE_MAX_MB"
+DEFAULT_ASSET_CACHE_MAX_MB = 5 * 1024
+SQLITE_TIMEOUT_SECONDS = 30.0
+
+
+def get_asset_cache_max_bytes() -> int:
+    """Return the size cap of the asset cache from the library settings, which it shares across the process."""
+    value = GriptapeNodes.ConfigManager().get_config_value(
+        f"{GRIPTAPE_CLOUD_LIBRARY_CONFIG_KEY}.{ASSET_CACHE_MAX_MB_SETTING}"
+    )
+    return int(value if value is not None else DEFAULT_ASSET_CACHE_MAX_MB) * 1024 * 1024
+
+
+def get_temp_path(path: Path) -> Path:
+    """Return a hidden temp file name next to `path` that is unique to this process and thread."""
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def copy_file_atomically(source: Path, destination: Path) -> None:
+    """Copy `source` to `destination` through a temp file and a rename, so readers never see a partial file."""
+    temp_path = get_temp_path(destination)
+    try:
+        shutil.copyfile(source, temp_path)
+        temp_path.replace(destination)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+class AssetCache:
+    """Bounded, least-recently-used on-disk cache of downloaded assets keyed by bucket, asset name and ETag.
+
+    Files are written through a temp file and an atomic rename, and the SQLite index serializes
+    bookkeeping between engine processes. A file evicted by another process while it is being
+    copied out is treated as a cache miss. Every engine process shares the cache directory, so its
+    size cap is the `GT_CLOUD_ASSET_CACHE_MAX_MB` library setting rather than a per-node value.
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None, max_bytes: int | None = None) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else get_cache_dir(ASSET_CACHE_DIR_NAME)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes if max_bytes is not None else get_asset_cache_max_bytes()
+        with self._connect() as connection:
+            connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS cached_assets (
+                    bucket_id TEXT NOT NULL,
+                    asset_name TEXT NOT NULL,
+                    etag TEXT NOT NULL,
+                    file_name TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_accessed_at REAL NOT NULL,
+                    PRIMARY KEY (bucket_id, asset_name, etag)
+                );
+                CREATE INDEX IF NOT EXISTS cached_assets_by_access ON cached_assets (last_accessed_at);
+                """
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection that commits on success, rolls back on error and is always closed."""
+        db_path = self.cache_dir / ASSET_CACHE_INDEX_FILE_NAME
+        with closing(sqlite3.connect(db_path, timeout=SQLITE_TIMEOUT_SECONDS)) as connection, connection:
+            yield connection
+
+    def copy_to(self, bucket_id: str, asset_name: str, etag: str, destination: str | Path) -> bool:
+        """Copy the cached asset to `destination` and return True, or return False on a cache miss."""
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT file_name FROM cached_assets WHERE bucket_id = ? AND asset_name = ? AND etag = ?",
+                (bucket_id, asset_name, etag),
+            ).fetchone()
+            if row is None:
+                return False
+            connection.execute(
+                "UPDATE cached_assets SET last_accessed_at = ? WHERE bucket_id = ? AND asset_name = ? AND etag = ?",
+                (time.time(), bucket_id, asset_name, etag),
+            )
+
+        try:
+            copy_file_atomically(self.cache_dir / row[0], Path(destination))
+        except FileNotFoundError:
+            logger.debug("Cached copy of asset %s was evicted before it could be read", asset_name)
+            with self._connect() as connection:
+                connection.execute(
+                    "DELETE FROM cached_assets WHERE bucket_id = ? AND asset_name = ? AND etag = ?",
+                    (bucket_id, asset_name, etag),
+                )
+            return False
+        return True
+
+    def put(self, bucket_id: str, asset_name: str, etag: str, source: str | Path) -> None:
+        """Add a copy of `source` to the cache, then evict least recently used assets over the size cap."""
+        size = Path(source).stat().st_size
+        if size > self.max_bytes:
+            return
+        file_name = hashlib.sha256("\0".join((bucket_id, asset_name, etag)).encode("utf-8")).hexdigest()
+        copy_file_atomically(Path(source), self.cache_dir / file_name)
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO cached_assets (bucket_id, asset_name, etag, file_name, size, last_accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (bucket_id, asset_name, etag, file_name, size, time.time()),
+            )
+        self.evict()
+
+    def evict(self) -> None:
+        with self._connect() as connection:
+            # Take the write lock up front so concurrent processes do not evict the same entries twice.
+            connection.execute("BEGIN IMMEDIATE")
+            total_size = connection.execute("SELECT COALESCE(SUM(size), 0) FROM cached_assets").fetchone()[0]
+            if total_size <= self.max_bytes:
+                return
+            rows = connection.execute(
+                "SELECT bucket_id, asset_name, etag, file_name, size FROM cached_assets ORDER BY last_accessed_at"
+            ).fetchall()
+            evicted_file_names = []
+            for bucket_id, asset_name, etag, file_name, size in rows:
+                if total_size <= self.max_bytes:
+                    break
+                connection.execute(
+                    "DELETE FROM cached_assets WHERE bucket_id = ? AND asset_name = ? AND etag = ?",
+                    (bucket_id, asset_name, etag),
+                )
+                evicted_file_names.append(file_name)
+                total_size -= size
+        for file_name in evicted_file_names:
+            (self.cache_dir / file_name).unlink(missing_ok=True)
+        logger.debug("Evicted %d assets from the asset cache", len(evicted_file_names))
@@ -0,0 +1,302 @@
+import hashlib
+import logging
+import mmap
+import re
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
+from http import HTTPStatus
+from pathlib import Path
+
+from griptape_cloud_client.models.assert_url_operation import AssertUrlOperation
+
+from griptape_cloud.assets.asset_cache import AssetCache, get_temp_path
+from griptape_cloud.assets.asset_transfer import DEFAULT_TRANSFER_TIMEOUT
+from griptape_cloud.assets.content_encoding import create_decompressor, is_compressed, is_supported_encoding
+from griptape_cloud.assets.multipart_upload import MIB, MULTIPART_MANIFEST_CONTENT_TYPE, MultipartManifest
+from griptape_cloud.assets.transfer_integrity import IntegrityError, get_md5_etag
+from griptape_cloud.assets.transfer_progress import TransferProgress
+from griptape_cloud.mixins.griptape_cloud_api_mixin import GriptapeCloudApiMixin
+from griptape_cloud.utils.http_transport import HttpTransport, TransportStream
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+DEFAULT_CHUNK_SIZE = 16 * MIB
+DEFAULT_MAX_PARALLEL_CHUNKS = 8
+STREAM_BLOCK_SIZE = 1 * MIB
+CONTENT_RANGE_PATTERN = re.compile(r"bytes \d+-\d+/(\d+)")
+
+
+@dataclass
+class AssetObjectInfo:
+    size: int | None
+    content_type: str | None
+    etag: str | None
+    supports_ranges: bool
+    content_encoding: str | None = None
+
+
+def probe_presigned_url(url: str) -> AssetObjectInfo:
+    """Fetch the first byte of an object to learn its size, type and whether ranged GETs are supported.
+
+    Presigned GET URLs are not valid for HEAD requests, so a one byte ranged GET is used instead.
+    """
+    with HttpTransport.stream("GET", url, headers={"Range": "bytes=0-0"}, timeout=DEFAULT_TRANSFER_TIMEOUT) as response:
+        response.raise_for_status()
+        content_range = CONTENT_RANGE_PATTERN.match(response.headers.get("Content-Range", ""))
+        if response.status_code == HTTPStatus.PARTIAL_CONTENT and content_range:
+            size = int(content_range.group(1))
+        else:
+            content_length = response.headers.get("Content-Length")
+            size = int(content_length) if content_length is not None else None
+        return AssetObjectInfo(
+            size=size,
+            content_type=response.headers.get("Content-Type"),
+            etag=response.headers.get("ETag"),
+            supports_ranges=response.status_code == HTTPStatus.PARTIAL_CONTENT,
+            content_encoding=response.headers.get("Content-Encoding"),
+        )
+
+
+def _iter_decoded(response: TransportStream, progress: TransferProgress | None = None) -> Iterator[bytes]:
+    """Yield the response body, decompressing gzip or zstd content encodings block by block.
+
+    The raw stream is read with the HTTP client's own decoding disabled so every supported encoding,
+    including ones it cannot decode, goes through the same streaming decompressor.
+    """
+    content_encoding = response.headers.get("Content-Encoding")
+    decompressor = create_decompressor(content_encoding) if is_compressed(content_encoding) else None
+    for block in response.iter_raw(STREAM_BLOCK_SIZE):
+        if decompressor is not None:
+            block = decompressor.decompress(block)  # noqa: PLW2901
+        if block:
+            if progress is not None:
+                progress.add(len(block))
+            yield block
+    if decompressor is not None and (block := decompressor.flush()):
+        if progress is not None:
+            progress.add(len(block))
+        yield block
+
+
+def _stream_into(
+    url: str,
+    view: memoryview,
+    offset: int,
+    length: int,
+    byte_range: tuple[int, int] | None = None,
+    progress: TransferProgress | None = None,
+) -> None:
+    """Stream the body of `url`, or only the inclusive `byte_range` of it, into `view` starting at `offset`.
+
+    The decoded body must be exactly `length` bytes, so a short or truncated response cannot leave
+    a hole in the preallocated file, and a ranged request must be answered with that range.
+    """
+    headers = {"Range": f"bytes={byte_range[0]}-{byte_range[1]}"} if byte_range is not None else {}
+    with (
+        progress.time_transfer() if progress is not None else nullcontext(),
+        HttpTransport.stream("GET", url, headers=headers, timeout=DEFAULT_TRANSFER_TIMEOUT) as response,
+    ):
+        response.raise_for_status()
+        if byte_range is not None and response.status_code != HTTPStatus.PARTIAL_CONTENT:
+            msg = f"Expected a partial response for bytes {byte_range[0]}-{byte_range[1]}, got {response.status_code}."
+            raise IntegrityError(msg)
+        end = offset + length
+        position = offset
+        for block in _iter_decoded(response, progress):
+            if position + len(block) > end:
+                msg = f"Received more than the expected {length} bytes for offset {offset}."
+                raise IntegrityError(msg)
+            view[position : position + len(block)] = block
+            position += len(block)
+        if position != end:
+            msg = f"Received {position - offset} bytes for offset {offset}, expected {length}."
+            raise IntegrityError(msg)
+
+
+def _hash_file(path: Path, algorithm: str) -> str:
+    digest = hashlib.new(algorithm, usedforsecurity=False)
+    with path.open("rb") as file:
+        while block := file.read(STREAM_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class AssetDownloader:
+    """Downloads assets with parallel byte-range GETs written directly into a memory-mapped file.
+
+    Assets uploaded as multipart manifests are reassembled by downloading their parts in parallel.
+    Compressed assets and parts are decompressed as they stream.
+    """
+
+    def __init__(
+        self,
+        api: GriptapeCloudApiMixin,
+        bucket_id: str,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_parallel_chunks: int = DEFAULT_MAX_PARALLEL_CHUNKS,
+        progress: TransferProgress | None = None,
+        cache: AssetCache | None = None,
+    ) -> None:
+        self.api = api
+        self.bucket_id = bucket_id
+        self.chunk_size = chunk_size
+        self.max_parallel_chunks = max_parallel_chunks
+        self.progress = progress
+        self.cache = cache
+
+    def download(self, asset_name: str, destination: str | Path, expected_sha256: str | None = None) -> Path:
+        """Download an asset to `destination`, replacing it only once the download is complete and verified.
+
+        A failed download leaves any existing file at `destination` untouched.
+        """
+        destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = get_temp_path(destination)
+        try:
+            actual_size = self._download(asset_name, temp_path, expected_sha256)
+            temp_path.replace(destination)
+        finally:
+            temp_path.unlink(missing_ok=True)
+        logger.info("Downloaded asset %s (%d bytes) to %s", asset_name, actual_size, destination)
+        return destination
+
+    def _download(self, asset_name: str, destination: Path, expected_sha256: str | None) -> int:
+        """Download and verify an asset into `destination`, returning its size."""
+        url = self._get_url(asset_name)
+        with self._time_transfer():
+            info = probe_presigned_url(url)
+        if not is_supported_encoding(info.content_encoding):
+            logger.warning(
+                "Asset %s has unsupported Content-Encoding '%s', downloading its stored bytes undecoded",
+                asset_name,
+                info.content_encoding,
+            )
+        if self.progress is not None:
+            # The stored size of a compressed body is not its decoded size.
+            self.progress.total_bytes = None if is_compressed(info.content_encoding) else info.size
+
+        # The ETag changes whenever the asset is overwritten, so a cached copy under it is never stale.
+        cache = self.cache if info.etag else None
+        cache_hit = cache is not None and cache.copy_to(self.bucket_id, asset_name, info.etag, destination)
+        if cache_hit:
+            logger.info("Served asset %s from the local asset cache", asset_name)
+            # Cached copies were verified when they were added.
+        elif info.content_type == MULTIPART_MANIFEST_CONTENT_TYPE:
+            with self._time_transfer():
+                manifest_response = HttpTransport.request("GET", url, timeout=DEFAULT_TRANSFER_TIMEOUT)
+                manifest_response.raise_for_status()
+                manifest = MultipartManifest.from_json(manifest_response.content)
+            if self.progress is not None:
+                self.progress.total_bytes = manifest.size
+            # Every part is checked for its exact length as it is written.
+            self._download_parts(manifest, destination)
+        elif info.size is None or not info.supports_ranges or is_compressed(info.content_encoding):
+            # Unknown size, no range support or a compressed body, fall back to a single streamed GET.
+            actual_size = 0
+            with (
+                self._time_transfer(),
+                HttpTransport.stream("GET", url, timeout=DEFAULT_TRANSFER_TIMEOUT) as response,
+            ):
+                response.raise_for_status()
+                with destination.open("wb") as file:
+                    for block in _iter_decoded(response, self.progress):
+                        file.write(block)
+                        actual_size += len(block)
+            # The stored size of a compressed body is not its decoded size.
+            expected_size = None if is_compressed(info.content_encoding) else info.size
+            if expected_size is not None and actual_size != expected_size:
+                msg = f"Downloaded {actual_size} bytes for asset '{asset_name}', expected {expected_size}."
+                raise IntegrityError(msg)
+        else:
+            # Every range is checked for its exact length as it is written.
+            self._download_ranges(url, info.size, destination)
+
+        actual_size = destination.stat().st_size
+        if expected_sha256 and (actual_sha256 := _hash_file(destination, "sha256")) != expected_sha256.lower():
+            msg = f"Checksum mismatch for asset '{asset_name}': expected {expected_sha256}, got {actual_sha256}."
+            raise IntegrityError(msg)
+
+        if cache is not None and not cache_hit:
+            if expected_sha256 or self._verify_md5_etag(asset_name, info, destination):
+                cache.put(self.bucket_id, asset_name, info.etag, destination)
+            else:
+                logger.debug("Not caching asset %s, there is no hash or MD5 ETag to verify it against", asset_name)
+
+        return actual_size
+
+    def _verify_md5_etag(self, asset_name: str, info: AssetObjectInfo, destination: Path) -> bool:
+        """Check a plain download against the MD5 its ETag holds, returning False if there is none to check.
+
+        The ETag of a compressed body or a multipart manifest does not describe the downloaded file.
+        """
+        stored_md5 = get_md5_etag(info.etag)
+        if (
+            stored_md5 is None
+            or is_compressed(info.content_encoding)
+            or info.content_type == MULTIPART_MANIFEST_CONTENT_TYPE
+        ):
+            return False
+        if (actual_md5 := _hash_file(destination, "md5")) != stored_md5:
+            msg = f"Checksum mismatch for asset '{asset_name}': stored ETag {stored_md5}, got {actual_md5}."
+            raise IntegrityError(msg)
+        return True
+
+    def _get_url(self, asset_name: str) -> str:
+        with self.progress.time_api() if self.progress is not None else nullcontext():
+            return self.api._get_cached_asset_url(asset_name, self.bucket_id, AssertUrlOperation.GET).url
+
+    def _time_transfer(self) -> AbstractContextManager[None]:
+        return self.progress.time_transfer() if self.progress is not None else nullcontext()
+
+    def _download_ranges(self, url: str, size: int, destination: Path) -> None:
+        ranges = [(start, min(start + self.chunk_size, size) - 1) for start in range(0, size, self.chunk_size)]
+        with _PreallocatedFile(destination, size) as view, ThreadPoolExecutor(self.max_parallel_chunks) as executor:
+            list(
+                executor.map(
+                    lambda byte_range: _stream_into(
+                        url, view, byte_range[0], byte_range[1] - byte_range[0] + 1, byte_range, self.progress
+                    ),
+                    ranges,
+                )
+            )
+
+    def _download_parts(self, manifest: MultipartManifest, destination: Path) -> None:
+        with (
+            _PreallocatedFile(destination, manifest.size) as view,
+            ThreadPoolExecutor(self.max_parallel_chunks) as executor,
+        ):
+            list(
+                executor.map(
+                    lambda part: _stream_into(
+                        self._get_url(part.asset_name), view, part.offset, part.size, progress=self.progress
+                    ),
+                    manifest.parts,
+                )
+            )
+
+
+class _PreallocatedFile:
+    """Context manager that sizes a file up front and exposes it as a writable memoryview."""
+
+    def __init__(self, path: Path, size: int) -> None:
+        self.path = path
+        self.size = size
+
+    def __enter__(self) -> memoryview:
+        self._file = self.path.open("w+b")
+        self._file.truncate(self.size)
+        # Empty files cannot be memory-mapped, and have nothing to write anyway.
+        self._mmap = mmap.mmap(self._file.fileno(), self.size) if self.size else None
+        self._view = memoryview(self._mmap) if self._mmap is not None else memoryview(b"")
+        return self._view
+
+    def __exit__(self, *args: object) -> None:
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.flush()
+            self._mmap.close()
+        self._file.close()
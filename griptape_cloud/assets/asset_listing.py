@@ -0,0 +1,211 @@
+import logging
+import queue
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Generator, Iterable
+from fnmatch import fnmatchcase
+from typing import TYPE_CHECKING, ClassVar
+
+from griptape_cloud.assets.asset_tags import refresh_asset_tags
+
+if TYPE_CHECKING:
+    from griptape_cloud_client.models.asset_detail import AssetDetail
+
+    from griptape_cloud.mixins.griptape_cloud_api_mixin import GriptapeCloudApiMixin
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_PREFETCH_PAGES = 2
+DEFAULT_INDEX_MAX_AGE_SECONDS = 300.0
+PREFETCH_POLL_SECONDS = 0.5
+GLOB_WILDCARDS = "*?["
+
+_END_OF_LISTING = object()
+
+
+def get_literal_prefix(pattern: str) -> str:
+    """Return the part of a glob pattern before its first wildcard."""
+    for index, character in enumerate(pattern):
+        if character in GLOB_WILDCARDS:
+            return pattern[:index]
+    return pattern
+
+
+def iter_assets(
+    api: "GriptapeCloudApiMixin",
+    bucket_id: str,
+    prefix: str = "",
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch_pages: int = DEFAULT_PREFETCH_PAGES,
+) -> Generator["AssetDetail", None, None]:
+    """Yield every asset in the bucket whose name starts with `prefix`.
+
+    A background thread fetches up to `prefetch_pages` pages ahead of the consumer, so listing
+    latency overlaps with whatever the consumer does with each page. The prefix is sent to
+    Griptape Cloud and also applied locally, in case the server does not filter by it.
+    """
+    pages: queue.Queue = queue.Queue(maxsize=max(prefetch_pages, 1))
+    stopped = threading.Event()
+
+    def put(item: object) -> bool:
+        while not stopped.is_set():
+            try:
+                pages.put(item, timeout=PREFETCH_POLL_SECONDS)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def fetch_pages() -> None:
+        page = 1
+        try:
+            while not stopped.is_set():
+                response = api._list_assets(bucket_id, prefix=prefix or None, page=page, page_size=page_size)
+                if not put(response.assets):
+                    return
+                total_pages = getattr(response.pagination, "total_pages", None)
+                # The server may cap the page size, so a short page does not mean the listing is done.
+                if not response.assets or (isinstance(total_pages, int) and page >= total_pages):
+                    break
+                page += 1
+        except Exception as e:
+            put(e)
+            return
+        put(_END_OF_LISTING)
+
+    fetcher = threading.Thread(target=fetch_pages, name="griptape-cloud-asset-listing", daemon=True)
+    fetcher.start()
+    try:
+        while True:
+            item = pages.get()
+            if item is _END_OF_LISTING:
+                return
+            if isinstance(item, Exception):
+                raise item
+            for asset in item:
+                if asset.name.startswith(prefix):
+                    yield asset
+    finally:
+        # Stops the fetcher when the consumer breaks out early or the listing fails.
+        stopped.set()
+
+
+class AssetIndex:
+    """In-memory index of a bucket listing, sorted by asset name.
+
+    Prefix queries are answered with a binary search, and glob queries are narrowed to the range
+    matching the glob's literal prefix before being matched.
+    """
+
+    def __init__(self, bucket_id: str, prefix: str, assets: Iterable["AssetDetail"]) -> None:
+        self.bucket_id = bucket_id
+        self.prefix = prefix
+        self.built_at = time.monotonic()
+        self._assets = sorted(assets, key=lambda asset: asset.name)
+        self._names = [asset.name for asset in self._assets]
+
+    def __len__(self) -> int:
+        return len(self._assets)
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.built_at
+
+    def covers(self, prefix: str) -> bool:
+        """Return whether every asset starting with `prefix` is in this index."""
+        return prefix.startswith(self.prefix)
+
+    def query_prefix(self, prefix: str) -> list["AssetDetail"]:
+        start = bisect_left(self._names, prefix)
+        end = start
+        while end < len(self._names) and self._names[end].startswith(prefix):
+            end += 1
+        return self._assets[start:end]
+
+    def query(self, prefix: str = "", pattern: str | None = None) -> list["AssetDetail"]:
+        """Return the assets starting with `prefix` whose names also match the glob `pattern`, if given."""
+        literal_prefix = get_literal_prefix(pattern) if pattern else ""
+        # Scan only the range of the longer of the two prefixes, then check both.
+        scan_prefix = literal_prefix if literal_prefix.startswith(prefix) else prefix
+        return [
+            asset
+            for asset in self.query_prefix(scan_prefix)
+            if asset.name.startswith(prefix) and (not pattern or fnmatchcase(asset.name, pattern))
+        ]
+
+
+class AssetIndexCache:
+    """Process-wide cache of `AssetIndex`es, so repeated queries against a bucket do not re-list it.
+
+    Indexes are dropped when an asset in their bucket is created or deleted through the API mixin,
+    and are not served once older than the age the caller accepts.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _indexes: ClassVar[dict[str, list[AssetIndex]]] = {}
+
+    @classmethod
+    def get(cls, bucket_id: str, prefix: str, max_age: float = DEFAULT_INDEX_MAX_AGE_SECONDS) -> AssetIndex | None:
+        """Return a fresh index covering `prefix`, or None if there is none."""
+        with cls._lock:
+            for index in cls._indexes.get(bucket_id, []):
+                if index.covers(prefix) and index.age <= max_age:
+                    return index
+        return None
+
+    @classmethod
+    def put(cls, index: AssetIndex) -> None:
+        with cls._lock:
+            # A new index replaces the ones it covers.
+            indexes = [
+                existing for existing in cls._indexes.get(index.bucket_id, []) if not index.covers(existing.prefix)
+            ]
+            indexes.append(index)
+            cls._indexes[index.bucket_id] = indexes
+
+    @classmethod
+    def invalidate(cls, bucket_id: str) -> None:
+        with cls._lock:
+            cls._indexes.pop(bucket_id, None)
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._indexes.clear()
+
+
+def get_asset_index(
+    api: "GriptapeCloudApiMixin",
+    bucket_id: str,
+    prefix: str = "",
+    *,
+    max_age: float = DEFAULT_INDEX_MAX_AGE_SECONDS,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch_pages: int = DEFAULT_PREFETCH_PAGES,
+) -> AssetIndex:
+    """Return a cached index covering `prefix`, listing the bucket to build one if there is none.
+
+    Every new listing also brings the local tag index up to date for `prefix`.
+    """
+    index = AssetIndexCache.get(bucket_id, prefix, max_age)
+    if index is not None:
+        logger.debug("Serving listing of bucket %s with prefix %r from the local index", bucket_id, prefix)
+        return index
+
+    index = AssetIndex(
+        bucket_id,
+        prefix,
+        iter_assets(api, bucket_id, prefix, page_size=page_size, prefetch_pages=prefetch_pages),
+    )
+    AssetIndexCache.put(index)
+    logger.info("Indexed %d assets in bucket %s with prefix %r", len(index), bucket_id, prefix)
+    try:
+        refresh_asset_tags(api, bucket_id, prefix, index.query_prefix(prefix))
+    except Exception as e:
+        # A stale tag index must not fail the listing it piggybacks on.
+        logger.warning("Error refreshing asset tags for bucket %s: %s", bucket_id, e)
+    return index
@@ -0,0 +1,267 @@
+import hashlib
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+from griptape_cloud_client.models.assert_url_operation import AssertUrlOperation
+
+from griptape_cloud.assets.asset_transfer import DEFAULT_TRANSFER_TIMEOUT, put_to_presigned_url
+from griptape_cloud.assets.multipart_upload import (
+    DEFAULT_MAX_PART_RETRIES,
+    MIB,
+    MULTIPART_MANIFEST_CONTENT_TYPE,
+    MultipartManifest,
+)
+from griptape_cloud.assets.transfer_integrity import get_md5_etag
+from griptape_cloud.assets.transfer_progress import TransferProgress
+from griptape_cloud.assets.upload_pipeline import prepare_asset_upload
+from griptape_cloud.mixins.griptape_cloud_api_mixin import GriptapeCloudApiMixin
+from griptape_cloud.utils.http_transport import HttpTransport, TransportStream
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+DEFAULT_MAX_CONCURRENT_COPIES = 8
+DEFAULT_PIPE_BUFFER_CHUNKS = 4
+PIPE_CHUNK_SIZE = 1 * MIB
+PIPE_POLL_SECONDS = 0.5
+# Headers of the source object that are carried over to the copy.
+COPIED_HEADERS = ("Content-Type", "Content-Encoding")
+
+_END_OF_STREAM = object()
+
+
+class StreamPipe:
+    """File-like PUT body fed from a streamed GET response through a bounded in-memory buffer.
+
+    A background thread reads the GET body into a queue of at most `buffer_chunks` chunks while
+    the PUT drains it, so the two connections overlap without spooling the object to disk. The
+    body is passed through undecoded and MD5 hashed as it is sent.
+    """
+
+    def __init__(
+        self,
+        response: TransportStream,
+        buffer_chunks: int = DEFAULT_PIPE_BUFFER_CHUNKS,
+        progress: TransferProgress | None = None,
+    ) -> None:
+        content_length = response.headers.get("Content-Length")
+        if content_length is None:
+            response.close()
+            msg = "Cannot stream an object without a Content-Length, presigned PUTs need the body size up front."
+            raise ValueError(msg)
+        self.size = int(content_length)
+        self.bytes_read = 0
+        self.md5 = hashlib.md5(usedforsecurity=False)
+        self._response = response
+        self._progress = progress
+        self._chunks: queue.Queue = queue.Queue(maxsize=max(buffer_chunks, 1))
+        self._pending = memoryview(b"")
+        self._ended = False
+        self._closed = threading.Event()
+        self._filler = threading.Thread(target=self._fill, name="griptape-cloud-stream-pipe", daemon=True)
+        self._filler.start()
+
+    def __len__(self) -> int:
+        return self.size - self.bytes_read
+
+    def read(self, size: int = -1) -> memoryview | bytes:
+        while not self._pending:
+            if self._ended:
+                return b""
+            item = self._chunks.get()
+            if item is _END_OF_STREAM:
+                self._ended = True
+                return b""
+            if isinstance(item, Exception):
+                raise item
+            self._pending = memoryview(item)
+
+        size = len(self._pending) if size < 0 else min(size, len(self._pending))
+        data = self._pending[:size]
+        self._pending = self._pending[size:]
+        self.md5.update(data)
+        self.bytes_read += len(data)
+        if self._progress is not None:
+            self._progress.add(len(data))
+        return data
+
+    def close(self) -> None:
+        self._closed.set()
+        self._response.close()
+
+    def _put(self, item: object) -> bool:
+        while not self._closed.is_set():
+            try:
+                self._chunks.put(item, timeout=PIPE_POLL_SECONDS)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def _fill(self) -> None:
+        try:
+            for chunk in self._response.iter_raw(PIPE_CHUNK_SIZE):
+                if not self._put(chunk):
+                    return
+        except Exception as e:
+            self._put(e)
+            return
+        self._put(_END_OF_STREAM)
+
+
+@dataclass
+class ReplicationResult:
+    replicated: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    unverified: list[str] = field(default_factory=list)
+    bytes_copied: int = 0
+    elapsed_seconds: float = 0.0
+
+    def to_summary(self) -> dict[str, Any]:
+        return {
+            "replicated": len(self.replicated),
+            "failed": len(self.failed),
+            "unverified": len(self.unverified),
+            "bytes": self.bytes_copied,
+            "elapsed_seconds": self.elapsed_seconds,
+            "mb_per_second": self.bytes_copied / MIB / self.elapsed_seconds if self.elapsed_seconds > 0 else None,
+        }
+
+
+class AssetReplicator:
+    """Copies assets from one bucket to another under the same names, without touching local disk.
+
+    Each copy pipes the GET of a presigned source URL into the PUT of a presigned destination URL
+    and is verified by comparing the MD5 of the streamed bytes with the source and destination
+    ETags where they are plain MD5s. Assets stored as multipart manifests are copied part by part,
+    and the manifest is written only after all of its parts. At most `max_concurrency` objects are
+    streamed at the same time.
+    """
+
+    def __init__(
+        self,
+        api: GriptapeCloudApiMixin,
+        source_bucket_id: str,
+        destination_bucket_id: str,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_COPIES,
+        buffer_chunks: int = DEFAULT_PIPE_BUFFER_CHUNKS,
+        max_retries: int = DEFAULT_MAX_PART_RETRIES,
+        verify_checksums: bool = True,
+        progress: TransferProgress | None = None,
+    ) -> None:
+        self.api = api
+        self.source_bucket_id = source_bucket_id
+        self.destination_bucket_id = destination_bucket_id
+        self.max_concurrency = max_concurrency
+        self.buffer_chunks = buffer_chunks
+        self.max_retries = max_retries
+        self.verify_checksums = verify_checksums
+        self.progress = progress
+        self._streams = threading.BoundedSemaphore(max(max_concurrency, 1))
+        self._result_lock = threading.Lock()
+
+    def replicate(self, asset_names: list[str]) -> ReplicationResult:
+        result = ReplicationResult()
+        started_at = time.monotonic()
+        with ThreadPoolExecutor(max_workers=max(self.max_concurrency, 1)) as executor:
+            futures = {
+                executor.submit(self._replicate_asset, asset_name, result): asset_name for asset_name in asset_names
+            }
+            for future in as_completed(futures):
+                asset_name = futures[future]
+                try:
+                    future.result()
+                    result.replicated.append(asset_name)
+                except Exception as e:
+                    logger.error("Error replicating asset %s: %s", asset_name, e)
+                    result.failed[asset_name] = str(e)
+        result.elapsed_seconds = time.monotonic() - started_at
+        logger.info(
+            "Replicated %d of %d assets from bucket %s to bucket %s",
+            len(result.replicated),
+            len(asset_names),
+            self.source_bucket_id,
+            self.destination_bucket_id,
+        )
+        return result
+
+    def _replicate_asset(self, asset_name: str, result: ReplicationResult) -> None:
+        with self._streams:
+            response = self._open_source(asset_name)
+            if response.headers.get("Content-Type") != MULTIPART_MANIFEST_CONTENT_TYPE:
+                self._copy_stream(asset_name, response, result)
+                return
+            with response:
+                manifest_body = response.read()
+
+        # The manifest worker gives up its stream slot before copying parts, so parts can never wait on it.
+        manifest = MultipartManifest.from_json(manifest_body)
+        with ThreadPoolExecutor(max_workers=max(self.max_concurrency, 1)) as executor:
+            for future in [executor.submit(self._copy_part, part.asset_name, result) for part in manifest.parts]:
+                future.result()
+        self._put(asset_name, {"Content-Type": MULTIPART_MANIFEST_CONTENT_TYPE}, lambda: manifest_body)
+
+    def _copy_part(self, asset_name: str, result: ReplicationResult) -> None:
+        with self._streams:
+            self._copy_stream(asset_name, self._open_source(asset_name), result)
+
+    def _open_source(self, asset_name: str) -> TransportStream:
+        url = self.api._get_cached_asset_url(asset_name, self.source_bucket_id, AssertUrlOperation.GET).url
+        response = HttpTransport.stream("GET", url, timeout=DEFAULT_TRANSFER_TIMEOUT)
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError:
+            response.close()
+            raise
+        return response
+
+    def _copy_stream(self, asset_name: str, response: TransportStream, result: ReplicationResult) -> None:
+        headers = {name: response.headers[name] for name in COPIED_HEADERS if name in response.headers}
+        source_md5 = get_md5_etag(response.headers.get("ETag"))
+        pipes: list[StreamPipe] = []
+
+        def open_pipe() -> StreamPipe:
+            # The first attempt streams the response already opened, retries re-open the source.
+            pipe_response = response if not pipes else self._open_source(asset_name)
+            if pipes and self.progress is not None:
+                self.progress.add(-pipes[-1].bytes_read)
+            pipes.append(StreamPipe(pipe_response, self.buffer_chunks, self.progress))
+            return pipes[-1]
+
+        try:
+            put_response = self._put(asset_name, headers, open_pipe)
+        finally:
+            if not pipes:
+                response.close()
+        pipe = pipes[-1]
+        if pipe.bytes_read != pipe.size:
+            msg = f"Copy of asset '{asset_name}' is truncated: sent {pipe.bytes_read} of {pipe.size} bytes."
+            raise ValueError(msg)
+
+        streamed_md5 = pipe.md5.hexdigest()
+        destination_md5 = get_md5_etag(put_response.headers.get("ETag"))
+        if self.verify_checksums:
+            for side, expected_md5 in (("source", source_md5), ("destination", destination_md5)):
+                if expected_md5 is not None and expected_md5 != streamed_md5:
+                    msg = (
+                        f"Checksum mismatch for asset '{asset_name}': "
+                        f"{side} ETag {expected_md5}, copied {streamed_md5}."
+                    )
+                    raise ValueError(msg)
+        with self._result_lock:
+            result.bytes_copied += pipe.bytes_read
+            if not self.verify_checksums or (source_md5 is None and destination_md5 is None):
+                result.unverified.append(asset_name)
+
+    def _put(self, asset_name: str, headers: dict[str, str], body_factory: Any) -> httpx.Response:
+        url_response = prepare_asset_upload(self.api, self.destination_bucket_id, asset_name)
+        put_headers = url_response.headers.to_dict() or {}
+        put_headers.update(headers)
+        return put_to_presigned_url(url_response.url, put_headers, body_factory, max_retries=self.max_retries)
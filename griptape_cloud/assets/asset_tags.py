@@ -0,0 +1,298 @@
+import json
+import logging
+import sqlite3
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
+from enum import StrEnum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from griptape_cloud_client.models.assert_url_operation import AssertUrlOperation
+
+from griptape_cloud.assets.content_hash_index import SQLITE_TIMEOUT_SECONDS
+from griptape_cloud.utils.cache_dir import get_cache_dir
+from griptape_cloud.utils.http_transport import HttpTransport
+
+if TYPE_CHECKING:
+    from griptape_cloud_client.models.asset_detail import AssetDetail
+
+    from griptape_cloud.mixins.griptape_cloud_api_mixin import GriptapeCloudApiMixin
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+ASSET_TAG_INDEX_FILE_NAME = "asset_tags.sqlite3"
+METADATA_SIDECAR_SUFFIX = ".gtmeta.json"
+METADATA_SIDECAR_CONTENT_TYPE = "application/vnd.griptape-cloud.asset-metadata+json"
+DEFAULT_SIDECAR_FETCH_WORKERS = 16
+
+
+class TagMatch(StrEnum):
+    ALL = "all"
+    ANY = "any"
+
+
+@dataclass
+class AssetTags:
+    asset_name: str
+    tags: list[str] = field(default_factory=list)
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    def to_json(self) -> str:
+        return json.dumps({"asset_name": self.asset_name, "tags": self.tags, "metadata": self.metadata})
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> "AssetTags":
+        value = json.loads(data)
+        return cls(value["asset_name"], parse_tags(value.get("tags")), parse_metadata(value.get("metadata")))
+
+
+def get_sidecar_asset_name(asset_name: str) -> str:
+    return f"{asset_name}{METADATA_SIDECAR_SUFFIX}"
+
+
+def is_sidecar_asset_name(asset_name: str) -> bool:
+    return asset_name.endswith(METADATA_SIDECAR_SUFFIX)
+
+
+def get_sidecar_target(sidecar_asset_name: str) -> str:
+    return sidecar_asset_name.removesuffix(METADATA_SIDECAR_SUFFIX)
+
+
+def parse_tags(tags: Any) -> list[str]:
+    """Parse tags from a list or a comma or newline separated string, dropping blanks and duplicates."""
+    if not tags:
+        return []
+    if isinstance(tags, str):
+        tags = tags.replace("\n", ",").split(",")
+    return list(dict.fromkeys(str(tag).strip() for tag in tags if str(tag).strip()))
+
+
+def parse_metadata(metadata: Any) -> dict[str, Any]:
+    """Parse metadata from a dict or a JSON object string."""
+    if not metadata:
+        return {}
+    if isinstance(metadata, str):
+        metadata = json.loads(metadata)
+    if not isinstance(metadata, dict):
+        msg = f"Metadata must be a dict or a JSON object, got {type(metadata).__name__}."
+        raise TypeError(msg)
+    return dict(metadata)
+
+
+class AssetTagIndex:
+    """Local SQLite index from tags to the assets that carry them, and of each asset's metadata.
+
+    Tag lookups are a primary key seek on (bucket, tag), so they resolve without listing the bucket.
+    Uploads record their tags here, and full listings prune assets that no longer exist and report
+    metadata sidecars written by other engines that are not indexed yet.
+    """
+
+    def __init__(self, db_path: str | Path | None = None) -> None:
+        self.db_path = Path(db_path) if db_path is not None else get_cache_dir() / ASSET_TAG_INDEX_FILE_NAME
+        with self._connect() as connection:
+            connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS asset_tags (
+                    bucket_id TEXT NOT NULL,
+                    tag TEXT NOT NULL,
+                    asset_name TEXT NOT NULL,
+                    PRIMARY KEY (bucket_id, tag, asset_name)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS asset_metadata (
+                    bucket_id TEXT NOT NULL,
+                    asset_name TEXT NOT NULL,
+                    tags TEXT NOT NULL,
+                    metadata TEXT NOT NULL,
+                    has_sidecar INTEGER NOT NULL,
+                    sidecar_updated_at TEXT,
+                    recorded_at REAL NOT NULL,
+                    PRIMARY KEY (bucket_id, asset_name)
+                );
+                """
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection that commits on success, rolls back on error and is always closed."""
+        with closing(sqlite3.connect(self.db_path, timeout=SQLITE_TIMEOUT_SECONDS)) as connection, connection:
+            yield connection
+
+    def record(
+        self,
+        bucket_id: str,
+        entries: Iterable[AssetTags],
+        *,
+        has_sidecar: bool = False,
+        sidecar_updated_at: dict[str, str | None] | None = None,
+    ) -> None:
+        """Record the tags and metadata of assets, replacing whatever was recorded for them before."""
+        entries = list(entries)
+        sidecar_updated_at = sidecar_updated_at or {}
+        with self._connect() as connection:
+            connection.executemany(
+                "DELETE FROM asset_tags WHERE bucket_id = ? AND asset_name = ?",
+                [(bucket_id, entry.asset_name) for entry in entries],
+            )
+            connection.executemany(
+                "INSERT OR IGNORE INTO asset_tags (bucket_id, tag, asset_name) VALUES (?, ?, ?)",
+                [(bucket_id, tag, entry.asset_name) for entry in entries for tag in entry.tags],
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO asset_metadata "
+                "(bucket_id, asset_name, tags, metadata, has_sidecar, sidecar_updated_at, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        bucket_id,
+                        entry.asset_name,
+                        json.dumps(entry.tags),
+                        json.dumps(entry.metadata),
+                        int(has_sidecar),
+                        sidecar_updated_at.get(entry.asset_name),
+                        time.time(),
+                    )
+                    for entry in entries
+                ],
+            )
+
+    def find(
+        self, bucket_id: str, tags: Iterable[str], *, match: TagMatch | str = TagMatch.ALL, prefix: str = ""
+    ) -> list[str]:
+        """Return the sorted names of assets carrying all (or any) of `tags` whose name starts with `prefix`."""
+        tags = list(dict.fromkeys(tags))
+        if not tags:
+            return []
+        placeholders = ", ".join("?" for _ in tags)
+        having = f"HAVING COUNT(*) = {len(tags)}" if TagMatch(match) == TagMatch.ALL else ""
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"SELECT asset_name FROM asset_tags WHERE bucket_id = ? AND tag IN ({placeholders}) "  # noqa: S608
+                f"AND substr(asset_name, 1, ?) = ? GROUP BY asset_name {having} ORDER BY asset_name",
+                (bucket_id, *tags, len(prefix), prefix),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def get(self, bucket_id: str, asset_names: Iterable[str]) -> dict[str, AssetTags]:
+        """Return the recorded tags and metadata of each of `asset_names` that has any."""
+        with self._connect() as connection:
+            rows = [
+                row
+                for asset_name in asset_names
+                for row in connection.execute(
+                    "SELECT asset_name, tags, metadata FROM asset_metadata WHERE bucket_id = ? AND asset_name = ?",
+                    (bucket_id, asset_name),
+                )
+            ]
+        return {row[0]: AssetTags(row[0], json.loads(row[1]), json.loads(row[2])) for row in rows}
+
+    def has_sidecar(self, bucket_id: str, asset_name: str) -> bool:
+        """Return whether the asset was recorded with a metadata sidecar."""
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT has_sidecar FROM asset_metadata WHERE bucket_id = ? AND asset_name = ?",
+                (bucket_id, asset_name),
+            ).fetchone()
+        return bool(row and row[0])
+
+    def forget(self, bucket_id: str, asset_names: Iterable[str]) -> None:
+        keys = [(bucket_id, asset_name) for asset_name in asset_names]
+        with self._connect() as connection:
+            connection.executemany("DELETE FROM asset_tags WHERE bucket_id = ? AND asset_name = ?", keys)
+            connection.executemany("DELETE FROM asset_metadata WHERE bucket_id = ? AND asset_name = ?", keys)
+
+    def reconcile_listing(self, bucket_id: str, prefix: str, assets: Iterable["AssetDetail"]) -> dict[str, str | None]:
+        """Update the index from a complete listing of `prefix`, returning the sidecars that need fetching.
+
+        Assets that are no longer listed, or whose sidecar is gone, are forgotten. Sidecars that are
+        not indexed, or changed since they were, are returned mapped to their listed update time.
+        """
+        asset_names = set()
+        sidecars: dict[str, str | None] = {}
+        for asset in assets:
+            if is_sidecar_asset_name(asset.name):
+                updated_at = getattr(asset, "updated_at", None)
+                sidecars[get_sidecar_target(asset.name)] = str(updated_at) if updated_at is not None else None
+            else:
+                asset_names.add(asset.name)
+
+        with self._connect() as connection:
+            indexed = connection.execute(
+                "SELECT asset_name, has_sidecar, sidecar_updated_at FROM asset_metadata "
+                "WHERE bucket_id = ? AND substr(asset_name, 1, ?) = ?",
+                (bucket_id, len(prefix), prefix),
+            ).fetchall()
+        stale = [
+            asset_name
+            for asset_name, has_sidecar, _ in indexed
+            if asset_name not in asset_names or (has_sidecar and asset_name not in sidecars)
+        ]
+        if stale:
+            self.forget(bucket_id, stale)
+            logger.debug("Forgot tags of %d assets no longer in bucket %s", len(stale), bucket_id)
+
+        indexed_sidecars = {asset_name: updated_at for asset_name, has_sidecar, updated_at in indexed if has_sidecar}
+        return {
+            get_sidecar_asset_name(asset_name): updated_at
+            for asset_name, updated_at in sidecars.items()
+            if asset_name in asset_names
+            and (asset_name not in indexed_sidecars or indexed_sidecars[asset_name] != updated_at)
+        }
+
+
+def fetch_sidecars(
+    api: "GriptapeCloudApiMixin",
+    bucket_id: str,
+    sidecar_asset_names: list[str],
+    *,
+    max_workers: int = DEFAULT_SIDECAR_FETCH_WORKERS,
+) -> list[AssetTags]:
+    """Download and parse metadata sidecars concurrently, skipping ones that cannot be read."""
+
+    def fetch(sidecar_asset_name: str) -> AssetTags:
+        url = api._get_cached_asset_url(sidecar_asset_name, bucket_id, AssertUrlOperation.GET).url
+        response = HttpTransport.request("GET", url)
+        response.raise_for_status()
+        asset_tags = AssetTags.from_json(response.content)
+        # The sidecar's own name is authoritative, not the name recorded inside it.
+        asset_tags.asset_name = get_sidecar_target(sidecar_asset_name)
+        return asset_tags
+
+    entries = []
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        futures = {executor.submit(fetch, name): name for name in sidecar_asset_names}
+        for future in as_completed(futures):
+            try:
+                entries.append(future.result())
+            except Exception as e:
+                logger.warning("Skipping unreadable metadata sidecar %s: %s", futures[future], e)
+    return entries
+
+
+def refresh_asset_tags(
+    api: "GriptapeCloudApiMixin",
+    bucket_id: str,
+    prefix: str,
+    assets: Iterable["AssetDetail"],
+    *,
+    index: AssetTagIndex | None = None,
+) -> None:
+    """Bring the tag index up to date with a complete listing of `prefix`, fetching new or changed sidecars."""
+    index = index or AssetTagIndex()
+    pending_sidecars = index.reconcile_listing(bucket_id, prefix, assets)
+    if not pending_sidecars:
+        return
+    entries = fetch_sidecars(api, bucket_id, list(pending_sidecars))
+    index.record(
+        bucket_id,
+        entries,
+        has_sidecar=True,
+        sidecar_updated_at={
+            get_sidecar_target(sidecar_asset_name): updated_at
+            for sidecar_asset_name, updated_at in pending_sidecars.items()
+        },
+    )
+    logger.info("Indexed tags of %d assets in bucket %s from their metadata sidecars", len(entries), bucket_id)
@@ -0,0 +1,145 @@
+import logging
+import mmap
+import os
+import time
+from collections.abc import Callable
+from http import HTTPStatus
+from pathlib import Path
+from typing import IO, Any
+from urllib.parse import urlsplit
+
+import httpx
+
+from griptape_cloud.assets.transfer_integrity import (
+    BAD_DIGEST_ERROR_CODE,
+    CONTENT_MD5_HEADER,
+    UNSIGNED_HEADER_ERROR_MARKERS,
+    ContentMd5Support,
+    IntegrityBodyFactory,
+    IntegrityError,
+)
+from griptape_cloud.utils.http_transport import HttpTransport
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+DEFAULT_TRANSFER_TIMEOUT = 300
+RETRY_BACKOFF_SECONDS = 1.0
+MIN_SERVER_ERROR_STATUS = 500
+
+
+class FileRangeReader:
+    """Read-only file-like view over a byte range of a file, suitable as a streamed request body.
+
+    The range is memory-mapped and read as slices of the mapping, so the upload, and any hashing or
+    compression riding along with it, reads the page cache directly instead of copying into buffers.
+    Without a `length` the range runs to the end of the file.
+    """
+
+    def __init__(self, file_path: str | Path, offset: int = 0, length: int | None = None) -> None:
+        with Path(file_path).open("rb") as file:
+            if length is None:
+                length = os.fstat(file.fileno()).st_size - offset
+            self._map: mmap.mmap | None = None
+            self._view = memoryview(b"")
+            if length > 0:
+                # Mappings must start on an allocation granularity boundary.
+                map_offset = offset - offset % mmap.ALLOCATIONGRANULARITY
+                self._map = mmap.mmap(
+                    file.fileno(), offset - map_offset + length, offset=map_offset, access=mmap.ACCESS_READ
+                )
+                if hasattr(self._map, "madvise"):
+                    self._map.madvise(mmap.MADV_SEQUENTIAL)
+                self._view = memoryview(self._map)[offset - map_offset :]
+        self._position = 0
+
+    def __len__(self) -> int:
+        return len(self._view) - self._position
+
+    def read(self, size: int = -1) -> memoryview:
+        end = len(self._view) if size < 0 else min(self._position + size, len(self._view))
+        data = self._view[self._position : end]
+        self._position = end
+        return data
+
+    def close(self) -> None:
+        self._view.release()
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # A slice handed out by `read` is still referenced, the mapping is released with it.
+                logger.debug("Deferring unmap of a file range that is still referenced")
+            self._map = None
+
+    def __enter__(self) -> "FileRangeReader":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+def _is_retryable(error: httpx.HTTPError | IntegrityError) -> bool:
+    if isinstance(error, IntegrityError):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        # A body corrupted in transit fails its Content-MD5 check, sending it again can succeed.
+        return error.response.status_code >= MIN_SERVER_ERROR_STATUS or BAD_DIGEST_ERROR_CODE in error.response.text
+    return True
+
+
+def _rejected_content_md5(error: httpx.HTTPError, headers: dict[str, Any]) -> bool:
+    """Return whether the store refused the request because of its Content-MD5 header, not its body or URL."""
+    return (
+        CONTENT_MD5_HEADER in headers
+        and isinstance(error, httpx.HTTPStatusError)
+        and error.response.status_code in (HTTPStatus.BAD_REQUEST, HTTPStatus.FORBIDDEN)
+        and BAD_DIGEST_ERROR_CODE not in error.response.text
+        and any(marker in error.response.text for marker in UNSIGNED_HEADER_ERROR_MARKERS)
+    )
+
+
+def put_to_presigned_url(
+    url: str,
+    headers: dict[str, Any],
+    body_factory: Callable[[], IO[bytes] | FileRangeReader | bytes],
+    *,
+    max_retries: int = 0,
+    timeout: float = DEFAULT_TRANSFER_TIMEOUT,
+    verify_integrity: bool = False,
+) -> httpx.Response:
+    """PUT a body to a presigned URL over the shared HTTP transport, retrying connection errors and server errors.
+
+    `body_factory` is called once per attempt so each retry streams the body from the start. With
+    `verify_integrity`, the body is MD5 hashed as it is sent, in-memory bodies carry a Content-MD5
+    header, and an upload whose ETag does not match what was sent is retried and finally raises an
+    `IntegrityError`.
+    """
+    integrity_body_factory = IntegrityBodyFactory(body_factory) if verify_integrity else None
+    attempt = 0
+    while True:
+        body = integrity_body_factory() if integrity_body_factory is not None else body_factory()
+        request_headers = headers
+        content_md5 = integrity_body_factory.content_md5 if integrity_body_factory is not None else None
+        if content_md5 is not None and ContentMd5Support.is_supported(url):
+            request_headers = {**headers, CONTENT_MD5_HEADER: content_md5}
+        try:
+            response = HttpTransport.request("PUT", url, headers=request_headers, content=body, timeout=timeout)
+            response.raise_for_status()
+            if integrity_body_factory is not None and not integrity_body_factory.verify(response.headers.get("ETag")):
+                logger.debug("Upload to %s returned no MD5 ETag, it was not verified", urlsplit(url).path)
+        except (httpx.HTTPError, IntegrityError) as e:
+            if isinstance(e, httpx.HTTPError) and _rejected_content_md5(e, request_headers):
+                # The URL was not signed for the header, send the body again without it.
+                ContentMd5Support.mark_unsupported(url)
+                continue
+            if attempt >= max_retries or not _is_retryable(e):
+                raise
+            attempt += 1
+            logger.warning("Upload attempt %d of %d failed, retrying: %s", attempt, max_retries + 1, e)
+            time.sleep(RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+        else:
+            return response
+        finally:
+            if hasattr(body, "close"):
+                body.close()
@@ -0,0 +1,242 @@
+import logging
+import mimetypes
+from collections.abc import Callable
+from contextlib import nullcontext
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+
+from griptape_cloud_client.models.assert_url_operation import AssertUrlOperation
+
+from griptape_cloud.assets.asset_tags import METADATA_SIDECAR_CONTENT_TYPE, AssetTags, get_sidecar_asset_name
+from griptape_cloud.assets.asset_transfer import FileRangeReader, put_to_presigned_url
+from griptape_cloud.assets.content_encoding import CompressedBodyFactory, ContentEncoding, is_compressed
+from griptape_cloud.assets.content_hash import HashAlgorithm, HashingBodyFactory
+from griptape_cloud.assets.transfer_progress import ProgressBodyFactory, TransferProgress
+from griptape_cloud.assets.upload_pipeline import AssetUploadPipeline, prepare_asset_upload
+from griptape_cloud.mixins.griptape_cloud_api_mixin import GriptapeCloudApiMixin
+from griptape_cloud.utils.http_transport import HttpTransport
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+
+def guess_content_type(file_path: str | Path) -> str:
+    content_type, _ = mimetypes.guess_type(str(file_path))
+    return content_type or DEFAULT_CONTENT_TYPE
+
+
+def put_asset(
+    api: GriptapeCloudApiMixin,
+    bucket_id: str,
+    asset_name: str,
+    content_type: str,
+    body_factory: Callable[[], Any],
+    *,
+    max_retries: int = 0,
+    content_encoding: ContentEncoding | str | None = None,
+    progress: TransferProgress | None = None,
+    pipeline: AssetUploadPipeline | None = None,
+) -> None:
+    """Create an asset, mint a PUT URL for it and upload the body produced by `body_factory`.
+
+    The asset is created and its URL minted concurrently, or ahead of time by `pipeline` when the
+    asset is one of a batch. The upload is verified against the stored object's MD5. With `progress`,
+    bytes sent and the time spent waiting on API calls and in the PUT are recorded in it.
+    """
+    with progress.time_api() if progress is not None else nullcontext():
+        if pipeline is not None:
+            upload_url_response = pipeline.get_upload_url(asset_name)
+        else:
+            upload_url_response = prepare_asset_upload(api, bucket_id, asset_name)
+    headers = upload_url_response.headers.to_dict() or {}
+    headers["Content-Type"] = content_type
+    if is_compressed(content_encoding):
+        headers["Content-Encoding"] = ContentEncoding(content_encoding).value
+    if progress is None:
+        put_to_presigned_url(
+            upload_url_response.url, headers, body_factory, max_retries=max_retries, verify_integrity=True
+        )
+    else:
+        if isinstance(body_factory, CompressedBodyFactory):
+            # The compressed bytes are what gets sent and counted, so the total moves from the uncompressed size.
+            body_factory.compress()
+            progress.add_total(body_factory.compressed_size - body_factory.original_size)
+        with progress.time_transfer():
+            put_to_presigned_url(
+                upload_url_response.url,
+                headers,
+                ProgressBodyFactory(body_factory, progress),
+                max_retries=max_retries,
+                verify_integrity=True,
+            )
+    if pipeline is not None:
+        pipeline.mark_uploaded(asset_name)
+
+
+class MemoryViewReader:
+    """Read-only file-like view over an in-memory buffer that returns slices of it without copying."""
+
+    def __init__(self, buffer: bytes | bytearray | memoryview) -> None:
+        self._view = memoryview(buffer).cast("B")
+        self._position = 0
+
+    def __len__(self) -> int:
+        return len(self._view) - self._position
+
+    def read(self, size: int = -1) -> memoryview:
+        end = len(self._view) if size < 0 else min(self._position + size, len(self._view))
+        data = self._view[self._position : end]
+        self._position = end
+        return data
+
+    def close(self) -> None:
+        pass
+
+
+def get_buffer(value: Any) -> tuple[bytes | bytearray | memoryview, str | None]:
+    """Return the in-memory buffer of a bytes-like value or artifact, and the artifact's MIME type if it has one.
+
+    Artifacts such as ImageArtifact, AudioArtifact and BlobArtifact keep their content in `value`,
+    which is returned as is so it can be streamed without a copy.
+    """
+    if isinstance(value, bytes | bytearray | memoryview):
+        return value, None
+    buffer = getattr(value, "value", None)
+    if not isinstance(buffer, bytes | bytearray | memoryview):
+        msg = f"Cannot upload a {type(value).__name__}, expected bytes or an artifact holding bytes."
+        raise TypeError(msg)
+    try:
+        mime_type = getattr(value, "mime_type", None)
+    except Exception:
+        # Some artifacts derive their MIME type from the content and raise when it is not recognized.
+        mime_type = None
+    return buffer, mime_type if isinstance(mime_type, str) else None
+
+
+def upload_body(
+    api: GriptapeCloudApiMixin,
+    bucket_id: str,
+    asset_name: str,
+    open_body: Callable[[], Any],
+    content_type: str,
+    *,
+    max_retries: int = 0,
+    hash_algorithm: HashAlgorithm | str | None = None,
+    content_encoding: ContentEncoding | str | None = None,
+    compression_level: int | None = None,
+    progress: TransferProgress | None = None,
+    pipeline: AssetUploadPipeline | None = None,
+) -> str | None:
+    """Upload the body opened by `open_body` as an asset, returning its content hash if `hash_algorithm` is set.
+
+    The hash is computed from the same read that streams the body to the PUT, and always covers
+    the uncompressed content when `content_encoding` is set.
+    """
+    hashing_body_factory = HashingBodyFactory(open_body, hash_algorithm) if hash_algorithm is not None else None
+    body_factory = hashing_body_factory or open_body
+
+    if is_compressed(content_encoding):
+        with CompressedBodyFactory(body_factory, content_encoding, compression_level) as compressed_body_factory:
+            put_asset(
+                api,
+                bucket_id,
+                asset_name,
+                content_type,
+                compressed_body_factory,
+                max_retries=max_retries,
+                content_encoding=content_encoding,
+                progress=progress,
+                pipeline=pipeline,
+            )
+        logger.info(
+            "Uploaded asset %s with %s encoding (%d bytes stored for %d bytes)",
+            asset_name,
+            compressed_body_factory.encoding,
+            compressed_body_factory.compressed_size,
+            compressed_body_factory.original_size,
+        )
+    else:
+        put_asset(
+            api,
+            bucket_id,
+            asset_name,
+            content_type,
+            body_factory,
+            max_retries=max_retries,
+            progress=progress,
+            pipeline=pipeline,
+        )
+
+    return hashing_body_factory.content_hash if hashing_body_factory is not None else None
+
+
+def upload_file(
+    api: GriptapeCloudApiMixin,
+    bucket_id: str,
+    asset_name: str,
+    file_path: str | Path,
+    content_type: str,
+    **kwargs: Any,
+) -> str | None:
+    """Upload a memory-mapped file as an asset. Keyword arguments are passed to `upload_body`."""
+
+    def open_file() -> FileRangeReader:
+        return FileRangeReader(file_path)
+
+    return upload_body(api, bucket_id, asset_name, open_file, content_type, **kwargs)
+
+
+def upload_buffer(
+    api: GriptapeCloudApiMixin,
+    bucket_id: str,
+    asset_name: str,
+    buffer: bytes | bytearray | memoryview,
+    content_type: str,
+    **kwargs: Any,
+) -> str | None:
+    """Upload an in-memory buffer as an asset, streaming slices of it without copying or a temp file.
+
+    Keyword arguments are passed to `upload_body`.
+    """
+
+    def open_buffer() -> MemoryViewReader:
+        return MemoryViewReader(buffer)
+
+    return upload_body(api, bucket_id, asset_name, open_buffer, content_type, **kwargs)
+
+
+def upload_metadata_sidecar(api: GriptapeCloudApiMixin, bucket_id: str, asset_tags: AssetTags, **kwargs: Any) -> None:
+    """Store an asset's tags and metadata next to it, so other engines can index them from a listing.
+
+    Keyword arguments are passed to `upload_body`.
+    """
+    upload_buffer(
+        api,
+        bucket_id,
+        get_sidecar_asset_name(asset_tags.asset_name),
+        asset_tags.to_json().encode("utf-8"),
+        METADATA_SIDECAR_CONTENT_TYPE,
+        **kwargs,
+    )
+
+
+def delete_metadata_sidecar(api: GriptapeCloudApiMixin, bucket_id: str, asset_name: str) -> bool:
+    """Delete an asset's metadata sidecar if one is stored, returning whether one was deleted.
+
+    Failures are logged rather than raised, since the asset itself is already stored.
+    """
+    sidecar_asset_name = get_sidecar_asset_name(asset_name)
+    try:
+        url = api._get_cached_asset_url(sidecar_asset_name, bucket_id, AssertUrlOperation.GET, log_errors=False).url
+        with HttpTransport.stream("GET", url, headers={"Range": "bytes=0-0"}) as response:
+            # A missing object can also be reported as 403 Forbidden, so only a success means it exists.
+            if not HTTPStatus.OK <= response.status_code < HTTPStatus.MULTIPLE_CHOICES:
+                return False
+        api._delete_asset(bucket_id, sidecar_asset_name)
+    except Exception as e:
+        logger.warning("Failed to delete the metadata sidecar of asset %s: %s", asset_name, e)
+        return False
+    return True
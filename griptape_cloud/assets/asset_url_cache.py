@@ -0,0 +1,140 @@
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, ClassVar
+from urllib.parse import parse_qs, urlparse
+
+from griptape_cloud_client.types import Unset
+
+if TYPE_CHECKING:
+    from griptape_cloud_client.models.create_asset_url_response_content import CreateAssetUrlResponseContent
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+DEFAULT_URL_TTL_SECONDS = 300.0
+EXPIRY_SAFETY_MARGIN_SECONDS = 60.0
+HOT_KEY_MIN_HITS = 3
+REFRESH_WINDOW_SECONDS = 120.0
+REFRESH_INTERVAL_SECONDS = 15.0
+AMZ_DATE_FORMAT = "%Y%m%dT%H%M%SZ"
+
+AssetUrlKey = tuple[str, str, str]
+
+
+def get_url_expiry(response: "CreateAssetUrlResponseContent") -> float:
+    """Return the epoch time a presigned URL expires, from the response or the URL's signature parameters."""
+    expire_at = getattr(response, "expire_at", None)
+    if isinstance(expire_at, datetime):
+        return expire_at.timestamp()
+    if expire_at is not None and not isinstance(expire_at, Unset):
+        return datetime.fromisoformat(str(expire_at)).timestamp()
+
+    query = parse_qs(urlparse(response.url).query)
+    if "X-Amz-Date" in query and "X-Amz-Expires" in query:
+        signed_at = datetime.strptime(f"{query['X-Amz-Date'][0]}+0000", f"{AMZ_DATE_FORMAT}%z")
+        return signed_at.timestamp() + float(query["X-Amz-Expires"][0])
+    return time.time() + DEFAULT_URL_TTL_SECONDS
+
+
+@dataclass
+class _CacheEntry:
+    response: "CreateAssetUrlResponseContent"
+    expires_at: float
+    create: Callable[[], "CreateAssetUrlResponseContent"]
+    hits: int = 0
+
+
+class AssetUrlCache:
+    """Process-wide cache of presigned asset URLs keyed by bucket, asset name and operation.
+
+    URLs are served until `EXPIRY_SAFETY_MARGIN_SECONDS` before they expire. A background thread
+    re-mints URLs for keys hit at least `HOT_KEY_MIN_HITS` times since their last refresh before they
+    expire, so hot keys never pay for a round trip. A `create` that raises ReferenceError, e.g. through
+    a weak proxy to a collected node, drops its entry instead.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _entries: ClassVar[dict[AssetUrlKey, _CacheEntry]] = {}
+    _refresher: ClassVar[threading.Thread | None] = None
+
+    @classmethod
+    def get_or_create(
+        cls,
+        bucket_id: str,
+        asset_name: str,
+        operation: str,
+        create: Callable[[], "CreateAssetUrlResponseContent"],
+    ) -> "CreateAssetUrlResponseContent":
+        key = (bucket_id, asset_name, str(operation))
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is not None and entry.expires_at - EXPIRY_SAFETY_MARGIN_SECONDS > time.time():
+                entry.hits += 1
+                return entry.response
+
+        response = create()
+        with cls._lock:
+            cls._entries[key] = _CacheEntry(response=response, expires_at=get_url_expiry(response), create=create)
+            cls._ensure_refresher()
+        return response
+
+    @classmethod
+    def invalidate(cls, bucket_id: str, asset_name: str | None = None) -> None:
+        """Drop cached URLs for an asset, or for every asset in the bucket if no name is given."""
+        with cls._lock:
+            for key in list(cls._entries):
+                if key[0] == bucket_id and (asset_name is None or key[1] == asset_name):
+                    del cls._entries[key]
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._entries.clear()
+
+    @classmethod
+    def _ensure_refresher(cls) -> None:
+        if cls._refresher is None or not cls._refresher.is_alive():
+            cls._refresher = threading.Thread(target=cls._refresh_loop, name="griptape-cloud-url-cache", daemon=True)
+            cls._refresher.start()
+
+    @classmethod
+    def _refresh_loop(cls) -> None:
+        while True:
+            time.sleep(REFRESH_INTERVAL_SECONDS)
+            now = time.time()
+            with cls._lock:
+                due = [
+                    (key, entry)
+                    for key, entry in cls._entries.items()
+                    if entry.expires_at - now < REFRESH_WINDOW_SECONDS
+                ]
+                for key, entry in due:
+                    if entry.hits < HOT_KEY_MIN_HITS:
+                        # Cold keys simply expire, hot keys are refreshed below.
+                        if entry.expires_at - EXPIRY_SAFETY_MARGIN_SECONDS <= now:
+                            del cls._entries[key]
+
+            for key, entry in due:
+                if entry.hits < HOT_KEY_MIN_HITS:
+                    continue
+                try:
+                    response = entry.create()
+                except ReferenceError:
+                    # The node that minted the URL was garbage-collected, so nothing will ask for it again.
+                    with cls._lock:
+                        if cls._entries.get(key) is entry:
+                            del cls._entries[key]
+                    continue
+                except Exception as e:
+                    logger.warning("Failed to refresh presigned URL for asset %s: %s", key[1], e)
+                    continue
+                with cls._lock:
+                    # An entry invalidated or replaced during the refresh must not be overwritten.
+                    if cls._entries.get(key) is entry:
+                        cls._entries[key] = _CacheEntry(
+                            response=response, expires_at=get_url_expiry(response), create=entry.create
+                        )
@@ -0,0 +1,405 @@
+import logging
+import sqlite3
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+from griptape_cloud.assets.asset_cache import AssetCache
+from griptape_cloud.assets.asset_download import AssetDownloader
+from griptape_cloud.assets.asset_listing import iter_assets
+from griptape_cloud.assets.asset_upload import guess_content_type, upload_file
+from griptape_cloud.assets.content_hash import HashAlgorithm, hash_file
+from griptape_cloud.assets.multipart_upload import DEFAULT_MAX_PART_RETRIES, MIB, is_internal_asset_name
+from griptape_cloud.assets.upload_directory import DEFAULT_MAX_WORKERS, find_files, matches_patterns
+from griptape_cloud.assets.upload_pipeline import AssetUploadPipeline
+from griptape_cloud.mixins.griptape_cloud_api_mixin import GriptapeCloudApiMixin
+from griptape_cloud.utils.cache_dir import get_cache_dir
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+SYNC_MANIFEST_FILE_NAME = "sync_manifest.sqlite3"
+SQLITE_TIMEOUT_SECONDS = 30.0
+SYNC_HASH_ALGORITHM = HashAlgorithm.SHA256
+
+
+class SyncDirection(StrEnum):
+    LOCAL_TO_CLOUD = "local_to_cloud"
+    CLOUD_TO_LOCAL = "cloud_to_local"
+
+
+@dataclass
+class SyncEntry:
+    """The state of a file and its asset as of the last time they were synced."""
+
+    remote_name: str
+    relative_path: str
+    size: int
+    mtime_ns: int
+    content_hash: str | None = None
+    remote_size: int | None = None
+    remote_updated_at: str | None = None
+
+
+class SyncManifest:
+    """Local SQLite index of synced files, keyed by local directory, bucket and asset name.
+
+    Comparing a file's size and modification time against its entry tells whether it changed
+    without reading it or listing the bucket.
+    """
+
+    def __init__(self, db_path: str | Path | None = None) -> None:
+        self.db_path = Path(db_path) if db_path is not None else get_cache_dir() / SYNC_MANIFEST_FILE_NAME
+        with self._connect() as connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS sync_entries (
+                    local_root TEXT NOT NULL,
+                    bucket_id TEXT NOT NULL,
+                    remote_name TEXT NOT NULL,
+                    relative_path TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    content_hash TEXT,
+                    remote_size INTEGER,
+                    remote_updated_at TEXT,
+                    synced_at REAL NOT NULL,
+                    PRIMARY KEY (local_root, bucket_id, remote_name)
+                )
+                """
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection that commits on success, rolls back on error and is always closed."""
+        with closing(sqlite3.connect(self.db_path, timeout=SQLITE_TIMEOUT_SECONDS)) as connection, connection:
+            yield connection
+
+    def get_entries(self, local_root: str, bucket_id: str, prefix: str = "") -> dict[str, SyncEntry]:
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT remote_name, relative_path, size, mtime_ns, content_hash, remote_size, remote_updated_at "
+                "FROM sync_entries WHERE local_root = ? AND bucket_id = ? AND substr(remote_name, 1, ?) = ?",
+                (local_root, bucket_id, len(prefix), prefix),
+            ).fetchall()
+        return {row[0]: SyncEntry(*row) for row in rows}
+
+    def record(self, local_root: str, bucket_id: str, entries: list[SyncEntry]) -> None:
+        synced_at = time.time()
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO sync_entries (local_root, bucket_id, remote_name, relative_path, size, "
+                "mtime_ns, content_hash, remote_size, remote_updated_at, synced_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        local_root,
+                        bucket_id,
+                        entry.remote_name,
+                        entry.relative_path,
+                        entry.size,
+                        entry.mtime_ns,
+                        entry.content_hash,
+                        entry.remote_size,
+                        entry.remote_updated_at,
+                        synced_at,
+                    )
+                    for entry in entries
+                ],
+            )
+
+    def remove(self, local_root: str, bucket_id: str, remote_names: list[str]) -> None:
+        with self._connect() as connection:
+            connection.executemany(
+                "DELETE FROM sync_entries WHERE local_root = ? AND bucket_id = ? AND remote_name = ?",
+                [(local_root, bucket_id, remote_name) for remote_name in remote_names],
+            )
+
+
+@dataclass
+class SyncResult:
+    direction: SyncDirection
+    transferred: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    unchanged: int = 0
+    bytes_transferred: int = 0
+    seconds: float = 0.0
+    dry_run: bool = False
+
+    def to_summary(self) -> dict[str, Any]:
+        return {
+            "direction": self.direction.value,
+            "dry_run": self.dry_run,
+            "files_transferred": len(self.transferred),
+            "files_deleted": len(self.deleted),
+            "files_failed": len(self.failed),
+            "files_unchanged": self.unchanged,
+            "bytes_transferred": self.bytes_transferred,
+            "seconds": self.seconds,
+            "mb_per_second": self.bytes_transferred / MIB / self.seconds if self.seconds else None,
+        }
+
+
+def _get_remote_version(asset: Any) -> tuple[int | None, str | None]:
+    size = getattr(asset, "size", None)
+    updated_at = getattr(asset, "updated_at", None)
+    return (
+        size if isinstance(size, int) else None,
+        updated_at.isoformat() if isinstance(updated_at, datetime) else None,
+    )
+
+
+class BucketSync:
+    """Mirrors a local directory and a bucket prefix in either direction, transferring only what changed.
+
+    Local to cloud only stats local files and reads the manifest, plus one listing of the prefix
+    when something was uploaded, to record the stored size and version of the new assets. Cloud to
+    local has to list the prefix to see remote changes. Orphan deletion only removes assets or files
+    that a previous sync created and that the current include/exclude patterns still select, never
+    ones it has not seen.
+    """
+
+    def __init__(
+        self,
+        api: GriptapeCloudApiMixin,
+        bucket_id: str,
+        local_root: str | Path,
+        *,
+        prefix: str = "",
+        include_patterns: list[str] | None = None,
+        exclude_patterns: list[str] | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_retries: int = DEFAULT_MAX_PART_RETRIES,
+        delete_orphans: bool = False,
+        dry_run: bool = False,
+        manifest: SyncManifest | None = None,
+        cache: AssetCache | None = None,
+    ) -> None:
+        self.api = api
+        self.bucket_id = bucket_id
+        self.local_root = Path(local_root).resolve()
+        self.prefix = prefix
+        self.include_patterns = include_patterns or []
+        self.exclude_patterns = exclude_patterns or []
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.delete_orphans = delete_orphans
+        self.dry_run = dry_run
+        self.manifest = manifest or SyncManifest()
+        self.cache = cache
+
+    @property
+    def _root_key(self) -> str:
+        return str(self.local_root)
+
+    def sync(self, direction: SyncDirection | str) -> SyncResult:
+        direction = SyncDirection(direction)
+        started_at = time.monotonic()
+        if direction == SyncDirection.LOCAL_TO_CLOUD:
+            result = self._sync_local_to_cloud()
+        else:
+            result = self._sync_cloud_to_local()
+        result.seconds = time.monotonic() - started_at
+        logger.info("Synced %s with bucket %s: %s", self.local_root, self.bucket_id, result.to_summary())
+        return result
+
+    def _sync_local_to_cloud(self) -> SyncResult:
+        result = SyncResult(SyncDirection.LOCAL_TO_CLOUD, dry_run=self.dry_run)
+        entries = self.manifest.get_entries(self._root_key, self.bucket_id, self.prefix)
+        local_names = set()
+        touched_entries = []
+        pending = []
+        for path in find_files(self.local_root, self.include_patterns, self.exclude_patterns):
+            relative_path = path.relative_to(self.local_root).as_posix()
+            remote_name = f"{self.prefix}{relative_path}"
+            local_names.add(remote_name)
+            file_stat = path.stat()
+            entry = entries.get(remote_name)
+            if entry is not None and entry.size == file_stat.st_size:
+                if entry.mtime_ns == file_stat.st_mtime_ns:
+                    result.unchanged += 1
+                    continue
+                if entry.content_hash and hash_file(path, SYNC_HASH_ALGORITHM) == entry.content_hash:
+                    # Touched but identical, record the new mtime so the next sync skips it without hashing.
+                    touched_entries.append(replace(entry, mtime_ns=file_stat.st_mtime_ns))
+                    result.unchanged += 1
+                    continue
+            pending.append(SyncEntry(remote_name, relative_path, file_stat.st_size, file_stat.st_mtime_ns))
+        orphans = (
+            [name for name, entry in entries.items() if name not in local_names and self._is_in_scope(entry)]
+            if self.delete_orphans
+            else []
+        )
+
+        if self.dry_run:
+            result.transferred = [entry.remote_name for entry in pending]
+            result.deleted = orphans
+            return result
+        self.manifest.record(self._root_key, self.bucket_id, touched_entries)
+        pipeline = AssetUploadPipeline(
+            self.api, self.bucket_id, [entry.remote_name for entry in pending], lookahead=self.max_workers
+        )
+
+        def upload(entry: SyncEntry) -> SyncEntry:
+            path = self.local_root / entry.relative_path
+            entry.content_hash = upload_file(
+                self.api,
+                self.bucket_id,
+                entry.remote_name,
+                path,
+                guess_content_type(path),
+                max_retries=self.max_retries,
+                hash_algorithm=SYNC_HASH_ALGORITHM,
+                pipeline=pipeline,
+            )
+            return entry
+
+        # Closing the pipeline deletes assets that were created for uploads that never completed.
+        with pipeline:
+            self._run(upload, pending, result)
+        if result.transferred:
+            try:
+                self._record_remote_versions(result, {entry.remote_name: entry for entry in pending})
+            except Exception as e:
+                # The uploads stand, the next cloud to local sync just cannot skip them by version.
+                logger.warning("Failed to record the stored versions of uploaded assets: %s", e)
+
+        for remote_name in orphans:
+            try:
+                self.api._delete_asset(self.bucket_id, remote_name)
+                self.manifest.remove(self._root_key, self.bucket_id, [remote_name])
+                result.deleted.append(remote_name)
+            except Exception as e:
+                result.failed[remote_name] = str(e)
+        return result
+
+    def _sync_cloud_to_local(self) -> SyncResult:
+        result = SyncResult(SyncDirection.CLOUD_TO_LOCAL, dry_run=self.dry_run)
+        entries = self.manifest.get_entries(self._root_key, self.bucket_id, self.prefix)
+        remote_names = set()
+        pending = []
+        for asset in iter_assets(self.api, self.bucket_id, self.prefix):
+            relative_path = asset.name[len(self.prefix) :]
+            # Multipart parts and metadata sidecars are internal to the assets they back.
+            if not relative_path or is_internal_asset_name(asset.name):
+                continue
+            if not matches_patterns(relative_path, self.include_patterns, self.exclude_patterns):
+                continue
+            path = (self.local_root / relative_path).resolve()
+            if not path.is_relative_to(self.local_root):
+                logger.warning("Skipping asset %s, it would be written outside of %s", asset.name, self.local_root)
+                continue
+            remote_names.add(asset.name)
+            remote_size, remote_updated_at = _get_remote_version(asset)
+            entry = entries.get(asset.name)
+            if (
+                entry is not None
+                and entry.remote_size == remote_size
+                and entry.remote_updated_at == remote_updated_at
+                and self._is_unchanged_locally(entry)
+            ):
+                result.unchanged += 1
+                continue
+            pending.append(
+                SyncEntry(
+                    asset.name,
+                    relative_path,
+                    size=0,
+                    mtime_ns=0,
+                    remote_size=remote_size,
+                    remote_updated_at=remote_updated_at,
+                )
+            )
+        # Only delete local files that are exactly as the last sync left them.
+        orphans = (
+            [
+                name
+                for name, entry in entries.items()
+                if name not in remote_names and self._is_in_scope(entry) and self._is_unchanged_locally(entry)
+            ]
+            if self.delete_orphans
+            else []
+        )
+
+        if self.dry_run:
+            result.transferred = [entry.remote_name for entry in pending]
+            result.deleted = orphans
+            return result
+
+        def download(entry: SyncEntry) -> SyncEntry:
+            path = AssetDownloader(self.api, self.bucket_id, cache=self.cache).download(
+                entry.remote_name, self.local_root / entry.relative_path
+            )
+            file_stat = path.stat()
+            entry.size = file_stat.st_size
+            entry.mtime_ns = file_stat.st_mtime_ns
+            return entry
+
+        self._run(download, pending, result)
+
+        for remote_name in orphans:
+            try:
+                (self.local_root / entries[remote_name].relative_path).unlink(missing_ok=True)
+                self.manifest.remove(self._root_key, self.bucket_id, [remote_name])
+                result.deleted.append(remote_name)
+            except Exception as e:
+                result.failed[remote_name] = str(e)
+        return result
+
+    def _is_in_scope(self, entry: SyncEntry) -> bool:
+        """Whether the current include/exclude patterns select the entry, so its absence on the other side counts."""
+        return matches_patterns(entry.relative_path, self.include_patterns, self.exclude_patterns)
+
+    def _record_remote_versions(self, result: SyncResult, uploaded: dict[str, SyncEntry]) -> None:
+        """Record the stored size and update time of uploaded assets, and fail ones stored at the wrong size.
+
+        A later cloud to local sync compares them against the listing to tell whether an asset changed.
+        """
+        entries = []
+        for asset in iter_assets(self.api, self.bucket_id, self.prefix):
+            entry = uploaded.get(asset.name)
+            if entry is None or asset.name not in result.transferred:
+                continue
+            entry.remote_size, entry.remote_updated_at = _get_remote_version(asset)
+            if entry.remote_size is not None and entry.remote_size != entry.size:
+                msg = f"Stored {entry.remote_size} bytes, expected {entry.size}."
+                logger.error("Error syncing %s: %s", asset.name, msg)
+                result.transferred.remove(asset.name)
+                result.failed[asset.name] = msg
+                result.bytes_transferred -= entry.size
+                # Forgetting the entry makes the next sync upload the file again.
+                self.manifest.remove(self._root_key, self.bucket_id, [asset.name])
+                continue
+            entries.append(entry)
+        self.manifest.record(self._root_key, self.bucket_id, entries)
+
+    def _is_unchanged_locally(self, entry: SyncEntry) -> bool:
+        path = self.local_root / entry.relative_path
+        if not path.is_file():
+            return False
+        file_stat = path.stat()
+        return file_stat.st_size == entry.size and file_stat.st_mtime_ns == entry.mtime_ns
+
+    def _run(self, transfer: Callable[[SyncEntry], SyncEntry], pending: list[SyncEntry], result: SyncResult) -> None:
+        """Transfer entries concurrently, recording each in the manifest as soon as it succeeds."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(transfer, entry): entry for entry in pending}
+            for future in as_completed(futures):
+                remote_name = futures[future].remote_name
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    logger.error("Error syncing %s: %s", remote_name, e)
+                    result.failed[remote_name] = str(e)
+                    continue
+                self.manifest.record(self._root_key, self.bucket_id, [entry])
+                result.transferred.append(remote_name)
+                result.bytes_transferred += entry.size
+        result.transferred.sort()
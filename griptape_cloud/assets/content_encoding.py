@@ -0,0 +1,173 @@
+import logging
+import tempfile
+import zlib
+from collections.abc import Callable
+from enum import StrEnum
+from typing import IO, Any, Protocol
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+COMPRESS_BLOCK_SIZE = 1024 * 1024
+# Compressed bodies up to this size stay in memory, larger ones spill to a temporary file.
+SPOOL_MAX_MEMORY_SIZE = 16 * 1024 * 1024
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+class ContentEncoding(StrEnum):
+    IDENTITY = "identity"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+    @classmethod
+    def _missing_(cls, value: object) -> "ContentEncoding | None":
+        # Content-Encoding values are case-insensitive.
+        if isinstance(value, str):
+            return next((member for member in cls if member.value == value.strip().lower()), None)
+        return None
+
+
+DEFAULT_COMPRESSION_LEVELS = {
+    ContentEncoding.GZIP: 6,
+    ContentEncoding.ZSTD: 3,
+}
+
+
+class Compressor(Protocol):
+    def compress(self, data: bytes, /) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class Decompressor(Protocol):
+    def decompress(self, data: bytes, /) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+def _import_zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        msg = "The 'zstandard' package is required for zstd content encoding. Install it or use gzip."
+        raise ImportError(msg) from e
+    return zstandard
+
+
+def get_content_encoding(encoding: ContentEncoding | str | None) -> ContentEncoding | None:
+    """Return the supported encoding a Content-Encoding value names, or None if it is unset or unsupported."""
+    if not encoding:
+        return None
+    try:
+        return ContentEncoding(encoding)
+    except ValueError:
+        return None
+
+
+def is_supported_encoding(encoding: ContentEncoding | str | None) -> bool:
+    return not encoding or get_content_encoding(encoding) is not None
+
+
+def is_compressed(encoding: ContentEncoding | str | None) -> bool:
+    """Whether `encoding` is a compression this library applies and decodes.
+
+    Unsupported encodings, such as br or deflate set by another client, are not, so downloads
+    pass their stored bytes through undecoded.
+    """
+    content_encoding = get_content_encoding(encoding)
+    return content_encoding is not None and content_encoding != ContentEncoding.IDENTITY
+
+
+def create_compressor(encoding: ContentEncoding | str, level: int | None = None) -> Compressor:
+    encoding = ContentEncoding(encoding)
+    if level is None:
+        level = DEFAULT_COMPRESSION_LEVELS.get(encoding)
+    if encoding == ContentEncoding.GZIP:
+        return zlib.compressobj(level, zlib.DEFLATED, GZIP_WBITS)
+    if encoding == ContentEncoding.ZSTD:
+        return _import_zstandard().ZstdCompressor(level=level).compressobj()
+    msg = f"Unsupported content encoding: {encoding}"
+    raise ValueError(msg)
+
+
+def create_decompressor(encoding: ContentEncoding | str) -> Decompressor:
+    encoding = ContentEncoding(encoding)
+    if encoding == ContentEncoding.GZIP:
+        return zlib.decompressobj(GZIP_WBITS)
+    if encoding == ContentEncoding.ZSTD:
+        return _import_zstandard().ZstdDecompressor().decompressobj()
+    msg = f"Unsupported content encoding: {encoding}"
+    raise ValueError(msg)
+
+
+class _SpoolReader:
+    """Read-only view of a compressed spool. Closing it leaves the spool open for the next attempt."""
+
+    def __init__(self, spool: IO[bytes], size: int) -> None:
+        self._spool = spool
+        self._size = size
+        self._spool.seek(0)
+
+    def __len__(self) -> int:
+        return self._size - self._spool.tell()
+
+    def read(self, size: int = -1) -> bytes:
+        return self._spool.read(size)
+
+    def close(self) -> None:
+        pass
+
+
+class CompressedBodyFactory:
+    """Body factory for `put_to_presigned_url` that compresses the body produced by `open_body`.
+
+    Presigned PUTs need a Content-Length, so the body is compressed block by block into a spool the
+    first time it is requested. Retries replay the spool instead of compressing again.
+    """
+
+    def __init__(self, open_body: Callable[[], Any], encoding: ContentEncoding | str, level: int | None = None) -> None:
+        self._open_body = open_body
+        self.encoding = ContentEncoding(encoding)
+        self.level = level
+        self._spool: IO[bytes] | None = None
+        self.original_size = 0
+        self.compressed_size = 0
+
+    def __call__(self) -> _SpoolReader:
+        self.compress()
+        return _SpoolReader(self._spool, self.compressed_size)
+
+    def compress(self) -> None:
+        """Compress the body now, if it has not been yet, so `original_size` and `compressed_size` are known."""
+        if self._spool is None:
+            self._spool = self._compress()
+
+    def close(self) -> None:
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+
+    def _compress(self) -> IO[bytes]:
+        compressor = create_compressor(self.encoding, self.level)
+        spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY_SIZE)  # noqa: SIM115
+        body = self._open_body()
+        try:
+            while block := body.read(COMPRESS_BLOCK_SIZE):
+                self.original_size += len(block)
+                spool.write(compressor.compress(block))
+            spool.write(compressor.flush())
+        except Exception:
+            spool.close()
+            raise
+        finally:
+            if hasattr(body, "close"):
+                body.close()
+        self.compressed_size = spool.tell()
+        logger.debug("Compressed %d bytes to %d bytes with %s", self.original_size, self.compressed_size, self.encoding)
+        return spool
+
+    def __enter__(self) -> "CompressedBodyFactory":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
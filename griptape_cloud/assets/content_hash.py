@@ -0,0 +1,91 @@
+import hashlib
+import logging
+import os
+from collections.abc import Callable
+from enum import StrEnum
+from pathlib import Path
+from typing import Any, Protocol
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class HashAlgorithm(StrEnum):
+    SHA256 = "sha256"
+    BLAKE3 = "blake3"
+
+
+class Hasher(Protocol):
+    def update(self, data: bytes, /) -> Any: ...
+
+    def hexdigest(self) -> str: ...
+
+
+def create_hasher(algorithm: HashAlgorithm | str) -> Hasher:
+    if HashAlgorithm(algorithm) == HashAlgorithm.BLAKE3:
+        try:
+            from blake3 import blake3
+        except ImportError as e:
+            msg = "The 'blake3' package is required for BLAKE3 content hashes. Install it or use SHA-256."
+            raise ImportError(msg) from e
+        return blake3()
+    return hashlib.sha256()
+
+
+def format_content_hash(algorithm: HashAlgorithm | str, hexdigest: str) -> str:
+    return f"{HashAlgorithm(algorithm).value}:{hexdigest}"
+
+
+def hash_file(path: str | Path, algorithm: HashAlgorithm | str) -> str:
+    hasher = create_hasher(algorithm)
+    with Path(path).open("rb") as file:
+        while block := file.read(HASH_BLOCK_SIZE):
+            hasher.update(block)
+    return format_content_hash(algorithm, hasher.hexdigest())
+
+
+class HashingReader:
+    """File-like wrapper that feeds every byte read through a hasher, so hashing rides along with the upload read."""
+
+    def __init__(self, reader: Any, hasher: Hasher) -> None:
+        self._reader = reader
+        self._hasher = hasher
+
+    def __len__(self) -> int:
+        if hasattr(self._reader, "__len__"):
+            return len(self._reader)
+        return os.fstat(self._reader.fileno()).st_size - self._reader.tell()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._reader.read(size)
+        self._hasher.update(data)
+        return data
+
+    def close(self) -> None:
+        if hasattr(self._reader, "close"):
+            self._reader.close()
+
+
+class HashingBodyFactory:
+    """Body factory for `put_to_presigned_url` that hashes the body as it is streamed.
+
+    Every retry starts a fresh hasher, so `hexdigest` always reflects the last, complete attempt.
+    """
+
+    def __init__(self, open_body: Callable[[], Any], algorithm: HashAlgorithm | str) -> None:
+        self._open_body = open_body
+        self.algorithm = HashAlgorithm(algorithm)
+        self._hasher: Hasher | None = None
+
+    def __call__(self) -> HashingReader:
+        self._hasher = create_hasher(self.algorithm)
+        return HashingReader(self._open_body(), self._hasher)
+
+    @property
+    def content_hash(self) -> str:
+        if self._hasher is None:
+            msg = "The body has not been read yet."
+            raise RuntimeError(msg)
+        return format_content_hash(self.algorithm, self._hasher.hexdigest())
@@ -0,0 +1,113 @@
+import logging
+import sqlite3
+import time
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from griptape_cloud.utils.cache_dir import get_cache_dir
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+CONTENT_HASH_INDEX_FILE_NAME = "content_hashes.sqlite3"
+SQLITE_TIMEOUT_SECONDS = 30.0
+
+
+@dataclass
+class RecordedUpload:
+    content_hash: str
+    etag: str | None
+
+
+class ContentHashIndex:
+    """Local SQLite index of content hashes for uploaded assets and the files they came from.
+
+    File hashes are keyed by path, size and modification time, so an unchanged file's hash is known
+    without reading it. Uploads record the stored object's ETag, so a later upload can confirm the
+    asset was not overwritten or deleted since. SQLite locking makes the index safe to share between
+    engine processes.
+    """
+
+    def __init__(self, db_path: str | Path | None = None) -> None:
+        self.db_path = Path(db_path) if db_path is not None else get_cache_dir() / CONTENT_HASH_INDEX_FILE_NAME
+        with self._connect() as connection:
+            connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS file_hashes (
+                    path TEXT NOT NULL,
+                    algorithm TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    PRIMARY KEY (path, algorithm)
+                );
+                CREATE TABLE IF NOT EXISTS asset_hashes (
+                    bucket_id TEXT NOT NULL,
+                    asset_name TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    uploaded_at REAL NOT NULL,
+                    etag TEXT,
+                    PRIMARY KEY (bucket_id, asset_name)
+                );
+                """
+            )
+            columns = {row[1] for row in connection.execute("PRAGMA table_info(asset_hashes)")}
+            if "etag" not in columns:
+                # Indexes written before ETags were recorded.
+                connection.execute("ALTER TABLE asset_hashes ADD COLUMN etag TEXT")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection that commits on success, rolls back on error and is always closed."""
+        with closing(sqlite3.connect(self.db_path, timeout=SQLITE_TIMEOUT_SECONDS)) as connection, connection:
+            yield connection
+
+    def get_file_hash(self, path: str | Path, size: int, mtime_ns: int, algorithm: str) -> str | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT content_hash FROM file_hashes WHERE path = ? AND algorithm = ? AND size = ? AND mtime_ns = ?",
+                (str(Path(path).resolve()), algorithm, size, mtime_ns),
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_upload(self, bucket_id: str, asset_name: str) -> RecordedUpload | None:
+        """Return the content hash and ETag last recorded for an upload to this asset."""
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT content_hash, etag FROM asset_hashes WHERE bucket_id = ? AND asset_name = ?",
+                (bucket_id, asset_name),
+            ).fetchone()
+        return RecordedUpload(content_hash=row[0], etag=row[1]) if row else None
+
+    def record_upload(
+        self,
+        bucket_id: str,
+        asset_name: str,
+        content_hash: str,
+        *,
+        path: str | Path | None = None,
+        size: int | None = None,
+        mtime_ns: int | None = None,
+        algorithm: str | None = None,
+        etag: str | None = None,
+    ) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO asset_hashes (bucket_id, asset_name, content_hash, uploaded_at, etag) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (bucket_id, asset_name, content_hash, time.time(), etag),
+            )
+            if path is not None and size is not None and mtime_ns is not None and algorithm is not None:
+                connection.execute(
+                    "INSERT OR REPLACE INTO file_hashes (path, algorithm, size, mtime_ns, content_hash) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (str(Path(path).resolve()), algorithm, size, mtime_ns, content_hash),
+                )
+
+    def forget_asset(self, bucket_id: str, asset_name: str) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "DELETE FROM asset_hashes WHERE bucket_id = ? AND asset_name = ?", (bucket_id, asset_name)
+            )
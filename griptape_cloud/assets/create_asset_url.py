@@ -97,6 +97,6 @@ class CreateAssetUrl(BaseGriptapeCloudNode, ControlNode):
         operation = self.get_parameter_value("operation")
 
         if bucket and asset_name:
-            response = self._create_asset_url(asset_name, bucket.bucket_id, AssertUrlOperation(operation))
+            response = self._get_cached_asset_url(asset_name, bucket.bucket_id, AssertUrlOperation(operation))
             self.set_parameter_value("asset_url", response.url)
             self.parameter_output_values["asset_url"] = response.url
@@ -0,0 +1,182 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, cast
+
+from griptape_cloud_client.models.assert_url_operation import AssertUrlOperation
+
+from griptape_cloud.assets.asset_url_cache import AssetUrlCache
+from griptape_cloud.base.base_griptape_cloud_node import BaseGriptapeCloudNode
+from griptape_cloud.utils.rate_limiter import RateLimiter
+from griptape_nodes.exe_types.core_types import Parameter, ParameterGroup, ParameterMode
+from griptape_nodes.exe_types.node_types import AsyncResult, ControlNode
+from griptape_nodes.traits.options import Options
+
+if TYPE_CHECKING:
+    from griptape_cloud_client.models.bucket_detail import BucketDetail
+    from griptape_cloud_client.models.create_asset_url_response_content import CreateAssetUrlResponseContent
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_MAX_REQUESTS_PER_SECOND = 20.0
+
+
+def parse_asset_names(asset_names: Any) -> list[str]:
+    if not asset_names:
+        return []
+    if isinstance(asset_names, str):
+        asset_names = asset_names.replace("\n", ",").split(",")
+    return [str(asset_name).strip() for asset_name in asset_names if str(asset_name).strip()]
+
+
+class CreateAssetUrls(BaseGriptapeCloudNode, ControlNode):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        self.add_parameter(
+            Parameter(
+                name="bucket",
+                input_types=["BucketDetail"],
+                type="BucketDetail",
+                output_type="BucketDetail",
+                default_value=None,
+                tooltip="The bucket to create asset URLs for",
+                allowed_modes={ParameterMode.INPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="asset_names",
+                input_types=["list", "str"],
+                type="list",
+                output_type="list",
+                default_value=None,
+                tooltip="The names of the assets, as a list or a comma or newline separated string",
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="operation",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value=AssertUrlOperation.GET.value,
+                tooltip="The URL operation to perform",
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
+                traits={
+                    Options(
+                        choices=[op.value for op in AssertUrlOperation],
+                    )
+                },
+            )
+        )
+
+        with ParameterGroup(name="Batch") as batch_group:
+            Parameter(
+                name="max_workers",
+                type="int",
+                default_value=DEFAULT_MAX_WORKERS,
+                tooltip="Maximum number of URLs minted at the same time.",
+            )
+
+            Parameter(
+                name="max_requests_per_second",
+                type="float",
+                default_value=DEFAULT_MAX_REQUESTS_PER_SECOND,
+                tooltip="Maximum number of URL requests sent to Griptape Cloud per second (0 for unlimited).",
+            )
+        batch_group.ui_options = {"hide": True}  # Hide the batch group by default.
+        self.add_node_element(batch_group)
+
+        self.add_parameter(
+            Parameter(
+                name="asset_urls",
+                output_type="list",
+                default_value=None,
+                tooltip="The asset URLs, in the same order as the asset names (None for assets that failed)",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="asset_url_map",
+                output_type="dict",
+                default_value=None,
+                tooltip="The asset URLs keyed by asset name",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="failed_assets",
+                output_type="dict",
+                default_value=None,
+                tooltip="Assets whose URL could not be created, mapped to their error",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+    def validate_before_workflow_run(self) -> list[Exception] | None:
+        exceptions = super().validate_before_workflow_run() or []
+
+        try:
+            if not self.get_parameter_value("bucket"):
+                msg = "Bucket is not set. Configure the Node with a valid Griptape Cloud Bucket before running."
+                exceptions.append(ValueError(msg))
+
+            if not parse_asset_names(self.get_parameter_value("asset_names")):
+                msg = "Asset names are not set. Configure the Node with at least one asset name before running."
+                exceptions.append(ValueError(msg))
+
+            cast("BucketDetail", self.get_parameter_value("bucket"))
+
+        except Exception as e:
+            exceptions.append(e)
+
+        return exceptions if exceptions else None
+
+    def _process(self) -> None:
+        bucket = cast("BucketDetail", self.get_parameter_value("bucket"))
+        asset_names = parse_asset_names(self.get_parameter_value("asset_names"))
+        operation = AssertUrlOperation(self.get_parameter_value("operation"))
+        rate_limiter = RateLimiter(self.get_parameter_value("max_requests_per_second"))
+
+        def get_url(asset_name: str) -> str:
+            def create() -> "CreateAssetUrlResponseContent":
+                # Only cache misses reach Griptape Cloud, so only they are rate limited.
+                rate_limiter.acquire()
+                return self._create_asset_url(asset_name, bucket.bucket_id, operation)
+
+            return AssetUrlCache.get_or_create(bucket.bucket_id, asset_name, operation, create).url
+
+        asset_urls: list[str | None] = []
+        failed_assets: dict[str, str] = {}
+        with ThreadPoolExecutor(max_workers=self.get_parameter_value("max_workers")) as executor:
+            for asset_name, future in [(name, executor.submit(get_url, name)) for name in asset_names]:
+                try:
+                    asset_urls.append(future.result())
+                except Exception as e:
+                    logger.error("Error creating asset URL for %s: %s", asset_name, e)
+                    failed_assets[asset_name] = str(e)
+                    asset_urls.append(None)
+
+        logger.info(
+            "Created %d of %d asset URLs for bucket %s",
+            len(asset_names) - len(failed_assets),
+            len(asset_names),
+            bucket.bucket_id,
+        )
+        self.parameter_output_values["asset_urls"] = asset_urls
+        self.parameter_output_values["asset_url_map"] = {
+            asset_name: asset_url for asset_name, asset_url in zip(asset_names, asset_urls, strict=True) if asset_url
+        }
+        self.parameter_output_values["failed_assets"] = failed_assets
+
+    def process(self) -> AsyncResult[None]:
+        yield lambda: self._process()
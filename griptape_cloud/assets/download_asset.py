@@ -0,0 +1,195 @@
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+from griptape_cloud.assets.asset_cache import AssetCache
+from griptape_cloud.assets.asset_download import DEFAULT_CHUNK_SIZE, DEFAULT_MAX_PARALLEL_CHUNKS, AssetDownloader
+from griptape_cloud.assets.multipart_upload import MIB
+from griptape_cloud.assets.transfer_progress import TransferProgress, format_progress
+from griptape_cloud.base.base_griptape_cloud_node import BaseGriptapeCloudNode
+from griptape_nodes.exe_types.core_types import Parameter, ParameterGroup, ParameterMode
+from griptape_nodes.exe_types.node_types import AsyncResult, ControlNode
+
+if TYPE_CHECKING:
+    from griptape_cloud_client.models.bucket_detail import BucketDetail
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+
+class DownloadAsset(BaseGriptapeCloudNode, ControlNode):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        self.add_parameter(
+            Parameter(
+                name="bucket",
+                input_types=["BucketDetail"],
+                type="BucketDetail",
+                output_type="BucketDetail",
+                default_value=None,
+                tooltip="The bucket to download from",
+                allowed_modes={ParameterMode.INPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="asset_name",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value=None,
+                tooltip="The name of the asset",
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="destination_path",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value=None,
+                ui_options={
+                    "clickable_file_browser": True,
+                    "expander": True,
+                    "display_name": "Destination Path",
+                },
+                tooltip="The file path to download the asset to",
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="expected_sha256",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value=None,
+                tooltip="Optional SHA-256 hex digest the downloaded file must match",
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="file_path",
+                type="str",
+                output_type="str",
+                default_value=None,
+                tooltip="The path of the downloaded file",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+        with ParameterGroup(name="Parallel Download") as parallel_group:
+            Parameter(
+                name="chunk_size_mb",
+                type="int",
+                default_value=DEFAULT_CHUNK_SIZE // MIB,
+                tooltip="Size of each byte range (in MB) requested in parallel.",
+            )
+
+            Parameter(
+                name="max_parallel_chunks",
+                type="int",
+                default_value=DEFAULT_MAX_PARALLEL_CHUNKS,
+                tooltip="Maximum number of byte ranges downloaded at the same time.",
+            )
+        parallel_group.ui_options = {"hide": True}  # Hide the parallel download group by default.
+        self.add_node_element(parallel_group)
+
+        with ParameterGroup(name="Progress") as progress_group:
+            Parameter(
+                name="progress",
+                type="str",
+                tooltip="Live download progress: bytes received, throughput and ETA.",
+                ui_options={"multiline": True, "placeholder_text": "Progress"},
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+
+            Parameter(
+                name="transfer_summary",
+                type="dict",
+                default_value=None,
+                tooltip="Bytes received, throughput and the time spent in API calls versus data transfer",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        progress_group.ui_options = {"hide": True}  # Hide the progress group by default.
+        self.add_node_element(progress_group)
+
+        with ParameterGroup(name="Cache") as cache_group:
+            Parameter(
+                name="use_cache",
+                type="bool",
+                default_value=False,
+                tooltip=(
+                    "Serve unchanged assets from the local asset cache and add verified downloads to it. "
+                    "The cache keeps copies on disk up to the GT_CLOUD_ASSET_CACHE_MAX_MB library setting (5 GB)."
+                ),
+            )
+        cache_group.ui_options = {"hide": True}  # Hide the cache group by default.
+        self.add_node_element(cache_group)
+
+    def validate_before_node_run(self) -> list[Exception] | None:
+        exceptions = super().validate_before_node_run() or []
+
+        try:
+            if not self.get_parameter_value("bucket"):
+                msg = "Bucket is not set. Configure the Node with a valid Griptape Cloud Bucket before running."
+                exceptions.append(ValueError(msg))
+
+            if not self.get_parameter_value("asset_name"):
+                msg = "Asset name is not set. Configure the Node with a valid asset name before running."
+                exceptions.append(ValueError(msg))
+
+            if not self.get_parameter_value("destination_path"):
+                msg = "Destination path is not set. Configure the Node with a valid file path before running."
+                exceptions.append(ValueError(msg))
+
+            cast("BucketDetail", self.get_parameter_value("bucket"))
+
+        except Exception as e:
+            exceptions.append(e)
+
+        return exceptions if exceptions else None
+
+    def _process(self) -> None:
+        bucket = cast("BucketDetail", self.get_parameter_value("bucket"))
+        asset_name = self.get_parameter_value("asset_name")
+        destination_path = self.get_parameter_value("destination_path")
+
+        if bucket and asset_name and destination_path:
+            try:
+                progress = TransferProgress("download", on_update=self._report_progress)
+                downloader = AssetDownloader(
+                    self,
+                    bucket.bucket_id,
+                    chunk_size=self.get_parameter_value("chunk_size_mb") * MIB,
+                    max_parallel_chunks=self.get_parameter_value("max_parallel_chunks"),
+                    progress=progress,
+                    cache=AssetCache() if self.get_parameter_value("use_cache") else None,
+                )
+                file_path = downloader.download(
+                    asset_name, Path(destination_path), expected_sha256=self.get_parameter_value("expected_sha256")
+                )
+                transfer_summary = progress.finish()
+                self._report_progress(transfer_summary)
+                self.parameter_output_values["file_path"] = str(file_path)
+                self.parameter_output_values["transfer_summary"] = transfer_summary
+
+            except Exception as e:
+                logger.error("Error downloading asset: %s", e)
+                raise
+
+    def _report_progress(self, snapshot: dict[str, Any]) -> None:
+        # Overwrite rather than append, so the output holds only the latest status.
+        status = format_progress(snapshot)
+        self.set_parameter_value("progress", status)
+        self.parameter_output_values["progress"] = status
+
+    def process(self) -> AsyncResult[None]:
+        yield lambda: self._process()
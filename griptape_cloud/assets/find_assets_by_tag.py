@@ -0,0 +1,150 @@
+import logging
+from typing import TYPE_CHECKING, cast
+
+from griptape_cloud.assets.asset_listing import get_asset_index
+from griptape_cloud.assets.asset_tags import AssetTagIndex, TagMatch, parse_tags
+from griptape_cloud.base.base_griptape_cloud_node import BaseGriptapeCloudNode
+from griptape_nodes.exe_types.core_types import Parameter, ParameterGroup, ParameterMode
+from griptape_nodes.exe_types.node_types import AsyncResult, ControlNode
+from griptape_nodes.traits.options import Options
+
+if TYPE_CHECKING:
+    from griptape_cloud_client.models.bucket_detail import BucketDetail
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+
+class FindAssetsByTag(BaseGriptapeCloudNode, ControlNode):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        self.add_parameter(
+            Parameter(
+                name="bucket",
+                input_types=["BucketDetail"],
+                type="BucketDetail",
+                output_type="BucketDetail",
+                default_value=None,
+                tooltip="The bucket to find assets in",
+                allowed_modes={ParameterMode.INPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="tags",
+                input_types=["list", "str"],
+                type="list",
+                output_type="list",
+                default_value=None,
+                tooltip="The tags to look up, as a list or a comma or newline separated string",
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="match",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value=TagMatch.ALL.value,
+                tooltip="Whether assets must carry all of the tags or any of them",
+                traits={Options(choices=[match.value for match in TagMatch])},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="prefix",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value="",
+                tooltip="Only find assets whose name starts with this prefix",
+            )
+        )
+
+        with ParameterGroup(name="Index") as index_group:
+            Parameter(
+                name="refresh_from_bucket",
+                type="bool",
+                default_value=False,
+                tooltip=(
+                    "List the bucket under the prefix first, picking up tags other engines stored in metadata "
+                    "sidecars and dropping deleted assets."
+                ),
+            )
+        index_group.ui_options = {"hide": True}  # Hide the index group by default.
+        self.add_node_element(index_group)
+
+        self.add_parameter(
+            Parameter(
+                name="asset_names",
+                output_type="list",
+                default_value=None,
+                tooltip="The names of the matching assets, sorted",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="assets_metadata",
+                output_type="dict",
+                default_value=None,
+                tooltip="The matching asset names, mapped to their tags and metadata",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+    def validate_before_node_run(self) -> list[Exception] | None:
+        exceptions = super().validate_before_node_run() or []
+
+        try:
+            if not self.get_parameter_value("bucket"):
+                msg = "Bucket is not set. Configure the Node with a valid Griptape Cloud Bucket before running."
+                exceptions.append(ValueError(msg))
+
+            if not parse_tags(self.get_parameter_value("tags")):
+                msg = "Tags are not set. Configure the Node with at least one tag before running."
+                exceptions.append(ValueError(msg))
+
+            cast("BucketDetail", self.get_parameter_value("bucket"))
+
+        except Exception as e:
+            exceptions.append(e)
+
+        return exceptions if exceptions else None
+
+    def _process(self) -> None:
+        bucket = cast("BucketDetail", self.get_parameter_value("bucket"))
+        tags = parse_tags(self.get_parameter_value("tags"))
+        prefix = self.get_parameter_value("prefix") or ""
+
+        if bucket:
+            try:
+                if self.get_parameter_value("refresh_from_bucket"):
+                    # A fresh listing brings the tag index up to date for the prefix.
+                    get_asset_index(self, bucket.bucket_id, prefix, max_age=0)
+
+                tag_index = AssetTagIndex()
+                asset_names = tag_index.find(
+                    bucket.bucket_id, tags, match=self.get_parameter_value("match"), prefix=prefix
+                )
+                assets_metadata = {
+                    asset_name: {"tags": asset_tags.tags, "metadata": asset_tags.metadata}
+                    for asset_name, asset_tags in tag_index.get(bucket.bucket_id, asset_names).items()
+                }
+                logger.info("Found %d assets tagged %s in bucket %s", len(asset_names), tags, bucket.bucket_id)
+
+                self.parameter_output_values["asset_names"] = asset_names
+                self.parameter_output_values["assets_metadata"] = assets_metadata
+
+            except Exception as e:
+                logger.error("Error finding assets by tag: %s", e)
+                raise
+
+    def process(self) -> AsyncResult[None]:
+        yield lambda: self._process()
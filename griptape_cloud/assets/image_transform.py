@@ -0,0 +1,170 @@
+import atexit
+import io
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+from typing import Any, ClassVar
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+DEFAULT_IMAGE_QUALITY = 85
+IMAGE_TRANSFORM_WORKERS_ENV_VAR = "GT_CLOUD_IMAGE_TRANSFORM_WORKERS"
+# Raster formats Pillow reads reliably. Vector and animated formats are uploaded untouched.
+TRANSFORMABLE_CONTENT_TYPES = frozenset(
+    {"image/png", "image/jpeg", "image/webp", "image/bmp", "image/tiff", "image/avif"}
+)
+
+
+class ImageFormat(StrEnum):
+    ORIGINAL = "original"
+    WEBP = "webp"
+    AVIF = "avif"
+    JPEG = "jpeg"
+
+
+IMAGE_FORMAT_CONTENT_TYPES = {
+    ImageFormat.WEBP: "image/webp",
+    ImageFormat.AVIF: "image/avif",
+    ImageFormat.JPEG: "image/jpeg",
+}
+
+
+@dataclass(frozen=True)
+class ImageTransform:
+    """Resize and transcode settings applied to images before they are uploaded."""
+
+    max_dimension: int | None = None
+    output_format: ImageFormat | str = ImageFormat.ORIGINAL
+    quality: int = DEFAULT_IMAGE_QUALITY
+
+    @property
+    def is_noop(self) -> bool:
+        return not self.max_dimension and ImageFormat(self.output_format) == ImageFormat.ORIGINAL
+
+    def applies_to(self, content_type: str | None) -> bool:
+        return not self.is_noop and content_type in TRANSFORMABLE_CONTENT_TYPES
+
+
+@dataclass
+class TransformedImage:
+    data: bytes
+    content_type: str
+    original_size: int
+    stored_size: int
+    width: int
+    height: int
+
+
+def _import_pillow() -> Any:
+    try:
+        from PIL import Image
+    except ImportError as e:
+        msg = "The 'Pillow' package is required to transform images on upload. Install it or disable the transform."
+        raise ImportError(msg) from e
+    return Image
+
+
+def _ensure_avif_support(image_module: Any) -> None:
+    image_module.init()
+    if "AVIF" in image_module.SAVE:
+        return
+    try:
+        # Pillow before 11.2 only writes AVIF through this plugin, which registers itself on import.
+        import pillow_avif  # noqa: F401
+    except ImportError as e:
+        msg = "AVIF output requires Pillow 11.2 or newer, or the 'pillow-avif-plugin' package."
+        raise ImportError(msg) from e
+
+
+def transform_image(
+    source: bytes | str | Path, transform: ImageTransform, content_type: str | None = None
+) -> TransformedImage:
+    """Resize an image to fit `transform.max_dimension` and re-encode it in `transform.output_format`.
+
+    Runs in the image transform process pool, so it takes and returns only picklable values. When
+    the image needs no resize and re-encoding would not make it smaller, the original bytes are kept.
+    """
+    image_module = _import_pillow()
+    data = Path(source).read_bytes() if isinstance(source, str | Path) else bytes(source)
+    output_format = ImageFormat(transform.output_format)
+
+    with image_module.open(io.BytesIO(data)) as image:
+        original_format = (image.format or "png").lower()
+        original_content_type = content_type or image_module.MIME.get(original_format.upper(), "image/png")
+        resized = bool(transform.max_dimension) and max(image.size) > transform.max_dimension
+        if resized:
+            image.thumbnail((transform.max_dimension, transform.max_dimension), image_module.Resampling.LANCZOS)
+        elif output_format == ImageFormat.ORIGINAL:
+            return TransformedImage(data, original_content_type, len(data), len(data), *image.size)
+
+        if output_format == ImageFormat.ORIGINAL:
+            save_format = original_format
+            output_content_type = original_content_type
+        else:
+            save_format = output_format.value
+            output_content_type = IMAGE_FORMAT_CONTENT_TYPES[output_format]
+        if save_format == ImageFormat.AVIF:
+            _ensure_avif_support(image_module)
+        if save_format == ImageFormat.JPEG and image.mode not in ("RGB", "L"):
+            # JPEG has no alpha channel or palette.
+            image = image.convert("RGB")  # noqa: PLW2901
+
+        buffer = io.BytesIO()
+        image.save(buffer, format=save_format, quality=transform.quality, optimize=True)
+        width, height = image.size
+
+    transformed = buffer.getvalue()
+    if not resized and len(transformed) >= len(data):
+        return TransformedImage(data, original_content_type, len(data), len(data), width, height)
+    return TransformedImage(transformed, output_content_type, len(data), len(transformed), width, height)
+
+
+class ImageTransformPool:
+    """Process-wide pool that runs image transforms on all cores, outside the engine's GIL.
+
+    Workers are spawned rather than forked, since the engine process runs many threads. The pool is
+    shut down when the engine exits, cancelling transforms that have not started.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _executor: ClassVar[ProcessPoolExecutor | None] = None
+
+    @classmethod
+    def submit(
+        cls, source: bytes | str | Path, transform: ImageTransform, content_type: str | None = None
+    ) -> "Future[TransformedImage]":
+        # Paths are sent as strings so the worker reads the file instead of pickling its bytes.
+        source = str(source) if isinstance(source, Path) else source
+        return cls._get_executor().submit(transform_image, source, transform, content_type)
+
+    @classmethod
+    def transform(
+        cls, source: bytes | str | Path, transform: ImageTransform, content_type: str | None = None
+    ) -> TransformedImage:
+        return cls.submit(source, transform, content_type).result()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        with cls._lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=False, cancel_futures=True)
+                cls._executor = None
+
+    @classmethod
+    def _get_executor(cls) -> ProcessPoolExecutor:
+        with cls._lock:
+            if cls._executor is None:
+                max_workers = int(os.getenv(IMAGE_TRANSFORM_WORKERS_ENV_VAR, str(os.cpu_count() or 1)))
+                cls._executor = ProcessPoolExecutor(
+                    max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return cls._executor
+
+
+atexit.register(ImageTransformPool.shutdown)
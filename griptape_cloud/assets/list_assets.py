@@ -0,0 +1,186 @@
+import logging
+from fnmatch import fnmatchcase
+from typing import TYPE_CHECKING, cast
+
+from griptape_cloud.assets.asset_listing import (
+    DEFAULT_INDEX_MAX_AGE_SECONDS,
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_PREFETCH_PAGES,
+    get_asset_index,
+    iter_assets,
+)
+from griptape_cloud.assets.multipart_upload import is_internal_asset_name
+from griptape_cloud.base.base_griptape_cloud_node import BaseGriptapeCloudNode
+from griptape_nodes.exe_types.core_types import Parameter, ParameterGroup, ParameterMode
+from griptape_nodes.exe_types.node_types import AsyncResult, ControlNode
+
+if TYPE_CHECKING:
+    from griptape_cloud_client.models.bucket_detail import BucketDetail
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+
+class ListAssets(BaseGriptapeCloudNode, ControlNode):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        self.add_parameter(
+            Parameter(
+                name="bucket",
+                input_types=["BucketDetail"],
+                type="BucketDetail",
+                output_type="BucketDetail",
+                default_value=None,
+                tooltip="The bucket to list assets in",
+                allowed_modes={ParameterMode.INPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="prefix",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value="",
+                tooltip="Only list assets whose name starts with this prefix",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="pattern",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value="",
+                tooltip="Optional glob, matched against the full asset name, that listed assets must match",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="max_results",
+                input_types=["int"],
+                type="int",
+                output_type="int",
+                default_value=0,
+                tooltip="Maximum number of assets to return (0 for unlimited)",
+            )
+        )
+
+        with ParameterGroup(name="Listing") as listing_group:
+            Parameter(
+                name="use_index",
+                type="bool",
+                default_value=True,
+                tooltip=(
+                    "Answer repeated queries from an in-memory index of the listing instead of re-listing the bucket."
+                ),
+            )
+
+            Parameter(
+                name="index_max_age_seconds",
+                type="float",
+                default_value=DEFAULT_INDEX_MAX_AGE_SECONDS,
+                tooltip="Re-list the bucket once the index is older than this.",
+            )
+
+            Parameter(
+                name="page_size",
+                type="int",
+                default_value=DEFAULT_PAGE_SIZE,
+                tooltip="Number of assets requested per page.",
+            )
+
+            Parameter(
+                name="prefetch_pages",
+                type="int",
+                default_value=DEFAULT_PREFETCH_PAGES,
+                tooltip="Number of pages fetched ahead while earlier pages are processed.",
+            )
+        listing_group.ui_options = {"hide": True}  # Hide the listing group by default.
+        self.add_node_element(listing_group)
+
+        self.add_parameter(
+            Parameter(
+                name="assets",
+                output_type="list",
+                default_value=None,
+                tooltip="The matching assets, sorted by name",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="asset_names",
+                output_type="list",
+                default_value=None,
+                tooltip="The names of the matching assets, sorted",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+    def validate_before_node_run(self) -> list[Exception] | None:
+        exceptions = super().validate_before_node_run() or []
+
+        try:
+            if not self.get_parameter_value("bucket"):
+                msg = "Bucket is not set. Configure the Node with a valid Griptape Cloud Bucket before running."
+                exceptions.append(ValueError(msg))
+
+            cast("BucketDetail", self.get_parameter_value("bucket"))
+
+        except Exception as e:
+            exceptions.append(e)
+
+        return exceptions if exceptions else None
+
+    def _process(self) -> None:
+        bucket = cast("BucketDetail", self.get_parameter_value("bucket"))
+        prefix = self.get_parameter_value("prefix") or ""
+        pattern = self.get_parameter_value("pattern") or None
+        max_results = self.get_parameter_value("max_results") or 0
+        page_size = self.get_parameter_value("page_size")
+        prefetch_pages = self.get_parameter_value("prefetch_pages")
+
+        if bucket:
+            try:
+                if self.get_parameter_value("use_index"):
+                    assets = get_asset_index(
+                        self,
+                        bucket.bucket_id,
+                        prefix,
+                        max_age=self.get_parameter_value("index_max_age_seconds"),
+                        page_size=page_size,
+                        prefetch_pages=prefetch_pages,
+                    ).query(prefix, pattern)
+                    # Multipart parts and metadata sidecars are internal to the assets they back.
+                    assets = [asset for asset in assets if not is_internal_asset_name(asset.name)]
+                    if max_results > 0:
+                        assets = assets[:max_results]
+                else:
+                    assets = []
+                    for asset in iter_assets(
+                        self, bucket.bucket_id, prefix, page_size=page_size, prefetch_pages=prefetch_pages
+                    ):
+                        if is_internal_asset_name(asset.name) or (pattern and not fnmatchcase(asset.name, pattern)):
+                            continue
+                        assets.append(asset)
+                        if 0 < max_results <= len(assets):
+                            # Stops listing, the fetcher does not request further pages.
+                            break
+                    assets.sort(key=lambda asset: asset.name)
+
+                logger.info("Listed %d assets in bucket %s", len(assets), bucket.bucket_id)
+                self.parameter_output_values["assets"] = assets
+                self.parameter_output_values["asset_names"] = [asset.name for asset in assets]
+
+            except Exception as e:
+                logger.error("Error listing assets: %s", e)
+                raise
+
+    def process(self) -> AsyncResult[None]:
+        yield lambda: self._process()
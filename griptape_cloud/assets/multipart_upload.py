@@ -0,0 +1,300 @@
+import json
+import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from griptape_cloud.assets.asset_tags import is_sidecar_asset_name
+from griptape_cloud.assets.asset_transfer import FileRangeReader
+from griptape_cloud.assets.asset_upload import put_asset
+from griptape_cloud.assets.content_encoding import CompressedBodyFactory, ContentEncoding, is_compressed
+from griptape_cloud.assets.content_hash import HashAlgorithm, HashingBodyFactory, create_hasher, format_content_hash
+from griptape_cloud.assets.transfer_progress import TransferProgress
+from griptape_cloud.assets.upload_pipeline import AssetUploadPipeline
+from griptape_cloud.mixins.griptape_cloud_api_mixin import GriptapeCloudApiMixin
+
+if TYPE_CHECKING:
+    from griptape_cloud.assets.upload_checkpoint import UploadCheckpoint, UploadCheckpointStore
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+MIB = 1024 * 1024
+# Multipart assets are stored as a manifest that only this library reassembles, so it is opt-in.
+DEFAULT_MULTIPART_THRESHOLD = 0
+DEFAULT_PART_SIZE = 64 * MIB
+DEFAULT_MAX_PARALLEL_PARTS = 8
+DEFAULT_MAX_PART_RETRIES = 3
+MULTIPART_MANIFEST_CONTENT_TYPE = "application/vnd.griptape-cloud.multipart-manifest+json"
+PART_CONTENT_TYPE = "application/octet-stream"
+PARTS_DIRECTORY_SUFFIX = ".parts"
+
+
+@dataclass
+class MultipartPart:
+    index: int
+    offset: int
+    size: int
+    asset_name: str
+    content_hash: str | None = None
+
+
+@dataclass
+class MultipartManifest:
+    """Describes an asset stored as separately uploaded parts.
+
+    The manifest is stored under the logical asset name with `MULTIPART_MANIFEST_CONTENT_TYPE`,
+    and the parts are stored as sibling assets that readers concatenate in index order. When
+    `content_encoding` is set, each part is compressed independently and `size` is the decoded size.
+    """
+
+    upload_id: str
+    content_type: str
+    size: int
+    part_size: int
+    parts: list[MultipartPart] = field(default_factory=list)
+    content_hash: str | None = None
+    content_encoding: str | None = None
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> "MultipartManifest":
+        manifest = json.loads(data)
+        manifest["parts"] = [MultipartPart(**part) for part in manifest["parts"]]
+        return cls(**manifest)
+
+
+def get_part_asset_name(asset_name: str, upload_id: str, index: int) -> str:
+    return f"{asset_name}{PARTS_DIRECTORY_SUFFIX}/{upload_id}/{index:05d}"
+
+
+def is_part_asset_name(asset_name: str) -> bool:
+    return f"{PARTS_DIRECTORY_SUFFIX}/" in asset_name
+
+
+def is_internal_asset_name(asset_name: str) -> bool:
+    """Return whether an asset only backs another one, as a multipart part or a metadata sidecar."""
+    return is_part_asset_name(asset_name) or is_sidecar_asset_name(asset_name)
+
+
+def delete_part_assets(api: GriptapeCloudApiMixin, bucket_id: str, part_asset_names: list[str]) -> None:
+    """Delete the part assets of an abandoned upload, logging the ones that cannot be deleted."""
+    for part_asset_name in part_asset_names:
+        try:
+            api._delete_asset(bucket_id, part_asset_name)
+        except Exception as e:
+            logger.warning("Failed to delete part asset %s of an abandoned upload: %s", part_asset_name, e)
+
+
+class MultipartUploader:
+    """Uploads a file as parallel, independently retried parts plus a manifest asset.
+
+    Presigned asset URLs only support a single PUT per object, so each part is its own asset and
+    the asset itself holds a JSON manifest, not the file's bytes. Only this library's download,
+    replication and sync code reassembles it; other readers of the asset get the manifest.
+
+    With a `checkpoint_store`, completed parts are recorded as they finish and a later upload of
+    the same, unchanged file to the same asset skips them. Without one, a failed upload deletes
+    the parts it wrote.
+    """
+
+    def __init__(
+        self,
+        api: GriptapeCloudApiMixin,
+        bucket_id: str,
+        *,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_parallel_parts: int = DEFAULT_MAX_PARALLEL_PARTS,
+        max_part_retries: int = DEFAULT_MAX_PART_RETRIES,
+        hash_algorithm: HashAlgorithm | str | None = None,
+        content_encoding: ContentEncoding | str | None = None,
+        compression_level: int | None = None,
+        checkpoint_store: "UploadCheckpointStore | None" = None,
+        progress: TransferProgress | None = None,
+    ) -> None:
+        self.api = api
+        self.bucket_id = bucket_id
+        self.part_size = part_size
+        self.max_parallel_parts = max_parallel_parts
+        self.max_part_retries = max_part_retries
+        self.hash_algorithm = HashAlgorithm(hash_algorithm) if hash_algorithm is not None else None
+        self.content_encoding = ContentEncoding(content_encoding) if is_compressed(content_encoding) else None
+        self.compression_level = compression_level
+        self.checkpoint_store = checkpoint_store
+        self.progress = progress
+
+    def plan(self, asset_name: str, size: int, content_type: str) -> MultipartManifest:
+        upload_id = uuid.uuid4().hex
+        parts = [
+            MultipartPart(
+                index=index,
+                offset=offset,
+                size=min(self.part_size, size - offset),
+                asset_name=get_part_asset_name(asset_name, upload_id, index),
+            )
+            for index, offset in enumerate(range(0, size, self.part_size))
+        ]
+        return MultipartManifest(
+            upload_id=upload_id,
+            content_type=content_type,
+            size=size,
+            part_size=self.part_size,
+            parts=parts,
+            content_encoding=self.content_encoding.value if self.content_encoding is not None else None,
+        )
+
+    def upload_file(self, file_path: str | Path, asset_name: str, content_type: str) -> MultipartManifest:
+        file_stat = Path(file_path).stat()
+        checkpoint = self._load_checkpoint(file_path, asset_name, file_stat.st_size, file_stat.st_mtime_ns)
+        if checkpoint is not None:
+            manifest = checkpoint.manifest
+            manifest.content_type = content_type
+        else:
+            manifest = self.plan(asset_name, file_stat.st_size, content_type)
+            if self.checkpoint_store is not None:
+                checkpoint = self.checkpoint_store.create(
+                    self.bucket_id,
+                    asset_name,
+                    file_path,
+                    file_stat.st_size,
+                    file_stat.st_mtime_ns,
+                    self.hash_algorithm.value if self.hash_algorithm is not None else None,
+                    manifest,
+                )
+
+        completed_parts = set(checkpoint.completed_parts) if checkpoint is not None else set()
+        pending_parts = [part for part in manifest.parts if part.index not in completed_parts]
+        if self.progress is not None:
+            # Parts uploaded by an earlier attempt are not sent again.
+            self.progress.total_bytes = sum(part.size for part in pending_parts)
+        logger.info(
+            "Uploading %s to %s in %d parts of up to %d bytes (%d already uploaded)",
+            file_path,
+            asset_name,
+            len(manifest.parts),
+            manifest.part_size,
+            len(completed_parts),
+        )
+
+        # Parts are created and their URLs minted ahead of their transfer. The manifest asset is only
+        # created once every part is uploaded, so readers never find one whose parts are missing.
+        pipeline = AssetUploadPipeline(
+            self.api, self.bucket_id, [part.asset_name for part in pending_parts], lookahead=self.max_parallel_parts
+        )
+
+        written_parts: list[str] = []
+
+        def upload_part(part: MultipartPart) -> None:
+            self._upload_part(file_path, part, pipeline)
+            written_parts.append(part.asset_name)
+            if checkpoint is not None and self.checkpoint_store is not None:
+                self.checkpoint_store.mark_part_completed(checkpoint, part.index)
+
+        try:
+            # Closing the pipeline deletes parts that were created but never uploaded.
+            with pipeline, ThreadPoolExecutor(max_workers=self.max_parallel_parts) as executor:
+                # Consuming the results re-raises the first failed part once the pool has shut down.
+                list(executor.map(upload_part, pending_parts))
+
+            if self.hash_algorithm is not None:
+                manifest.content_hash = self._combine_part_hashes(manifest.parts)
+
+            put_asset(
+                self.api,
+                self.bucket_id,
+                asset_name,
+                MULTIPART_MANIFEST_CONTENT_TYPE,
+                lambda: manifest.to_json().encode("utf-8"),
+                progress=self.progress,
+            )
+        except Exception:
+            if checkpoint is None:
+                delete_part_assets(self.api, self.bucket_id, written_parts)
+            else:
+                logger.info("Kept the uploaded parts of %s so a re-run can resume the upload", file_path)
+            raise
+        if checkpoint is not None and self.checkpoint_store is not None:
+            self.checkpoint_store.delete(checkpoint)
+        return manifest
+
+    def _load_checkpoint(
+        self, file_path: str | Path, asset_name: str, size: int, mtime_ns: int
+    ) -> "UploadCheckpoint | None":
+        """Return a checkpoint this uploader can resume, discarding one written with different settings."""
+        if self.checkpoint_store is None:
+            return None
+        checkpoint = self.checkpoint_store.load(self.bucket_id, asset_name, file_path, size, mtime_ns)
+        if checkpoint is None:
+            return None
+
+        hash_algorithm = self.hash_algorithm.value if self.hash_algorithm is not None else None
+        content_encoding = self.content_encoding.value if self.content_encoding is not None else None
+        if (
+            checkpoint.manifest.part_size != self.part_size
+            or checkpoint.manifest.content_encoding != content_encoding
+            or checkpoint.hash_algorithm != hash_algorithm
+        ):
+            logger.info("Discarding upload checkpoint for %s, it was written with different settings", file_path)
+            self.checkpoint_store.delete(checkpoint)
+            delete_part_assets(
+                self.api,
+                self.bucket_id,
+                [part.asset_name for part in checkpoint.manifest.parts if part.index in checkpoint.completed_parts],
+            )
+            return None
+
+        logger.info(
+            "Resuming upload %s of %s with %d of %d parts already uploaded",
+            checkpoint.manifest.upload_id,
+            file_path,
+            len(checkpoint.completed_parts),
+            len(checkpoint.manifest.parts),
+        )
+        return checkpoint
+
+    def _upload_part(self, file_path: str | Path, part: MultipartPart, pipeline: AssetUploadPipeline) -> None:
+        def open_part() -> FileRangeReader:
+            return FileRangeReader(file_path, part.offset, part.size)
+
+        body_factory = open_part if self.hash_algorithm is None else HashingBodyFactory(open_part, self.hash_algorithm)
+        if self.content_encoding is None:
+            put_asset(
+                self.api,
+                self.bucket_id,
+                part.asset_name,
+                PART_CONTENT_TYPE,
+                body_factory,
+                max_retries=self.max_part_retries,
+                progress=self.progress,
+                pipeline=pipeline,
+            )
+        else:
+            with CompressedBodyFactory(body_factory, self.content_encoding, self.compression_level) as compressed:
+                put_asset(
+                    self.api,
+                    self.bucket_id,
+                    part.asset_name,
+                    PART_CONTENT_TYPE,
+                    compressed,
+                    max_retries=self.max_part_retries,
+                    content_encoding=self.content_encoding,
+                    progress=self.progress,
+                    pipeline=pipeline,
+                )
+        if isinstance(body_factory, HashingBodyFactory):
+            part.content_hash = body_factory.content_hash
+        logger.debug("Uploaded part %d (%d bytes) to %s", part.index, part.size, part.asset_name)
+
+    def _combine_part_hashes(self, parts: list[MultipartPart]) -> str:
+        """Hash the concatenated part digests, suffixed with the part count like an S3 multipart ETag.
+
+        Parts are hashed in parallel as they stream, so a single whole-file digest is not available.
+        """
+        hasher = create_hasher(self.hash_algorithm)
+        for part in parts:
+            hasher.update(bytes.fromhex(str(part.content_hash).split(":", 1)[1]))
+        return f"{format_content_hash(self.hash_algorithm, hasher.hexdigest())}-{len(parts)}"
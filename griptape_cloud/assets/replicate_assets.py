@@ -0,0 +1,199 @@
+import logging
+from typing import TYPE_CHECKING, cast
+
+from griptape_cloud.assets.asset_listing import iter_assets
+from griptape_cloud.assets.asset_replication import (
+    DEFAULT_MAX_CONCURRENT_COPIES,
+    DEFAULT_PIPE_BUFFER_CHUNKS,
+    AssetReplicator,
+)
+from griptape_cloud.assets.create_asset_urls import parse_asset_names
+from griptape_cloud.assets.multipart_upload import DEFAULT_MAX_PART_RETRIES, is_internal_asset_name
+from griptape_cloud.base.base_griptape_cloud_node import BaseGriptapeCloudNode
+from griptape_nodes.exe_types.core_types import Parameter, ParameterGroup, ParameterMode
+from griptape_nodes.exe_types.node_types import AsyncResult, ControlNode
+
+if TYPE_CHECKING:
+    from griptape_cloud_client.models.bucket_detail import BucketDetail
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+
+class ReplicateAssets(BaseGriptapeCloudNode, ControlNode):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        self.add_parameter(
+            Parameter(
+                name="source_bucket",
+                input_types=["BucketDetail"],
+                type="BucketDetail",
+                output_type="BucketDetail",
+                default_value=None,
+                tooltip="The bucket to copy assets from",
+                allowed_modes={ParameterMode.INPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="destination_bucket",
+                input_types=["BucketDetail"],
+                type="BucketDetail",
+                output_type="BucketDetail",
+                default_value=None,
+                tooltip="The bucket to copy assets to",
+                allowed_modes={ParameterMode.INPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="asset_names",
+                input_types=["list", "str"],
+                type="list",
+                output_type="list",
+                default_value=None,
+                tooltip=(
+                    "The assets to copy, as a list or a comma or newline separated string. "
+                    "Leave empty to copy every asset under the prefix."
+                ),
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="prefix",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value="",
+                tooltip="When no asset names are given, copy every asset whose name starts with this prefix",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="verify_checksums",
+                input_types=["bool"],
+                type="bool",
+                output_type="bool",
+                default_value=True,
+                tooltip="Fail copies whose MD5 does not match the source or destination ETag",
+            )
+        )
+
+        with ParameterGroup(name="Batch") as batch_group:
+            Parameter(
+                name="max_concurrency",
+                type="int",
+                default_value=DEFAULT_MAX_CONCURRENT_COPIES,
+                tooltip="Maximum number of assets streamed at the same time.",
+            )
+
+            Parameter(
+                name="buffer_chunks",
+                type="int",
+                default_value=DEFAULT_PIPE_BUFFER_CHUNKS,
+                tooltip="Number of 1 MB chunks buffered in memory between the download and the upload of each asset.",
+            )
+
+            Parameter(
+                name="max_retries",
+                type="int",
+                default_value=DEFAULT_MAX_PART_RETRIES,
+                tooltip="Number of times a failed copy is retried.",
+            )
+        batch_group.ui_options = {"hide": True}  # Hide the batch group by default.
+        self.add_node_element(batch_group)
+
+        self.add_parameter(
+            Parameter(
+                name="replicated",
+                output_type="list",
+                default_value=None,
+                tooltip="Asset names that were copied",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="failed",
+                output_type="dict",
+                default_value=None,
+                tooltip="Asset names that failed to copy, mapped to their error",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="summary",
+                output_type="dict",
+                default_value=None,
+                tooltip="Replicated, failed and unverified counts, bytes, duration and throughput",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+    def validate_before_node_run(self) -> list[Exception] | None:
+        exceptions = super().validate_before_node_run() or []
+
+        try:
+            source_bucket = cast("BucketDetail", self.get_parameter_value("source_bucket"))
+            destination_bucket = cast("BucketDetail", self.get_parameter_value("destination_bucket"))
+            if not source_bucket:
+                msg = "Source bucket is not set. Configure the Node with a valid Griptape Cloud Bucket before running."
+                exceptions.append(ValueError(msg))
+            if not destination_bucket:
+                msg = "Destination bucket is not set. Configure the Node with a valid Griptape Cloud Bucket to copy to."
+                exceptions.append(ValueError(msg))
+            if source_bucket and destination_bucket and source_bucket.bucket_id == destination_bucket.bucket_id:
+                msg = "Source and destination buckets must be different."
+                exceptions.append(ValueError(msg))
+
+        except Exception as e:
+            exceptions.append(e)
+
+        return exceptions if exceptions else None
+
+    def _process(self) -> None:
+        source_bucket = cast("BucketDetail", self.get_parameter_value("source_bucket"))
+        destination_bucket = cast("BucketDetail", self.get_parameter_value("destination_bucket"))
+
+        if source_bucket and destination_bucket:
+            try:
+                asset_names = parse_asset_names(self.get_parameter_value("asset_names"))
+                if not asset_names:
+                    prefix = self.get_parameter_value("prefix") or ""
+                    # Parts are copied along with the manifest that references them, and metadata sidecars
+                    # are internal to the assets they describe.
+                    asset_names = [
+                        asset.name
+                        for asset in iter_assets(self, source_bucket.bucket_id, prefix)
+                        if not is_internal_asset_name(asset.name)
+                    ]
+
+                result = AssetReplicator(
+                    self,
+                    source_bucket.bucket_id,
+                    destination_bucket.bucket_id,
+                    max_concurrency=self.get_parameter_value("max_concurrency"),
+                    buffer_chunks=self.get_parameter_value("buffer_chunks"),
+                    max_retries=self.get_parameter_value("max_retries"),
+                    verify_checksums=self.get_parameter_value("verify_checksums"),
+                ).replicate(asset_names)
+
+                self.parameter_output_values["replicated"] = result.replicated
+                self.parameter_output_values["failed"] = result.failed
+                self.parameter_output_values["summary"] = result.to_summary()
+
+            except Exception as e:
+                logger.error("Error replicating assets: %s", e)
+                raise
+
+    def process(self) -> AsyncResult[None]:
+        yield lambda: self._process()
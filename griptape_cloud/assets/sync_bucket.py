@@ -0,0 +1,254 @@
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+from griptape_cloud.assets.asset_cache import AssetCache
+from griptape_cloud.assets.bucket_sync import BucketSync, SyncDirection
+from griptape_cloud.assets.multipart_upload import DEFAULT_MAX_PART_RETRIES
+from griptape_cloud.assets.upload_directory import DEFAULT_MAX_WORKERS, parse_patterns
+from griptape_cloud.base.base_griptape_cloud_node import BaseGriptapeCloudNode
+from griptape_nodes.exe_types.core_types import Parameter, ParameterMode
+from griptape_nodes.exe_types.node_types import AsyncResult, ControlNode
+from griptape_nodes.traits.options import Options
+
+if TYPE_CHECKING:
+    from griptape_cloud_client.models.bucket_detail import BucketDetail
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+
+class SyncBucket(BaseGriptapeCloudNode, ControlNode):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        self.add_parameter(
+            Parameter(
+                name="bucket",
+                input_types=["BucketDetail"],
+                type="BucketDetail",
+                output_type="BucketDetail",
+                default_value=None,
+                tooltip="The bucket to sync with",
+                allowed_modes={ParameterMode.INPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="directory_path",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value=None,
+                ui_options={
+                    "clickable_file_browser": True,
+                    "expander": True,
+                    "display_name": "Path to Directory",
+                },
+                tooltip="The local directory to sync",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="asset_prefix",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value="",
+                tooltip="Asset name prefix in the bucket that mirrors the directory",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="direction",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value=SyncDirection.LOCAL_TO_CLOUD.value,
+                tooltip="Whether to mirror the directory into the bucket or the bucket into the directory",
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
+                traits={Options(choices=[direction.value for direction in SyncDirection])},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="include_patterns",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value="*",
+                tooltip="Comma or newline separated globs, matched against relative paths, of files to sync",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="exclude_patterns",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value="",
+                tooltip="Comma or newline separated globs, matched against relative paths, of files to skip",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="delete_orphans",
+                input_types=["bool"],
+                type="bool",
+                output_type="bool",
+                default_value=False,
+                tooltip="Delete previously synced files or assets whose source no longer exists",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="dry_run",
+                input_types=["bool"],
+                type="bool",
+                output_type="bool",
+                default_value=False,
+                tooltip="Only report what would be transferred and deleted",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="max_workers",
+                input_types=["int"],
+                type="int",
+                output_type="int",
+                default_value=DEFAULT_MAX_WORKERS,
+                tooltip="Maximum number of files transferred at the same time",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="max_retries",
+                input_types=["int"],
+                type="int",
+                output_type="int",
+                default_value=DEFAULT_MAX_PART_RETRIES,
+                tooltip="Number of times a failed file upload is retried",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="use_cache",
+                input_types=["bool"],
+                type="bool",
+                output_type="bool",
+                default_value=False,
+                tooltip=(
+                    "Serve unchanged assets from the local asset cache and add verified downloads to it. "
+                    "The cache keeps copies on disk up to the GT_CLOUD_ASSET_CACHE_MAX_MB library setting (5 GB)."
+                ),
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="transferred",
+                output_type="list",
+                default_value=None,
+                tooltip="Asset names that were uploaded or downloaded",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="deleted",
+                output_type="list",
+                default_value=None,
+                tooltip="Asset names whose orphaned asset or local file was deleted",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="failed",
+                output_type="dict",
+                default_value=None,
+                tooltip="Asset names that failed to sync, mapped to their error",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="summary",
+                output_type="dict",
+                default_value=None,
+                tooltip="Transferred, deleted, failed and unchanged counts, bytes, duration and throughput",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+    def validate_before_node_run(self) -> list[Exception] | None:
+        exceptions = super().validate_before_node_run() or []
+
+        try:
+            if not self.get_parameter_value("bucket"):
+                msg = "Bucket is not set. Configure the Node with a valid Griptape Cloud Bucket before running."
+                exceptions.append(ValueError(msg))
+
+            directory_path = self.get_parameter_value("directory_path")
+            if not directory_path:
+                msg = "Directory path is not set. Configure the Node with a valid directory before running."
+                exceptions.append(ValueError(msg))
+            elif (
+                self.get_parameter_value("direction") == SyncDirection.LOCAL_TO_CLOUD
+                and not Path(directory_path).is_dir()
+            ):
+                msg = f"Directory does not exist at path: {directory_path}"
+                exceptions.append(FileNotFoundError(msg))
+
+            cast("BucketDetail", self.get_parameter_value("bucket"))
+
+        except Exception as e:
+            exceptions.append(e)
+
+        return exceptions if exceptions else None
+
+    def _process(self) -> None:
+        bucket = cast("BucketDetail", self.get_parameter_value("bucket"))
+        directory_path = self.get_parameter_value("directory_path")
+
+        if bucket and directory_path:
+            try:
+                Path(directory_path).mkdir(parents=True, exist_ok=True)
+                result = BucketSync(
+                    self,
+                    bucket.bucket_id,
+                    directory_path,
+                    prefix=self.get_parameter_value("asset_prefix") or "",
+                    include_patterns=parse_patterns(self.get_parameter_value("include_patterns")),
+                    exclude_patterns=parse_patterns(self.get_parameter_value("exclude_patterns")),
+                    max_workers=self.get_parameter_value("max_workers"),
+                    max_retries=self.get_parameter_value("max_retries"),
+                    delete_orphans=self.get_parameter_value("delete_orphans"),
+                    dry_run=self.get_parameter_value("dry_run"),
+                    cache=AssetCache() if self.get_parameter_value("use_cache") else None,
+                ).sync(self.get_parameter_value("direction"))
+
+                self.parameter_output_values["transferred"] = result.transferred
+                self.parameter_output_values["deleted"] = result.deleted
+                self.parameter_output_values["failed"] = result.failed
+                self.parameter_output_values["summary"] = result.to_summary()
+
+            except Exception as e:
+                logger.error("Error syncing bucket: %s", e)
+                raise
+
+    def process(self) -> AsyncResult[None]:
+        yield lambda: self._process()
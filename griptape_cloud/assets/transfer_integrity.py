@@ -0,0 +1,104 @@
+import base64
+import hashlib
+import logging
+import re
+import threading
+from collections.abc import Callable
+from typing import Any, ClassVar
+from urllib.parse import urlsplit
+
+from griptape_cloud.assets.content_hash import HashingReader
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+MD5_ETAG_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+CONTENT_MD5_HEADER = "Content-MD5"
+# Error code S3 compatible stores return when the body does not match its Content-MD5.
+BAD_DIGEST_ERROR_CODE = "BadDigest"
+# Error codes and messages of stores that refuse a header the presigned URL was not signed with. Other
+# rejections, e.g. of an expired signature, do not concern the Content-MD5 header.
+UNSIGNED_HEADER_ERROR_MARKERS = (
+    "SignatureDoesNotMatch",
+    "HeadersNotSigned",
+    "headers present in the request which were not signed",
+)
+
+
+class IntegrityError(ValueError):
+    """Raised when the stored object does not match the bytes that were sent."""
+
+
+def get_md5_etag(etag: str | None) -> str | None:
+    """Return the MD5 hex digest an ETag holds, or None if it is not a plain MD5 (e.g. multipart or KMS)."""
+    if not etag:
+        return None
+    etag = etag.strip().removeprefix("W/").strip('"').lower()
+    return etag if MD5_ETAG_PATTERN.match(etag) else None
+
+
+def encode_content_md5(digest: bytes) -> str:
+    return base64.b64encode(digest).decode("ascii")
+
+
+class ContentMd5Support:
+    """Process-wide record of the hosts that rejected a presigned PUT because of its Content-MD5 header.
+
+    Stores that sign every request header do not accept one the URL was not signed with, so after
+    a rejection uploads to that host rely on the ETag check alone.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _unsupported_hosts: ClassVar[set[str]] = set()
+
+    @classmethod
+    def is_supported(cls, url: str) -> bool:
+        with cls._lock:
+            return urlsplit(url).netloc not in cls._unsupported_hosts
+
+    @classmethod
+    def mark_unsupported(cls, url: str) -> None:
+        host = urlsplit(url).netloc
+        with cls._lock:
+            cls._unsupported_hosts.add(host)
+        logger.info("%s rejected a Content-MD5 header, verifying uploads to it by ETag only", host)
+
+
+class IntegrityBodyFactory:
+    """Body factory for `put_to_presigned_url` that MD5 hashes each attempt's body as it is sent.
+
+    In-memory bodies are hashed before they are sent so the digest can go out as a Content-MD5
+    header, which the store checks on receipt. Streamed bodies are hashed during the upload read
+    and checked against the stored object's ETag afterwards, so neither adds a pass over the data.
+    """
+
+    def __init__(self, open_body: Callable[[], Any]) -> None:
+        self._open_body = open_body
+        self._md5: Any = None
+        self._md5_known_up_front = False
+
+    def __call__(self) -> Any:
+        body = self._open_body()
+        if isinstance(body, bytes | bytearray | memoryview):
+            self._md5 = hashlib.md5(body, usedforsecurity=False)
+            self._md5_known_up_front = True
+            return body
+        self._md5 = hashlib.md5(usedforsecurity=False)
+        self._md5_known_up_front = False
+        return HashingReader(body, self._md5)
+
+    @property
+    def content_md5(self) -> str | None:
+        """The Content-MD5 header value for the current attempt, if it is known before the body is sent."""
+        return encode_content_md5(self._md5.digest()) if self._md5_known_up_front else None
+
+    def verify(self, etag: str | None) -> bool:
+        """Check the ETag of the stored object against the bytes sent, returning False if it holds no MD5."""
+        stored_md5 = get_md5_etag(etag)
+        if stored_md5 is None:
+            return False
+        sent_md5 = self._md5.hexdigest()
+        if stored_md5 != sent_md5:
+            msg = f"Upload integrity check failed: stored ETag {stored_md5}, sent MD5 {sent_md5}."
+            raise IntegrityError(msg)
+        return True
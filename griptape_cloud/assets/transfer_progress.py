@@ -0,0 +1,182 @@
+import logging
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from griptape_cloud.utils.metrics_sink import MetricsSink
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+MIB = 1024 * 1024
+REPORT_INTERVAL_SECONDS = 1.0
+INSTANTANEOUS_WINDOW_SECONDS = 3.0
+TRANSFER_METRIC_PREFIX = "asset_transfer"
+
+
+class TransferProgress:
+    """Thread-safe byte counter for an upload or download, shared by every part or chunk of the transfer.
+
+    Reports bytes transferred, instantaneous and average MB/s and ETA to `on_update` at most once per
+    `REPORT_INTERVAL_SECONDS`, and separately accumulates time spent in Griptape Cloud API calls and in
+    data transfer. With parallel parts those times are summed across workers, so they can exceed the
+    wall-clock time.
+    """
+
+    def __init__(
+        self,
+        direction: str,
+        total_bytes: int | None = None,
+        on_update: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None:
+        self.direction = direction
+        self.total_bytes = total_bytes
+        self.on_update = on_update
+        self.bytes_transferred = 0
+        self.api_seconds = 0.0
+        self.transfer_seconds = 0.0
+        self.started_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._samples: deque[tuple[float, int]] = deque([(self.started_at, 0)])
+        self._reported_at = 0.0
+
+    def add(self, byte_count: int) -> None:
+        with self._lock:
+            self.bytes_transferred += byte_count
+            now = time.monotonic()
+            self._samples.append((now, self.bytes_transferred))
+            while len(self._samples) > 2 and now - self._samples[0][0] > INSTANTANEOUS_WINDOW_SECONDS:  # noqa: PLR2004
+                self._samples.popleft()
+            if self.on_update is None or now - self._reported_at < REPORT_INTERVAL_SECONDS:
+                return
+            self._reported_at = now
+            snapshot = self._snapshot(now)
+        self.on_update(snapshot)
+
+    def add_total(self, byte_count: int) -> None:
+        """Correct the expected total, e.g. once a compressed body's size is known."""
+        with self._lock:
+            if self.total_bytes is not None:
+                self.total_bytes += byte_count
+
+    @contextmanager
+    def time_api(self) -> Iterator[None]:
+        started_at = time.monotonic()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.api_seconds += time.monotonic() - started_at
+
+    @contextmanager
+    def time_transfer(self) -> Iterator[None]:
+        started_at = time.monotonic()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.transfer_seconds += time.monotonic() - started_at
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return self._snapshot(time.monotonic())
+
+    def finish(self) -> dict[str, Any]:
+        """Return the final summary and record it in the metrics sink."""
+        summary = self.snapshot()
+        prefix = f"{TRANSFER_METRIC_PREFIX}.{self.direction}"
+        MetricsSink.increment(f"{prefix}.bytes", summary["bytes_transferred"])
+        MetricsSink.observe(f"{prefix}.seconds", summary["elapsed_seconds"])
+        MetricsSink.observe(f"{prefix}.api_seconds", summary["api_seconds"])
+        MetricsSink.observe(f"{prefix}.transfer_seconds", summary["transfer_seconds"])
+        if summary["average_mb_per_second"] is not None:
+            MetricsSink.observe(f"{prefix}.mb_per_second", summary["average_mb_per_second"])
+        logger.info("Asset %s finished: %s", self.direction, format_progress(summary))
+        return summary
+
+    def _snapshot(self, now: float) -> dict[str, Any]:
+        elapsed = now - self.started_at
+        window_started_at, window_bytes = self._samples[0]
+        window_seconds = now - window_started_at
+        average_rate = self.bytes_transferred / elapsed if elapsed > 0 else None
+        instantaneous_rate = (self.bytes_transferred - window_bytes) / window_seconds if window_seconds > 0 else None
+        remaining_bytes = max(self.total_bytes - self.bytes_transferred, 0) if self.total_bytes is not None else None
+        return {
+            "bytes_transferred": self.bytes_transferred,
+            "total_bytes": self.total_bytes,
+            "percent": min(100.0, 100.0 * self.bytes_transferred / self.total_bytes) if self.total_bytes else None,
+            "instantaneous_mb_per_second": instantaneous_rate / MIB if instantaneous_rate is not None else None,
+            "average_mb_per_second": average_rate / MIB if average_rate is not None else None,
+            "eta_seconds": remaining_bytes / average_rate if remaining_bytes is not None and average_rate else None,
+            "elapsed_seconds": elapsed,
+            "api_seconds": self.api_seconds,
+            "transfer_seconds": self.transfer_seconds,
+        }
+
+
+def format_progress(snapshot: dict[str, Any]) -> str:
+    parts = [f"{snapshot['bytes_transferred'] / MIB:.1f}"]
+    if snapshot["total_bytes"] is not None:
+        parts[0] += f"/{snapshot['total_bytes'] / MIB:.1f} MB ({snapshot['percent']:.0f}%)"
+    else:
+        parts[0] += " MB"
+    if snapshot["instantaneous_mb_per_second"] is not None:
+        parts.append(f"{snapshot['instantaneous_mb_per_second']:.1f} MB/s now")
+    if snapshot["average_mb_per_second"] is not None:
+        parts.append(f"{snapshot['average_mb_per_second']:.1f} MB/s avg")
+    if snapshot["eta_seconds"] is not None:
+        parts.append(f"ETA {snapshot['eta_seconds']:.0f}s")
+    parts.append(f"API {snapshot['api_seconds']:.1f}s, transfer {snapshot['transfer_seconds']:.1f}s")
+    return ", ".join(parts)
+
+
+class ProgressReader:
+    """File-like wrapper that counts every byte read into a `TransferProgress`."""
+
+    def __init__(self, reader: Any, progress: TransferProgress) -> None:
+        self._reader = reader
+        self._progress = progress
+        self.bytes_read = 0
+
+    def __len__(self) -> int:
+        if hasattr(self._reader, "__len__"):
+            return len(self._reader)
+        return os.fstat(self._reader.fileno()).st_size - self._reader.tell()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._reader.read(size)
+        self.bytes_read += len(data)
+        self._progress.add(len(data))
+        return data
+
+    def close(self) -> None:
+        if hasattr(self._reader, "close"):
+            self._reader.close()
+
+
+class ProgressBodyFactory:
+    """Body factory that counts bytes as they are sent. A retry takes back the bytes of the failed attempt."""
+
+    def __init__(self, open_body: Callable[[], Any], progress: TransferProgress) -> None:
+        self._open_body = open_body
+        self._progress = progress
+        self._last_reader: ProgressReader | None = None
+        self._last_body_size = 0
+
+    def __call__(self) -> Any:
+        sent_bytes = self._last_reader.bytes_read if self._last_reader is not None else self._last_body_size
+        if sent_bytes:
+            self._progress.add(-sent_bytes)
+        body = self._open_body()
+        if isinstance(body, bytes | bytearray | memoryview):
+            # In-memory bodies are sent in one go, so count them up front.
+            self._progress.add(len(body))
+            self._last_reader = None
+            self._last_body_size = len(body)
+            return body
+        self._last_reader = ProgressReader(body, self._progress)
+        return self._last_reader
@@ -1,13 +1,38 @@
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
-import requests
 from griptape_cloud_client.models.assert_url_operation import AssertUrlOperation
 
+from griptape_cloud.assets.asset_download import probe_presigned_url
+from griptape_cloud.assets.asset_tags import AssetTagIndex, AssetTags, parse_metadata, parse_tags
+from griptape_cloud.assets.asset_upload import (
+    DEFAULT_CONTENT_TYPE,
+    delete_metadata_sidecar,
+    get_buffer,
+    guess_content_type,
+    upload_buffer,
+    upload_file,
+    upload_metadata_sidecar,
+)
+from griptape_cloud.assets.content_encoding import ContentEncoding
+from griptape_cloud.assets.content_hash import HashAlgorithm, create_hasher, format_content_hash
+from griptape_cloud.assets.content_hash_index import ContentHashIndex
+from griptape_cloud.assets.image_transform import DEFAULT_IMAGE_QUALITY, ImageFormat, ImageTransform, ImageTransformPool
+from griptape_cloud.assets.multipart_upload import (
+    DEFAULT_MAX_PARALLEL_PARTS,
+    DEFAULT_MAX_PART_RETRIES,
+    DEFAULT_MULTIPART_THRESHOLD,
+    DEFAULT_PART_SIZE,
+    MIB,
+    MultipartUploader,
+)
+from griptape_cloud.assets.transfer_progress import TransferProgress, format_progress
+from griptape_cloud.assets.upload_checkpoint import UploadCheckpointStore
 from griptape_cloud.base.base_griptape_cloud_node import BaseGriptapeCloudNode
-from griptape_nodes.exe_types.core_types import Parameter, ParameterMode
+from griptape_nodes.exe_types.core_types import Parameter, ParameterGroup, ParameterMode
 from griptape_nodes.exe_types.node_types import AsyncResult, ControlNode
+from griptape_nodes.traits.options import Options
 
 if TYPE_CHECKING:
     from griptape_cloud_client.models.bucket_detail import BucketDetail
@@ -48,17 +73,28 @@ class UploadAsset(BaseGriptapeCloudNode, ControlNode):
             )
         )
 
+        self.add_parameter(
+            Parameter(
+                name="data",
+                input_types=["ImageArtifact", "AudioArtifact", "BlobArtifact", "bytes", "memoryview"],
+                type="BlobArtifact",
+                default_value=None,
+                tooltip="In-memory content to upload instead of a file, streamed from its buffer without a temp file",
+                allowed_modes={ParameterMode.INPUT},
+            )
+        )
+
         self.add_parameter(
             Parameter(
                 name="content_type",
                 input_types=["str"],
                 type="str",
                 output_type="str",
-                default_value="application/octet-stream",
+                default_value=DEFAULT_CONTENT_TYPE,
                 ui_options={
                     "display_name": "Content Type",
                 },
-                tooltip="The content type of the asset to upload",
+                tooltip="The content type of the asset to upload. Inferred from artifact data when left as the default",
             )
         )
 
@@ -74,6 +110,199 @@ class UploadAsset(BaseGriptapeCloudNode, ControlNode):
             )
         )
 
+        self.add_parameter(
+            Parameter(
+                name="tags",
+                input_types=["list", "str"],
+                type="list",
+                output_type="list",
+                default_value=None,
+                tooltip="Tags to find the asset by later, as a list or a comma or newline separated string",
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="metadata",
+                input_types=["dict", "str"],
+                type="dict",
+                output_type="dict",
+                default_value=None,
+                tooltip="Arbitrary metadata to record with the asset, as a dict or a JSON object",
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
+            )
+        )
+
+        with ParameterGroup(name="Multipart Upload") as multipart_group:
+            Parameter(
+                name="multipart_threshold_mb",
+                type="int",
+                default_value=DEFAULT_MULTIPART_THRESHOLD // MIB,
+                tooltip=(
+                    "Files at least this large (in MB) are uploaded as parallel parts (0 disables multipart). "
+                    "The asset then holds a manifest that only this library's nodes reassemble."
+                ),
+            )
+
+            Parameter(
+                name="part_size_mb",
+                type="int",
+                default_value=DEFAULT_PART_SIZE // MIB,
+                tooltip="Size of each part (in MB) for multipart uploads.",
+            )
+
+            Parameter(
+                name="max_parallel_parts",
+                type="int",
+                default_value=DEFAULT_MAX_PARALLEL_PARTS,
+                tooltip="Maximum number of parts uploaded at the same time.",
+            )
+
+            Parameter(
+                name="max_part_retries",
+                type="int",
+                default_value=DEFAULT_MAX_PART_RETRIES,
+                tooltip="Number of times a failed part upload is retried.",
+            )
+
+            Parameter(
+                name="resumable",
+                type="bool",
+                default_value=True,
+                tooltip="Checkpoint completed parts so re-running after a failure resumes instead of starting over.",
+            )
+        multipart_group.ui_options = {"hide": True}  # Hide the multipart group by default.
+        self.add_node_element(multipart_group)
+
+        with ParameterGroup(name="Deduplication") as dedup_group:
+            Parameter(
+                name="skip_duplicates",
+                type="bool",
+                default_value=False,
+                tooltip="Hash the file while uploading and skip re-uploading the same content to the same asset.",
+            )
+
+            Parameter(
+                name="hash_algorithm",
+                type="str",
+                default_value=HashAlgorithm.SHA256.value,
+                tooltip="Hash algorithm used to identify duplicate content.",
+                traits={Options(choices=[algorithm.value for algorithm in HashAlgorithm])},
+            )
+
+            Parameter(
+                name="content_hash",
+                type="str",
+                default_value=None,
+                tooltip="The content hash of the uploaded file",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+
+            Parameter(
+                name="upload_skipped",
+                type="bool",
+                default_value=False,
+                tooltip="Whether the upload was skipped because the bucket already holds the same content",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        dedup_group.ui_options = {"hide": True}  # Hide the deduplication group by default.
+        self.add_node_element(dedup_group)
+
+        with ParameterGroup(name="Compression") as compression_group:
+            Parameter(
+                name="content_encoding",
+                type="str",
+                default_value=ContentEncoding.IDENTITY.value,
+                tooltip="Compress the file while uploading and store it with this Content-Encoding.",
+                traits={Options(choices=[encoding.value for encoding in ContentEncoding])},
+            )
+
+            Parameter(
+                name="compression_level",
+                type="int",
+                default_value=None,
+                tooltip="Compression level for the chosen encoding. Leave empty to use the encoding's default.",
+            )
+        compression_group.ui_options = {"hide": True}  # Hide the compression group by default.
+        self.add_node_element(compression_group)
+
+        with ParameterGroup(name="Image Transform") as image_transform_group:
+            Parameter(
+                name="image_max_dimension",
+                type="int",
+                default_value=0,
+                tooltip=(
+                    "Downscale PNG, JPEG, WebP, BMP, TIFF and AVIF images so neither side exceeds this many pixels "
+                    "(0 keeps the original size)."
+                ),
+            )
+
+            Parameter(
+                name="image_format",
+                type="str",
+                default_value=ImageFormat.ORIGINAL.value,
+                tooltip="Re-encode images in this format before uploading. The asset name is kept as given.",
+                traits={Options(choices=[image_format.value for image_format in ImageFormat])},
+            )
+
+            Parameter(
+                name="image_quality",
+                type="int",
+                default_value=DEFAULT_IMAGE_QUALITY,
+                tooltip="Encoder quality (1-100) for JPEG, WebP and AVIF output.",
+            )
+
+            Parameter(
+                name="original_size",
+                type="int",
+                default_value=None,
+                tooltip="Size in bytes of the image before it was transformed",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+
+            Parameter(
+                name="stored_size",
+                type="int",
+                default_value=None,
+                tooltip="Size in bytes of the transformed image that was uploaded",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        image_transform_group.ui_options = {"hide": True}  # Hide the image transform group by default.
+        self.add_node_element(image_transform_group)
+
+        with ParameterGroup(name="Tags") as tags_group:
+            Parameter(
+                name="store_metadata_sidecar",
+                type="bool",
+                default_value=True,
+                tooltip=(
+                    "Also store tags and metadata in a sidecar asset next to the asset, so other engines can "
+                    "index them from a listing."
+                ),
+            )
+        tags_group.ui_options = {"hide": True}  # Hide the tags group by default.
+        self.add_node_element(tags_group)
+
+        with ParameterGroup(name="Progress") as progress_group:
+            Parameter(
+                name="progress",
+                type="str",
+                tooltip="Live upload progress: bytes sent, throughput and ETA.",
+                ui_options={"multiline": True, "placeholder_text": "Progress"},
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+
+            Parameter(
+                name="transfer_summary",
+                type="dict",
+                default_value=None,
+                tooltip="Bytes sent, throughput and the time spent in API calls versus data transfer",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        progress_group.ui_options = {"hide": True}  # Hide the progress group by default.
+        self.add_node_element(progress_group)
+
     def validate_before_node_run(self) -> list[Exception] | None:
         exceptions = super().validate_before_node_run() or []
 
@@ -87,13 +316,14 @@ class UploadAsset(BaseGriptapeCloudNode, ControlNode):
                 exceptions.append(ValueError(msg))
 
             file_path = self.get_parameter_value("file_path")
-            if not file_path:
-                msg = "File path is not set. Configure the Node with a valid file path before running."
+            if not file_path and self.get_parameter_value("data") is None:
+                msg = "File path is not set. Configure the Node with a valid file path or connect data before running."
                 exceptions.append(ValueError(msg))
-            elif not Path(file_path).exists():
+            elif file_path and not Path(file_path).exists():
                 msg = f"File does not exist at path: {file_path}"
                 exceptions.append(FileNotFoundError(msg))
 
+            parse_metadata(self.get_parameter_value("metadata"))
             cast("BucketDetail", self.get_parameter_value("bucket"))
 
         except Exception as e:
@@ -106,22 +336,81 @@ class UploadAsset(BaseGriptapeCloudNode, ControlNode):
         asset_name = self.get_parameter_value("asset_name")
         file_path = self.get_parameter_value("file_path")
         content_type = self.get_parameter_value("content_type")
+        data = self.get_parameter_value("data")
+        self.parameter_output_values["original_size"] = None
+        self.parameter_output_values["stored_size"] = None
 
-        if bucket and asset_name and file_path:
+        if bucket and asset_name and data is not None:
             try:
-                self._create_asset(
-                    asset_name=asset_name,
-                    bucket_id=bucket.bucket_id,
-                )
-                upload_url_response = self._create_asset_url(asset_name, bucket.bucket_id, AssertUrlOperation.PUT)
+                data, content_type = self._transform_image(data, content_type)
+                self._upload_data(bucket.bucket_id, asset_name, data, content_type)
+            except Exception as e:
+                logger.error("Error uploading asset: %s", e)
+                raise
+        elif bucket and asset_name and file_path:
+            try:
+                transformed_data, transformed_content_type = self._transform_image(file_path, content_type)
+                if transformed_data is not file_path:
+                    # The transformed image is in memory, so it is uploaded like connected data.
+                    self._upload_data(bucket.bucket_id, asset_name, transformed_data, transformed_content_type)
+                    return
+
+                file_stat = Path(file_path).stat()
+                hash_algorithm = self.get_parameter_value("hash_algorithm")
+                content_hash_index = ContentHashIndex() if self.get_parameter_value("skip_duplicates") else None
+
+                if content_hash_index is not None:
+                    # Only a previously recorded hash for this unchanged file is used, so no extra read is needed.
+                    known_hash = content_hash_index.get_file_hash(
+                        file_path, file_stat.st_size, file_stat.st_mtime_ns, hash_algorithm
+                    )
+                    if known_hash and self._holds_uploaded_content(
+                        bucket.bucket_id, asset_name, known_hash, content_hash_index
+                    ):
+                        self.parameter_output_values["asset_name"] = asset_name
+                        self.parameter_output_values["content_hash"] = known_hash
+                        self.parameter_output_values["upload_skipped"] = True
+                        logger.info(
+                            "Skipped upload of %s, asset %s in bucket %s already holds the same content",
+                            file_path,
+                            asset_name,
+                            bucket.bucket_id,
+                        )
+                        # The content is unchanged, but the tags and metadata may not be.
+                        self._record_tags(bucket.bucket_id, asset_name)
+                        return
 
-                with Path(file_path).open("rb") as file:
-                    headers = upload_url_response.headers.to_dict() or {}
-                    headers["Content-Type"] = content_type
-                    upload_response = requests.put(upload_url_response.url, data=file, headers=headers, timeout=300)
-                    upload_response.raise_for_status()
+                upload_hash_algorithm = hash_algorithm if content_hash_index is not None else None
+                progress = TransferProgress("upload", file_stat.st_size, on_update=self._report_progress)
+                multipart_threshold_mb = self.get_parameter_value("multipart_threshold_mb")
+                if multipart_threshold_mb and file_stat.st_size >= multipart_threshold_mb * MIB:
+                    content_hash = self._upload_multipart(
+                        bucket.bucket_id, asset_name, file_path, content_type, upload_hash_algorithm, progress
+                    )
+                else:
+                    content_hash = self._upload_single(
+                        bucket.bucket_id, asset_name, file_path, content_type, upload_hash_algorithm, progress
+                    )
+                transfer_summary = progress.finish()
+                self._report_progress(transfer_summary)
+                self.parameter_output_values["transfer_summary"] = transfer_summary
+
+                if content_hash_index is not None and content_hash is not None:
+                    content_hash_index.record_upload(
+                        bucket.bucket_id,
+                        asset_name,
+                        content_hash,
+                        path=file_path,
+                        size=file_stat.st_size,
+                        mtime_ns=file_stat.st_mtime_ns,
+                        algorithm=hash_algorithm,
+                        etag=self._get_stored_etag(bucket.bucket_id, asset_name),
+                    )
 
                 self.parameter_output_values["asset_name"] = asset_name
+                self.parameter_output_values["content_hash"] = content_hash
+                self.parameter_output_values["upload_skipped"] = False
+                self._record_tags(bucket.bucket_id, asset_name)
 
                 logger.info("Successfully uploaded asset %s to bucket %s", asset_name, bucket.bucket_id)
 
@@ -129,5 +418,203 @@ class UploadAsset(BaseGriptapeCloudNode, ControlNode):
                 logger.error("Error uploading asset: %s", e)
                 raise
 
+    def _upload_data(self, bucket_id: str, asset_name: str, data: Any, content_type: str) -> None:
+        buffer, mime_type = get_buffer(data)
+        if mime_type and content_type in (None, "", DEFAULT_CONTENT_TYPE):
+            content_type = mime_type
+        hash_algorithm = self.get_parameter_value("hash_algorithm")
+        content_hash_index = ContentHashIndex() if self.get_parameter_value("skip_duplicates") else None
+
+        content_hash = None
+        if content_hash_index is not None:
+            # The content is already in memory, so hashing it up front costs no I/O.
+            hasher = create_hasher(hash_algorithm)
+            hasher.update(buffer)
+            content_hash = format_content_hash(hash_algorithm, hasher.hexdigest())
+            if self._holds_uploaded_content(bucket_id, asset_name, content_hash, content_hash_index):
+                self.parameter_output_values["asset_name"] = asset_name
+                self.parameter_output_values["content_hash"] = content_hash
+                self.parameter_output_values["upload_skipped"] = True
+                logger.info(
+                    "Skipped upload of in-memory data, asset %s in bucket %s already holds the same content",
+                    asset_name,
+                    bucket_id,
+                )
+                # The content is unchanged, but the tags and metadata may not be.
+                self._record_tags(bucket_id, asset_name)
+                return
+
+        progress = TransferProgress("upload", memoryview(buffer).nbytes, on_update=self._report_progress)
+        upload_buffer(
+            self,
+            bucket_id,
+            asset_name,
+            buffer,
+            content_type,
+            max_retries=self.get_parameter_value("max_part_retries"),
+            content_encoding=self.get_parameter_value("content_encoding"),
+            compression_level=self.get_parameter_value("compression_level"),
+            progress=progress,
+        )
+        transfer_summary = progress.finish()
+        self._report_progress(transfer_summary)
+
+        if content_hash_index is not None and content_hash is not None:
+            content_hash_index.record_upload(
+                bucket_id, asset_name, content_hash, etag=self._get_stored_etag(bucket_id, asset_name)
+            )
+
+        self.parameter_output_values["asset_name"] = asset_name
+        self.parameter_output_values["content_hash"] = content_hash
+        self.parameter_output_values["upload_skipped"] = False
+        self.parameter_output_values["transfer_summary"] = transfer_summary
+        self._record_tags(bucket_id, asset_name)
+        logger.info("Successfully uploaded in-memory data as asset %s to bucket %s", asset_name, bucket_id)
+
+    def _holds_uploaded_content(
+        self, bucket_id: str, asset_name: str, content_hash: str, content_hash_index: ContentHashIndex
+    ) -> bool:
+        """Return whether the asset still holds the content this engine last uploaded to it.
+
+        Only the asset that was asked for counts. The stored object is probed to confirm it still has
+        the ETag recorded at upload, so an asset deleted or overwritten since is uploaded again.
+        """
+        recorded_upload = content_hash_index.get_upload(bucket_id, asset_name)
+        if recorded_upload is None or recorded_upload.content_hash != content_hash or recorded_upload.etag is None:
+            return False
+        if self._get_stored_etag(bucket_id, asset_name) != recorded_upload.etag:
+            logger.info("Asset %s was deleted or overwritten since it was uploaded, uploading it again", asset_name)
+            content_hash_index.forget_asset(bucket_id, asset_name)
+            return False
+        return True
+
+    def _get_stored_etag(self, bucket_id: str, asset_name: str) -> str | None:
+        try:
+            url = self._get_cached_asset_url(asset_name, bucket_id, AssertUrlOperation.GET).url
+            return probe_presigned_url(url).etag
+        except Exception as e:
+            logger.debug("Could not read the stored object of asset %s: %s", asset_name, e)
+            return None
+
+    def _record_tags(self, bucket_id: str, asset_name: str) -> None:
+        """Record the asset's tags and metadata in the local tag index and, if enabled, in a sidecar asset.
+
+        Tags and metadata from an earlier upload of the asset are replaced, so an upload without any
+        clears them, and a sidecar that is no longer wanted is deleted rather than left stale.
+        """
+        asset_tags = AssetTags(
+            asset_name,
+            parse_tags(self.get_parameter_value("tags")),
+            parse_metadata(self.get_parameter_value("metadata")),
+        )
+        is_tagged = bool(asset_tags.tags or asset_tags.metadata)
+        store_sidecar = is_tagged and self.get_parameter_value("store_metadata_sidecar")
+        index = AssetTagIndex()
+        if store_sidecar:
+            upload_metadata_sidecar(
+                self, bucket_id, asset_tags, max_retries=self.get_parameter_value("max_part_retries")
+            )
+        # Only an earlier upload recorded with a sidecar can have left one behind.
+        elif index.has_sidecar(bucket_id, asset_name) and delete_metadata_sidecar(self, bucket_id, asset_name):
+            logger.info("Deleted the stale metadata sidecar of asset %s", asset_name)
+
+        if not is_tagged:
+            index.forget(bucket_id, [asset_name])
+            return
+        index.record(bucket_id, [asset_tags], has_sidecar=store_sidecar)
+        logger.info("Tagged asset %s with %s", asset_name, ", ".join(asset_tags.tags) or "metadata only")
+
+    def _transform_image(self, source: Any, content_type: str) -> tuple[Any, str]:
+        """Resize and re-encode an image file path or in-memory image per the Image Transform settings.
+
+        Returns the source and content type unchanged when the transform is off or the source is not
+        a transformable image, otherwise the transformed bytes and their content type.
+        """
+        image_transform = ImageTransform(
+            max_dimension=self.get_parameter_value("image_max_dimension") or None,
+            output_format=self.get_parameter_value("image_format") or ImageFormat.ORIGINAL,
+            quality=self.get_parameter_value("image_quality") or DEFAULT_IMAGE_QUALITY,
+        )
+        if image_transform.is_noop:
+            return source, content_type
+
+        inferred_content_type = content_type
+        if isinstance(source, str):
+            transform_source = source
+            if content_type in (None, "", DEFAULT_CONTENT_TYPE):
+                inferred_content_type = guess_content_type(source)
+        else:
+            buffer, mime_type = get_buffer(source)
+            # Process pool workers need picklable input, which memoryviews are not.
+            transform_source = buffer if isinstance(buffer, bytes) else bytes(buffer)
+            if mime_type and content_type in (None, "", DEFAULT_CONTENT_TYPE):
+                inferred_content_type = mime_type
+        if not image_transform.applies_to(inferred_content_type):
+            return source, content_type
+
+        transformed = ImageTransformPool.transform(transform_source, image_transform, inferred_content_type)
+        self.parameter_output_values["original_size"] = transformed.original_size
+        self.parameter_output_values["stored_size"] = transformed.stored_size
+        logger.info(
+            "Transformed image to %dx%d %s: %d bytes stored for %d bytes",
+            transformed.width,
+            transformed.height,
+            transformed.content_type,
+            transformed.stored_size,
+            transformed.original_size,
+        )
+        return transformed.data, transformed.content_type
+
+    def _report_progress(self, snapshot: dict[str, Any]) -> None:
+        # Overwrite rather than append, so the output holds only the latest status.
+        status = format_progress(snapshot)
+        self.set_parameter_value("progress", status)
+        self.parameter_output_values["progress"] = status
+
+    def _upload_single(
+        self,
+        bucket_id: str,
+        asset_name: str,
+        file_path: str,
+        content_type: str,
+        hash_algorithm: str | None,
+        progress: TransferProgress,
+    ) -> str | None:
+        return upload_file(
+            self,
+            bucket_id,
+            asset_name,
+            file_path,
+            content_type,
+            max_retries=self.get_parameter_value("max_part_retries"),
+            hash_algorithm=hash_algorithm,
+            content_encoding=self.get_parameter_value("content_encoding"),
+            compression_level=self.get_parameter_value("compression_level"),
+            progress=progress,
+        )
+
+    def _upload_multipart(
+        self,
+        bucket_id: str,
+        asset_name: str,
+        file_path: str,
+        content_type: str,
+        hash_algorithm: str | None,
+        progress: TransferProgress,
+    ) -> str | None:
+        uploader = MultipartUploader(
+            self,
+            bucket_id,
+            part_size=self.get_parameter_value("part_size_mb") * MIB,
+            max_parallel_parts=self.get_parameter_value("max_parallel_parts"),
+            max_part_retries=self.get_parameter_value("max_part_retries"),
+            hash_algorithm=hash_algorithm,
+            content_encoding=self.get_parameter_value("content_encoding"),
+            compression_level=self.get_parameter_value("compression_level"),
+            checkpoint_store=UploadCheckpointStore() if self.get_parameter_value("resumable") else None,
+            progress=progress,
+        )
+        return uploader.upload_file(file_path, asset_name, content_type).content_hash
+
     def process(self) -> AsyncResult[None]:
         yield lambda: self._process()
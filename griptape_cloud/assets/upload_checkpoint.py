@@ -0,0 +1,116 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from griptape_cloud.assets.multipart_upload import MultipartManifest
+from griptape_cloud.utils.cache_dir import get_cache_dir
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+UPLOAD_CHECKPOINT_DIR_NAME = "upload_checkpoints"
+
+
+@dataclass
+class UploadCheckpoint:
+    """Progress of a multipart upload, persisted so a failed upload of an unchanged file can resume."""
+
+    bucket_id: str
+    asset_name: str
+    file_path: str
+    size: int
+    mtime_ns: int
+    hash_algorithm: str | None
+    manifest: MultipartManifest
+    completed_parts: list[int] = field(default_factory=list)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> "UploadCheckpoint":
+        checkpoint = json.loads(data)
+        checkpoint["manifest"] = MultipartManifest.from_json(json.dumps(checkpoint["manifest"]))
+        return cls(**checkpoint)
+
+
+class UploadCheckpointStore:
+    """Stores one JSON checkpoint per (bucket, asset, file) under the local cache directory.
+
+    Checkpoints are written atomically after every completed part, so a crash never leaves a
+    checkpoint claiming a part that was not uploaded.
+    """
+
+    def __init__(self, checkpoint_dir: str | Path | None = None) -> None:
+        self.checkpoint_dir = (
+            Path(checkpoint_dir) if checkpoint_dir is not None else get_cache_dir(UPLOAD_CHECKPOINT_DIR_NAME)
+        )
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def load(
+        self, bucket_id: str, asset_name: str, file_path: str | Path, size: int, mtime_ns: int
+    ) -> UploadCheckpoint | None:
+        """Return the checkpoint for this upload, or None if there is none or the file has changed since."""
+        checkpoint_path = self._get_checkpoint_path(bucket_id, asset_name, file_path)
+        try:
+            checkpoint = UploadCheckpoint.from_json(checkpoint_path.read_text())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Discarding unreadable upload checkpoint %s: %s", checkpoint_path, e)
+            checkpoint_path.unlink(missing_ok=True)
+            return None
+
+        if checkpoint.size != size or checkpoint.mtime_ns != mtime_ns:
+            logger.info("Discarding upload checkpoint for %s, the file has changed since it was written", file_path)
+            checkpoint_path.unlink(missing_ok=True)
+            return None
+        return checkpoint
+
+    def create(
+        self,
+        bucket_id: str,
+        asset_name: str,
+        file_path: str | Path,
+        size: int,
+        mtime_ns: int,
+        hash_algorithm: str | None,
+        manifest: MultipartManifest,
+    ) -> UploadCheckpoint:
+        checkpoint = UploadCheckpoint(
+            bucket_id=bucket_id,
+            asset_name=asset_name,
+            file_path=str(Path(file_path).resolve()),
+            size=size,
+            mtime_ns=mtime_ns,
+            hash_algorithm=hash_algorithm,
+            manifest=manifest,
+        )
+        with self._lock:
+            self._write(checkpoint)
+        return checkpoint
+
+    def mark_part_completed(self, checkpoint: UploadCheckpoint, index: int) -> None:
+        with self._lock:
+            checkpoint.completed_parts.append(index)
+            self._write(checkpoint)
+
+    def delete(self, checkpoint: UploadCheckpoint) -> None:
+        self._get_checkpoint_path(checkpoint.bucket_id, checkpoint.asset_name, checkpoint.file_path).unlink(
+            missing_ok=True
+        )
+
+    def _write(self, checkpoint: UploadCheckpoint) -> None:
+        checkpoint_path = self._get_checkpoint_path(checkpoint.bucket_id, checkpoint.asset_name, checkpoint.file_path)
+        temp_path = checkpoint_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_text(checkpoint.to_json())
+        temp_path.replace(checkpoint_path)
+
+    def _get_checkpoint_path(self, bucket_id: str, asset_name: str, file_path: str | Path) -> Path:
+        key = "\0".join((bucket_id, asset_name, str(Path(file_path).resolve())))
+        return self.checkpoint_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
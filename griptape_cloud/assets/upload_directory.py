@@ -0,0 +1,397 @@
+import fnmatch
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+from griptape_cloud.assets.asset_tags import AssetTagIndex, AssetTags, parse_metadata, parse_tags
+from griptape_cloud.assets.asset_upload import guess_content_type, upload_buffer, upload_file, upload_metadata_sidecar
+from griptape_cloud.assets.image_transform import DEFAULT_IMAGE_QUALITY, ImageFormat, ImageTransform, ImageTransformPool
+from griptape_cloud.assets.multipart_upload import DEFAULT_MAX_PART_RETRIES, MIB
+from griptape_cloud.assets.transfer_progress import TransferProgress
+from griptape_cloud.assets.upload_pipeline import AssetUploadPipeline
+from griptape_cloud.base.base_griptape_cloud_node import BaseGriptapeCloudNode
+from griptape_nodes.exe_types.core_types import Parameter, ParameterGroup, ParameterMode
+from griptape_nodes.exe_types.node_types import AsyncResult, ControlNode
+from griptape_nodes.traits.options import Options
+
+if TYPE_CHECKING:
+    from griptape_cloud_client.models.bucket_detail import BucketDetail
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+DEFAULT_MAX_WORKERS = 16
+
+
+def parse_patterns(patterns: str | None) -> list[str]:
+    if not patterns:
+        return []
+    return [pattern.strip() for pattern in patterns.replace("\n", ",").split(",") if pattern.strip()]
+
+
+def matches_patterns(relative_path: str, include_patterns: list[str], exclude_patterns: list[str]) -> bool:
+    if include_patterns and not any(fnmatch.fnmatch(relative_path, pattern) for pattern in include_patterns):
+        return False
+    return not any(fnmatch.fnmatch(relative_path, pattern) for pattern in exclude_patterns)
+
+
+def find_files(directory: Path, include_patterns: list[str], exclude_patterns: list[str]) -> list[Path]:
+    """Recursively list files under `directory` whose relative POSIX path matches the include/exclude globs."""
+    return [
+        path
+        for path in sorted(directory.rglob("*"))
+        if path.is_file()
+        and matches_patterns(path.relative_to(directory).as_posix(), include_patterns, exclude_patterns)
+    ]
+
+
+class UploadDirectory(BaseGriptapeCloudNode, ControlNode):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        self.add_parameter(
+            Parameter(
+                name="bucket",
+                input_types=["BucketDetail"],
+                type="BucketDetail",
+                output_type="BucketDetail",
+                default_value=None,
+                tooltip="The bucket to upload to",
+                allowed_modes={ParameterMode.INPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="directory_path",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value=None,
+                ui_options={
+                    "clickable_file_browser": True,
+                    "expander": True,
+                    "display_name": "Path to Directory",
+                },
+                tooltip="The directory to upload",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="asset_prefix",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value="",
+                tooltip="Prefix prepended to each file's relative path to form its asset name",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="include_patterns",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value="*",
+                tooltip="Comma or newline separated globs, matched against relative paths, of files to upload",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="exclude_patterns",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value="",
+                tooltip="Comma or newline separated globs, matched against relative paths, of files to skip",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="max_workers",
+                input_types=["int"],
+                type="int",
+                output_type="int",
+                default_value=DEFAULT_MAX_WORKERS,
+                tooltip="Maximum number of files uploaded at the same time",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="max_retries",
+                input_types=["int"],
+                type="int",
+                output_type="int",
+                default_value=DEFAULT_MAX_PART_RETRIES,
+                tooltip="Number of times a failed file upload is retried",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="tags",
+                input_types=["list", "str"],
+                type="list",
+                output_type="list",
+                default_value=None,
+                tooltip="Tags applied to every uploaded file, as a list or a comma or newline separated string",
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="metadata",
+                input_types=["dict", "str"],
+                type="dict",
+                output_type="dict",
+                default_value=None,
+                tooltip="Metadata recorded with every uploaded file, as a dict or a JSON object",
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
+            )
+        )
+
+        with ParameterGroup(name="Tags") as tags_group:
+            Parameter(
+                name="store_metadata_sidecar",
+                type="bool",
+                default_value=True,
+                tooltip=(
+                    "Also store tags and metadata in a sidecar asset next to each asset, so other engines can "
+                    "index them from a listing."
+                ),
+            )
+        tags_group.ui_options = {"hide": True}  # Hide the tags group by default.
+        self.add_node_element(tags_group)
+
+        with ParameterGroup(name="Image Transform") as image_transform_group:
+            Parameter(
+                name="image_max_dimension",
+                type="int",
+                default_value=0,
+                tooltip=(
+                    "Downscale PNG, JPEG, WebP, BMP, TIFF and AVIF images so neither side exceeds this many pixels "
+                    "(0 keeps the original size)."
+                ),
+            )
+
+            Parameter(
+                name="image_format",
+                type="str",
+                default_value=ImageFormat.ORIGINAL.value,
+                tooltip="Re-encode images in this format before uploading. Asset names keep the file's extension.",
+                traits={Options(choices=[image_format.value for image_format in ImageFormat])},
+            )
+
+            Parameter(
+                name="image_quality",
+                type="int",
+                default_value=DEFAULT_IMAGE_QUALITY,
+                tooltip="Encoder quality (1-100) for JPEG, WebP and AVIF output.",
+            )
+        image_transform_group.ui_options = {"hide": True}  # Hide the image transform group by default.
+        self.add_node_element(image_transform_group)
+
+        self.add_parameter(
+            Parameter(
+                name="uploaded_assets",
+                output_type="list",
+                default_value=None,
+                tooltip="Manifest of uploaded files, with their path, asset name, stored size and original size",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="failed_files",
+                output_type="dict",
+                default_value=None,
+                tooltip="Files that failed to upload, mapped to their error",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="summary",
+                output_type="dict",
+                default_value=None,
+                tooltip="Upload counts, bytes, duration, throughput and time spent in API calls versus data transfer",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+    def validate_before_node_run(self) -> list[Exception] | None:
+        exceptions = super().validate_before_node_run() or []
+
+        try:
+            if not self.get_parameter_value("bucket"):
+                msg = "Bucket is not set. Configure the Node with a valid Griptape Cloud Bucket before running."
+                exceptions.append(ValueError(msg))
+
+            directory_path = self.get_parameter_value("directory_path")
+            if not directory_path:
+                msg = "Directory path is not set. Configure the Node with a valid directory before running."
+                exceptions.append(ValueError(msg))
+            elif not Path(directory_path).is_dir():
+                msg = f"Directory does not exist at path: {directory_path}"
+                exceptions.append(FileNotFoundError(msg))
+
+            parse_metadata(self.get_parameter_value("metadata"))
+            cast("BucketDetail", self.get_parameter_value("bucket"))
+
+        except Exception as e:
+            exceptions.append(e)
+
+        return exceptions if exceptions else None
+
+    def _process(self) -> None:
+        bucket = cast("BucketDetail", self.get_parameter_value("bucket"))
+        directory = Path(self.get_parameter_value("directory_path"))
+        asset_prefix = self.get_parameter_value("asset_prefix") or ""
+        max_retries = self.get_parameter_value("max_retries")
+        files = find_files(
+            directory,
+            parse_patterns(self.get_parameter_value("include_patterns")),
+            parse_patterns(self.get_parameter_value("exclude_patterns")),
+        )
+
+        image_transform = ImageTransform(
+            max_dimension=self.get_parameter_value("image_max_dimension") or None,
+            output_format=self.get_parameter_value("image_format") or ImageFormat.ORIGINAL,
+            quality=self.get_parameter_value("image_quality") or DEFAULT_IMAGE_QUALITY,
+        )
+
+        tags = parse_tags(self.get_parameter_value("tags"))
+        metadata = parse_metadata(self.get_parameter_value("metadata"))
+        store_sidecar = bool(tags or metadata) and self.get_parameter_value("store_metadata_sidecar")
+
+        progress = TransferProgress("upload", sum(path.stat().st_size for path in files))
+
+        def get_asset_name(path: Path) -> str:
+            return f"{asset_prefix}{path.relative_to(directory).as_posix()}"
+
+        # Assets are created and their URLs minted ahead of their transfer, in submission order.
+        pipeline = AssetUploadPipeline(
+            self,
+            bucket.bucket_id,
+            [get_asset_name(path) for path in files],
+            lookahead=self.get_parameter_value("max_workers"),
+        )
+
+        failed_sidecars: dict[str, str] = {}
+
+        def upload(path: Path) -> dict[str, Any]:
+            uploaded_asset = upload_content(path)
+            if store_sidecar:
+                asset_tags = AssetTags(uploaded_asset["asset_name"], tags, metadata)
+                try:
+                    upload_metadata_sidecar(self, bucket.bucket_id, asset_tags, max_retries=max_retries)
+                except Exception as e:
+                    # The file itself is uploaded, only other engines cannot index its tags from a listing.
+                    logger.warning("Error storing the metadata sidecar of %s: %s", uploaded_asset["asset_name"], e)
+                    failed_sidecars[uploaded_asset["asset_name"]] = str(e)
+            return uploaded_asset
+
+        def upload_content(path: Path) -> dict[str, Any]:
+            asset_name = get_asset_name(path)
+            content_type = guess_content_type(path)
+            original_size = path.stat().st_size
+            if image_transform.applies_to(content_type):
+                # Upload threads wait on the process pool, so transforms of many images run on all cores.
+                transformed = ImageTransformPool.transform(path, image_transform, content_type)
+                # The progress total was taken from the files on disk, not the bytes that will be sent.
+                progress.add_total(transformed.stored_size - original_size)
+                upload_buffer(
+                    self,
+                    bucket.bucket_id,
+                    asset_name,
+                    transformed.data,
+                    transformed.content_type,
+                    max_retries=max_retries,
+                    progress=progress,
+                    pipeline=pipeline,
+                )
+                return {
+                    "file_path": str(path),
+                    "asset_name": asset_name,
+                    "size": transformed.stored_size,
+                    "original_size": original_size,
+                }
+            upload_file(
+                self,
+                bucket.bucket_id,
+                asset_name,
+                path,
+                content_type,
+                max_retries=max_retries,
+                progress=progress,
+                pipeline=pipeline,
+            )
+            return {
+                "file_path": str(path),
+                "asset_name": asset_name,
+                "size": original_size,
+                "original_size": original_size,
+            }
+
+        uploaded_assets: list[dict[str, Any]] = []
+        failed_files: dict[str, str] = {}
+        started_at = time.monotonic()
+        # Closing the pipeline deletes assets that were created for uploads that never completed.
+        with pipeline, ThreadPoolExecutor(max_workers=self.get_parameter_value("max_workers")) as executor:
+            futures = {executor.submit(upload, path): path for path in files}
+            for future in as_completed(futures):
+                try:
+                    uploaded_assets.append(future.result())
+                except Exception as e:
+                    logger.error("Error uploading %s: %s", futures[future], e)
+                    failed_files[str(futures[future])] = str(e)
+        elapsed = time.monotonic() - started_at
+        transfer_summary = progress.finish()
+        if tags or metadata:
+            tag_index = AssetTagIndex()
+            tag_index.record(
+                bucket.bucket_id,
+                [
+                    AssetTags(asset["asset_name"], tags, metadata)
+                    for asset in uploaded_assets
+                    if asset["asset_name"] not in failed_sidecars
+                ],
+                has_sidecar=store_sidecar,
+            )
+            tag_index.record(
+                bucket.bucket_id, [AssetTags(asset_name, tags, metadata) for asset_name in failed_sidecars]
+            )
+
+        uploaded_bytes = sum(asset["size"] for asset in uploaded_assets)
+        original_bytes = sum(asset["original_size"] for asset in uploaded_assets)
+        summary = {
+            "files_found": len(files),
+            "files_uploaded": len(uploaded_assets),
+            "files_failed": len(failed_files),
+            "sidecars_failed": len(failed_sidecars),
+            "bytes_uploaded": uploaded_bytes,
+            "bytes_before_transform": original_bytes,
+            "seconds": elapsed,
+            "files_per_second": len(uploaded_assets) / elapsed if elapsed else None,
+            "mb_per_second": uploaded_bytes / MIB / elapsed if elapsed else None,
+            "api_seconds": transfer_summary["api_seconds"],
+            "transfer_seconds": transfer_summary["transfer_seconds"],
+        }
+        logger.info("Uploaded directory %s to bucket %s: %s", directory, bucket.bucket_id, summary)
+
+        self.parameter_output_values["uploaded_assets"] = sorted(uploaded_assets, key=lambda a: a["asset_name"])
+        self.parameter_output_values["failed_files"] = failed_files
+        self.parameter_output_values["summary"] = summary
+
+    def process(self) -> AsyncResult[None]:
+        yield lambda: self._process()
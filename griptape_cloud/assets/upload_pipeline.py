@@ -0,0 +1,178 @@
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from griptape_cloud_client.models.assert_url_operation import AssertUrlOperation
+
+from griptape_cloud.assets.asset_url_cache import EXPIRY_SAFETY_MARGIN_SECONDS, get_url_expiry
+from griptape_cloud.utils.http_transport import HttpTransport
+
+if TYPE_CHECKING:
+    from griptape_cloud_client.models.create_asset_url_response_content import CreateAssetUrlResponseContent
+
+    from griptape_cloud.mixins.griptape_cloud_api_mixin import GriptapeCloudApiMixin
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+DEFAULT_CONTROL_PLANE_WORKERS = 16
+DEFAULT_PIPELINE_LOOKAHEAD = 16
+
+
+class ControlPlaneExecutor:
+    """Process-wide thread pool for Griptape Cloud API calls issued alongside or ahead of data transfer.
+
+    Tasks run here must not wait on other tasks submitted here, or a full pool would deadlock.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _executor: ClassVar[ThreadPoolExecutor | None] = None
+
+    @classmethod
+    def submit(cls, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=DEFAULT_CONTROL_PLANE_WORKERS, thread_name_prefix="griptape-cloud-control-plane"
+                )
+            return cls._executor.submit(fn, *args, **kwargs)
+
+
+class PreparedUpload:
+    """An asset being created and its PUT URL being minted, both in flight at the same time."""
+
+    def __init__(self, api: "GriptapeCloudApiMixin", bucket_id: str, asset_name: str) -> None:
+        self.api = api
+        self.bucket_id = bucket_id
+        self.asset_name = asset_name
+        self._create_future = ControlPlaneExecutor.submit(api._create_asset, asset_name=asset_name, bucket_id=bucket_id)
+        # Minting may fail until the asset exists, which `result` retries, so the failure is not logged as an error.
+        self._url_future = ControlPlaneExecutor.submit(self._get_upload_url, log_errors=False)
+
+    def result(self) -> "CreateAssetUrlResponseContent":
+        """Wait for the asset to exist and return a PUT URL that is still valid."""
+        self._create_future.result()
+        try:
+            response = self._url_future.result()
+        except Exception as e:
+            # The URL may only be mintable once the asset exists, which it now does.
+            logger.debug("Minting the upload URL for %s before it existed failed, retrying: %s", self.asset_name, e)
+            return self._get_upload_url()
+        if get_url_expiry(response) - EXPIRY_SAFETY_MARGIN_SECONDS <= time.time():
+            # Prepared too far ahead, the cache mints a fresh URL.
+            return self._get_upload_url()
+        return response
+
+    def discard(self) -> None:
+        """Stop preparing the upload, and delete the asset if it was created but holds nothing.
+
+        Assets that already held content before they were prepared, e.g. ones being overwritten,
+        are left as they are.
+        """
+        self._url_future.cancel()
+        if self._create_future.cancel():
+            return
+        try:
+            self._create_future.result()
+        except Exception:
+            # Nothing was created.
+            return
+        try:
+            if self._holds_content():
+                return
+            self.api._delete_asset(self.bucket_id, self.asset_name)
+            logger.debug("Deleted asset %s, which was prepared for upload but never uploaded", self.asset_name)
+        except Exception as e:
+            logger.warning("Failed to delete asset %s, which was prepared but never uploaded: %s", self.asset_name, e)
+
+    def _holds_content(self) -> bool:
+        url = self.api._get_cached_asset_url(self.asset_name, self.bucket_id, AssertUrlOperation.GET).url
+        with HttpTransport.stream("GET", url, headers={"Range": "bytes=0-0"}) as response:
+            return response.status_code != HTTPStatus.NOT_FOUND
+
+    def _get_upload_url(self, *, log_errors: bool = True) -> "CreateAssetUrlResponseContent":
+        return self.api._get_cached_asset_url(
+            self.asset_name, self.bucket_id, AssertUrlOperation.PUT, log_errors=log_errors
+        )
+
+
+def prepare_asset_upload(
+    api: "GriptapeCloudApiMixin", bucket_id: str, asset_name: str
+) -> "CreateAssetUrlResponseContent":
+    """Create an asset and mint its PUT URL with both calls in flight at once, instead of one after the other."""
+    return PreparedUpload(api, bucket_id, asset_name).result()
+
+
+class AssetUploadPipeline:
+    """Creates assets and mints their PUT URLs ahead of their transfer, in upload order.
+
+    Up to `lookahead` assets beyond the ones already handed out are kept prepared, so the control
+    plane calls for later assets overlap with the data transfer of earlier ones. With a lookahead of
+    at least the number of parallel transfers, their latency is hidden entirely.
+
+    Use it as a context manager, or call `close`, once the batch is done. Assets it created that
+    were never uploaded, because the batch failed or was cancelled, are deleted then.
+    """
+
+    def __init__(
+        self,
+        api: "GriptapeCloudApiMixin",
+        bucket_id: str,
+        asset_names: Iterable[str],
+        *,
+        lookahead: int = DEFAULT_PIPELINE_LOOKAHEAD,
+    ) -> None:
+        self.api = api
+        self.bucket_id = bucket_id
+        self.lookahead = max(lookahead, 1)
+        self._pending = deque(asset_names)
+        self._prepared: dict[str, PreparedUpload] = {}
+        self._handed_out: dict[str, PreparedUpload] = {}
+        self._uploaded: set[str] = set()
+        self._lock = threading.Lock()
+        with self._lock:
+            self._fill()
+
+    def get_upload_url(self, asset_name: str) -> "CreateAssetUrlResponseContent":
+        with self._lock:
+            prepared = self._prepared.pop(asset_name, None)
+            if prepared is None:
+                if asset_name in self._pending:
+                    self._pending.remove(asset_name)
+                prepared = PreparedUpload(self.api, self.bucket_id, asset_name)
+            self._handed_out[asset_name] = prepared
+            self._fill()
+        return prepared.result()
+
+    def mark_uploaded(self, asset_name: str) -> None:
+        with self._lock:
+            self._uploaded.add(asset_name)
+
+    def close(self) -> None:
+        """Stop preparing assets, and delete the ones created for uploads that never completed."""
+        with self._lock:
+            self._pending.clear()
+            unused = [
+                *self._prepared.values(),
+                *(prepared for name, prepared in self._handed_out.items() if name not in self._uploaded),
+            ]
+            self._prepared.clear()
+            self._handed_out.clear()
+        for prepared in unused:
+            prepared.discard()
+
+    def __enter__(self) -> "AssetUploadPipeline":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _fill(self) -> None:
+        while self._pending and len(self._prepared) < self.lookahead:
+            asset_name = self._pending.popleft()
+            self._prepared[asset_name] = PreparedUpload(self.api, self.bucket_id, asset_name)
@@ -0,0 +1,36 @@
+import logging
+import threading
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+
+class AssistantThreadCache:
+    """Process-wide cache of Griptape Cloud thread IDs keyed by assistant and conversation key.
+
+    Reusing a thread lets each assistant run send only the newest message, since the
+    conversation history is stored server-side on the thread.
+    """
+
+    _lock = threading.Lock()
+    _thread_ids: dict[tuple[str, str], str] = {}  # noqa: RUF012
+
+    @classmethod
+    def get(cls, assistant_id: str, conversation_key: str) -> str | None:
+        with cls._lock:
+            return cls._thread_ids.get((assistant_id, conversation_key))
+
+    @classmethod
+    def set(cls, assistant_id: str, conversation_key: str, thread_id: str) -> None:
+        with cls._lock:
+            cls._thread_ids[(assistant_id, conversation_key)] = thread_id
+
+    @classmethod
+    def remove(cls, assistant_id: str, conversation_key: str) -> None:
+        with cls._lock:
+            cls._thread_ids.pop((assistant_id, conversation_key), None)
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._thread_ids.clear()
@@ -3,9 +3,17 @@ from typing import TYPE_CHECKING, Any, cast
 
 from griptape_cloud_client.types import Unset
 
+from griptape_cloud.assistants.assistant_thread_cache import AssistantThreadCache
 from griptape_cloud.base.base_griptape_cloud_node import BaseGriptapeCloudNode
+from griptape_cloud.utils.run_admission_scheduler import RunAdmissionScheduler, RunPriority
+from griptape_cloud.utils.run_timing import (
+    ASSISTANT_RUN_COMPLETED_EVENT_TYPES,
+    ASSISTANT_RUN_STARTED_EVENT_TYPES,
+    RunTimingTracker,
+)
 from griptape_nodes.exe_types.core_types import Parameter, ParameterGroup, ParameterList, ParameterMode
 from griptape_nodes.exe_types.node_types import AsyncResult, ControlNode
+from griptape_nodes.traits.options import Options
 
 if TYPE_CHECKING:
     from griptape_cloud_client.models.assistant_detail import AssistantDetail
@@ -13,6 +21,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger("griptape_nodes")
 logger.setLevel(logging.INFO)
 
+RUN_TIMING_METRIC = "assistant_run.timing"
+
 
 class RunAssistant(BaseGriptapeCloudNode, ControlNode):
     def __init__(self, **kwargs) -> None:
@@ -37,7 +47,31 @@ class RunAssistant(BaseGriptapeCloudNode, ControlNode):
                 output_type="str",
                 type="str",
                 default_value=None,
-                tooltip="The arguments to pass to the assistant run",
+                tooltip="The arguments to pass to the assistant run. When a thread is used, only pass the new message.",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="conversation_key",
+                input_types=["str"],
+                output_type="str",
+                type="str",
+                default_value=None,
+                tooltip="Key identifying the conversation. Runs with the same key reuse the same thread.",
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="thread_id",
+                input_types=["str"],
+                output_type="str",
+                type="str",
+                default_value=None,
+                tooltip="The ID of the thread to run the assistant on. Takes precedence over the conversation key.",
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY, ParameterMode.OUTPUT},
             )
         )
 
@@ -63,6 +97,16 @@ class RunAssistant(BaseGriptapeCloudNode, ControlNode):
             )
         )
 
+        self.add_parameter(
+            Parameter(
+                name="timing",
+                output_type="dict",
+                default_value=None,
+                tooltip="Breakdown of the time the assistant run spent queued, booting and executing",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
         with ParameterGroup(name="Events") as events_group:
             Parameter(name="include_events", type="bool", default_value=False, tooltip="Include events details.")
 
@@ -76,6 +120,26 @@ class RunAssistant(BaseGriptapeCloudNode, ControlNode):
         events_group.ui_options = {"hide": True}  # Hide the events group by default.
         self.add_node_element(events_group)
 
+        with ParameterGroup(name="Scheduling") as scheduling_group:
+            Parameter(
+                name="run_priority",
+                type="str",
+                default_value=RunPriority.INTERACTIVE.value,
+                tooltip="Admission priority. Interactive runs are dispatched before batch runs.",
+                traits={Options(choices=[priority.value for priority in RunPriority])},
+            )
+
+            Parameter(
+                name="max_concurrent_runs",
+                type="int",
+                default_value=0,
+                tooltip=(
+                    "Maximum number of in-flight runs of this assistant started by this engine. Set to 0 for no limit."
+                ),
+            )
+        scheduling_group.ui_options = {"hide": True}  # Hide the scheduling group by default.
+        self.add_node_element(scheduling_group)
+
     def validate_before_workflow_run(self) -> list[Exception] | None:
         exceptions = super().validate_before_workflow_run() or []
 
@@ -93,19 +157,59 @@ class RunAssistant(BaseGriptapeCloudNode, ControlNode):
         # if there are exceptions, they will display when the user tries to run the flow with the node.
         return exceptions if exceptions else None
 
+    def _resolve_thread_id(self, assistant: "AssistantDetail") -> str | None:
+        thread_id = self.get_parameter_value("thread_id")
+        conversation_key = self.get_parameter_value("conversation_key")
+
+        if not conversation_key:
+            return thread_id or None
+
+        if thread_id:
+            AssistantThreadCache.set(assistant.assistant_id, conversation_key, thread_id)
+            return thread_id
+
+        thread_id = AssistantThreadCache.get(assistant.assistant_id, conversation_key)
+        if thread_id is None:
+            thread = self._create_thread(name=f"{assistant.name} ({conversation_key})")
+            thread_id = thread.thread_id
+            AssistantThreadCache.set(assistant.assistant_id, conversation_key, thread_id)
+            logger.info("Created thread %s for conversation '%s'", thread_id, conversation_key)
+
+        return thread_id
+
     def _process(self) -> None:
         include_events = self.get_parameter_value("include_events")
         assistant = cast("AssistantDetail", self.get_parameter_value("assistant"))
         args = self.get_parameter_value("args")
-        assistant_run = self._create_assistant_run(assistant_id=assistant.assistant_id, args=args)
+        thread_id = self._resolve_thread_id(assistant)
+        timing = RunTimingTracker(
+            metric_prefix=RUN_TIMING_METRIC,
+            started_event_types=ASSISTANT_RUN_STARTED_EVENT_TYPES,
+            completed_event_types=ASSISTANT_RUN_COMPLETED_EVENT_TYPES,
+        )
 
         output: Any | None = None
 
-        for events in self._poll_assistant_run_events(assistant_run_id=assistant_run.assistant_run_id):
-            if include_events:
-                self.append_value_to_parameter("events", "\n".join(str(event.payload) for event in events))
+        with RunAdmissionScheduler.get_instance().admit(
+            key=assistant.assistant_id,
+            priority=RunPriority(self.get_parameter_value("run_priority")),
+            max_in_flight_for_key=self.get_parameter_value("max_concurrent_runs"),
+        ):
+            timing.mark_submitted()
+            assistant_run = self._create_assistant_run(
+                assistant_id=assistant.assistant_id, args=args, thread_id=thread_id
+            )
+            self.parameter_output_values["assistant_run_id"] = assistant_run.assistant_run_id
+            self.parameter_output_values["thread_id"] = thread_id
+
+            for events in self._poll_assistant_run_events(assistant_run_id=assistant_run.assistant_run_id):
+                timing.observe_events(events)
+                if include_events:
+                    self.append_value_to_parameter("events", "\n".join(str(event.payload) for event in events))
 
         assistant_run = self._get_assistant_run(assistant_run_id=assistant_run.assistant_run_id)
+        timing.observe_run(assistant_run)
+        self.parameter_output_values["timing"] = timing.emit()
         output = assistant_run.output if not isinstance(assistant_run.output, Unset) else None
         self.parameter_output_values["output"] = output
 
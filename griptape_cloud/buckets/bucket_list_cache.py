@@ -0,0 +1,41 @@
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, ClassVar
+
+if TYPE_CHECKING:
+    from griptape_cloud_client.models.bucket_detail import BucketDetail
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+DEFAULT_BUCKET_LIST_MAX_AGE_SECONDS = 60.0
+
+
+class BucketListCache:
+    """Process-wide cache of the full bucket listing, shared by every node that lists buckets.
+
+    The API mixin invalidates it whenever it creates, renames or deletes a bucket.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _buckets: ClassVar[list["BucketDetail"] | None] = None
+    _listed_at: ClassVar[float] = 0.0
+
+    @classmethod
+    def get(cls, max_age: float = DEFAULT_BUCKET_LIST_MAX_AGE_SECONDS) -> list["BucketDetail"] | None:
+        with cls._lock:
+            if cls._buckets is None or time.monotonic() - cls._listed_at > max_age:
+                return None
+            return list(cls._buckets)
+
+    @classmethod
+    def set(cls, buckets: list["BucketDetail"]) -> None:
+        with cls._lock:
+            cls._buckets = list(buckets)
+            cls._listed_at = time.monotonic()
+
+    @classmethod
+    def invalidate(cls) -> None:
+        with cls._lock:
+            cls._buckets = None
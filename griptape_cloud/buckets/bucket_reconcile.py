@@ -0,0 +1,224 @@
+import json
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from griptape_cloud.buckets.bucket_list_cache import BucketListCache
+from griptape_cloud.utils.rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    from griptape_cloud_client.models.bucket_detail import BucketDetail
+
+    from griptape_cloud.mixins.griptape_cloud_api_mixin import GriptapeCloudApiMixin
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_MAX_REQUESTS_PER_SECOND = 20.0
+
+
+@dataclass
+class DesiredBucket:
+    """A bucket that should exist. A bucket with `previous_name` or `bucket_id` is renamed to `name`."""
+
+    name: str
+    previous_name: str | None = None
+    bucket_id: str | None = None
+
+
+@dataclass
+class BucketRename:
+    bucket_id: str
+    previous_name: str
+    name: str
+
+
+@dataclass
+class BucketPlan:
+    creates: list[str] = field(default_factory=list)
+    renames: list[BucketRename] = field(default_factory=list)
+    deletes: list["BucketDetail"] = field(default_factory=list)
+    unchanged: list["BucketDetail"] = field(default_factory=list)
+
+    def to_summary(self) -> dict[str, Any]:
+        return {
+            "create": self.creates,
+            "rename": [{"bucket_id": r.bucket_id, "from": r.previous_name, "to": r.name} for r in self.renames],
+            "delete": [{"bucket_id": bucket.bucket_id, "name": bucket.name} for bucket in self.deletes],
+            "unchanged": len(self.unchanged),
+        }
+
+
+@dataclass
+class ReconcileResult:
+    plan: BucketPlan
+    dry_run: bool = False
+    created: list[str] = field(default_factory=list)
+    renamed: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    def to_summary(self) -> dict[str, Any]:
+        return {
+            "dry_run": self.dry_run,
+            "plan": self.plan.to_summary(),
+            "created": len(self.created),
+            "renamed": len(self.renamed),
+            "deleted": len(self.deleted),
+            "failed": len(self.failed),
+            "elapsed_seconds": self.elapsed_seconds,
+        }
+
+
+def parse_desired_buckets(value: Any) -> list[DesiredBucket]:
+    """Parse desired buckets from a list of names or dicts, a JSON list, or a comma or newline separated string."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        stripped = value.strip()
+        value = json.loads(stripped) if stripped.startswith("[") else stripped.replace("\n", ",").split(",")
+
+    desired = []
+    for item in value:
+        if isinstance(item, DesiredBucket):
+            desired.append(item)
+        elif isinstance(item, dict):
+            desired.append(
+                DesiredBucket(
+                    name=str(item["name"]).strip(),
+                    previous_name=item.get("previous_name"),
+                    bucket_id=item.get("bucket_id"),
+                )
+            )
+        elif str(item).strip():
+            desired.append(DesiredBucket(name=str(item).strip()))
+
+    names = [bucket.name for bucket in desired]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        msg = f"Desired buckets must have unique names, duplicated: {', '.join(duplicates)}"
+        raise ValueError(msg)
+    return desired
+
+
+def plan_bucket_changes(
+    current: list["BucketDetail"],
+    desired: list[DesiredBucket],
+    *,
+    delete_unlisted: bool = False,
+    managed_prefix: str = "",
+) -> BucketPlan:
+    """Work out the creates, renames and deletes that turn the `current` buckets into the `desired` ones.
+
+    Only buckets whose name starts with `managed_prefix` are deleted for not being listed, and
+    `delete_unlisted` requires one, so a missing prefix can never delete every bucket.
+    """
+    if delete_unlisted and not managed_prefix:
+        msg = "Deleting unlisted buckets requires a managed prefix."
+        raise ValueError(msg)
+
+    by_id = {bucket.bucket_id: bucket for bucket in current}
+    by_name: dict[str, BucketDetail] = {}
+    for bucket in current:
+        by_name.setdefault(bucket.name, bucket)
+
+    plan = BucketPlan()
+    matched_ids = set()
+    for desired_bucket in desired:
+        bucket = by_id.get(desired_bucket.bucket_id) if desired_bucket.bucket_id else None
+        if bucket is None:
+            bucket = by_name.get(desired_bucket.name)
+        if bucket is None and desired_bucket.previous_name:
+            bucket = by_name.get(desired_bucket.previous_name)
+        if bucket is None or bucket.bucket_id in matched_ids:
+            plan.creates.append(desired_bucket.name)
+            continue
+        matched_ids.add(bucket.bucket_id)
+        if bucket.name == desired_bucket.name:
+            plan.unchanged.append(bucket)
+        else:
+            plan.renames.append(BucketRename(bucket.bucket_id, bucket.name, desired_bucket.name))
+
+    if delete_unlisted:
+        plan.deletes = [
+            bucket
+            for bucket in current
+            if bucket.bucket_id not in matched_ids and bucket.name.startswith(managed_prefix)
+        ]
+    return plan
+
+
+class BucketReconciler:
+    """Applies a `BucketPlan` with concurrent, rate-limited bucket API calls.
+
+    The shared bucket listing cache is invalidated once all changes have been applied, so a listing
+    taken while they were in flight is not served afterwards.
+    """
+
+    def __init__(
+        self,
+        api: "GriptapeCloudApiMixin",
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_requests_per_second: float = DEFAULT_MAX_REQUESTS_PER_SECOND,
+    ) -> None:
+        self.api = api
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(max_requests_per_second)
+
+    def reconcile(self, plan: BucketPlan, *, dry_run: bool = False) -> ReconcileResult:
+        result = ReconcileResult(plan, dry_run=dry_run)
+        if dry_run:
+            return result
+
+        started_at = time.monotonic()
+        operations: list[tuple[list[str], str, Callable[[], Any]]] = []
+        for name in plan.creates:
+            operations.append((result.created, name, lambda name=name: self.api._create_bucket(name)))
+        for rename in plan.renames:
+            operations.append(
+                (
+                    result.renamed,
+                    rename.name,
+                    lambda rename=rename: self.api._update_bucket(rename.bucket_id, rename.name),
+                )
+            )
+        for bucket in plan.deletes:
+            operations.append(
+                (result.deleted, bucket.name, lambda bucket=bucket: self.api._delete_bucket(bucket.bucket_id))
+            )
+
+        def apply(operation: Callable[[], Any]) -> None:
+            self.rate_limiter.acquire()
+            operation()
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    executor.submit(apply, operation): (applied, name) for applied, name, operation in operations
+                }
+                for future in as_completed(futures):
+                    applied, name = futures[future]
+                    try:
+                        future.result()
+                        applied.append(name)
+                    except Exception as e:
+                        result.failed[name] = str(e)
+        finally:
+            BucketListCache.invalidate()
+
+        result.elapsed_seconds = time.monotonic() - started_at
+        logger.info(
+            "Reconciled buckets in %.1fs: %d created, %d renamed, %d deleted, %d failed",
+            result.elapsed_seconds,
+            len(result.created),
+            len(result.renamed),
+            len(result.deleted),
+            len(result.failed),
+        )
+        return result
@@ -14,7 +14,7 @@ class GetBucket(BaseGriptapeCloudNode, DataNode):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
 
-        self.buckets = self._list_buckets().buckets
+        self.buckets = self._list_all_buckets()
         self.choices = list(map(BucketOptions._bucket_to_name_and_id, self.buckets))
 
         self.add_parameter(
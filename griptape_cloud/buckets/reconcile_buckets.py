@@ -0,0 +1,164 @@
+import logging
+
+from griptape_cloud.base.base_griptape_cloud_node import BaseGriptapeCloudNode
+from griptape_cloud.buckets.bucket_reconcile import (
+    DEFAULT_MAX_REQUESTS_PER_SECOND,
+    DEFAULT_MAX_WORKERS,
+    BucketReconciler,
+    parse_desired_buckets,
+    plan_bucket_changes,
+)
+from griptape_nodes.exe_types.core_types import Parameter, ParameterGroup, ParameterMode
+from griptape_nodes.exe_types.node_types import AsyncResult, ControlNode
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+
+class ReconcileBuckets(BaseGriptapeCloudNode, ControlNode):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        self.add_parameter(
+            Parameter(
+                name="desired_buckets",
+                input_types=["list", "str"],
+                type="list",
+                output_type="list",
+                default_value=None,
+                tooltip=(
+                    "The buckets that should exist, as bucket names, or dicts with a name and optionally the "
+                    "previous_name or bucket_id of a bucket to rename. Also accepts a JSON list or a comma or "
+                    "newline separated string of names."
+                ),
+                allowed_modes={ParameterMode.INPUT, ParameterMode.PROPERTY},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="delete_unlisted",
+                input_types=["bool"],
+                type="bool",
+                output_type="bool",
+                default_value=False,
+                tooltip=(
+                    "Delete buckets that are not in the desired buckets and whose name starts with the managed "
+                    "prefix, which must be set"
+                ),
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="managed_prefix",
+                input_types=["str"],
+                type="str",
+                output_type="str",
+                default_value="",
+                tooltip="Only buckets whose name starts with this prefix are deleted for not being listed",
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="dry_run",
+                input_types=["bool"],
+                type="bool",
+                output_type="bool",
+                default_value=False,
+                tooltip="Only report the changes that would be made",
+            )
+        )
+
+        with ParameterGroup(name="Batch") as batch_group:
+            Parameter(
+                name="max_workers",
+                type="int",
+                default_value=DEFAULT_MAX_WORKERS,
+                tooltip="Maximum number of bucket changes applied at the same time.",
+            )
+
+            Parameter(
+                name="max_requests_per_second",
+                type="float",
+                default_value=DEFAULT_MAX_REQUESTS_PER_SECOND,
+                tooltip="Maximum number of bucket requests sent to Griptape Cloud per second (0 for unlimited).",
+            )
+        batch_group.ui_options = {"hide": True}  # Hide the batch group by default.
+        self.add_node_element(batch_group)
+
+        self.add_parameter(
+            Parameter(
+                name="buckets",
+                output_type="list",
+                default_value=None,
+                tooltip="Every bucket after reconciling",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="failed",
+                output_type="dict",
+                default_value=None,
+                tooltip="Bucket names whose change failed, mapped to their error",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+        self.add_parameter(
+            Parameter(
+                name="summary",
+                output_type="dict",
+                default_value=None,
+                tooltip="The planned changes and the created, renamed, deleted and failed counts",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
+    def validate_before_node_run(self) -> list[Exception] | None:
+        exceptions = super().validate_before_node_run() or []
+
+        try:
+            desired_buckets = parse_desired_buckets(self.get_parameter_value("desired_buckets"))
+            if not desired_buckets and not self.get_parameter_value("delete_unlisted"):
+                msg = "Desired buckets are not set. Configure the Node with at least one bucket before running."
+                exceptions.append(ValueError(msg))
+
+            if self.get_parameter_value("delete_unlisted") and not self.get_parameter_value("managed_prefix"):
+                msg = "Managed prefix is not set. Set it to limit which buckets are deleted for not being listed."
+                exceptions.append(ValueError(msg))
+
+        except Exception as e:
+            exceptions.append(e)
+
+        return exceptions if exceptions else None
+
+    def _process(self) -> None:
+        try:
+            desired_buckets = parse_desired_buckets(self.get_parameter_value("desired_buckets"))
+            # Plan against a fresh listing, not one cached before another process changed the buckets.
+            plan = plan_bucket_changes(
+                self._list_all_buckets(max_age=0),
+                desired_buckets,
+                delete_unlisted=self.get_parameter_value("delete_unlisted"),
+                managed_prefix=self.get_parameter_value("managed_prefix") or "",
+            )
+            result = BucketReconciler(
+                self,
+                max_workers=self.get_parameter_value("max_workers"),
+                max_requests_per_second=self.get_parameter_value("max_requests_per_second"),
+            ).reconcile(plan, dry_run=self.get_parameter_value("dry_run"))
+
+            self.parameter_output_values["buckets"] = self._list_all_buckets()
+            self.parameter_output_values["failed"] = result.failed
+            self.parameter_output_values["summary"] = result.to_summary()
+
+        except Exception as e:
+            logger.error("Error reconciling buckets: %s", e)
+            raise
+
+    def process(self) -> AsyncResult[None]:
+        yield lambda: self._process()
@@ -1,4 +1,5 @@
 import logging
+from typing import TYPE_CHECKING
 
 from griptape_nodes.node_library.advanced_node_library import AdvancedNodeLibrary
 from griptape_nodes.node_library.library_registry import Library, LibrarySchema
@@ -9,9 +10,14 @@ from griptape_nodes.retained_mode.events.workflow_events import (
 )
 from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 
+if TYPE_CHECKING:
+    from griptape_cloud.publish_workflow.keep_warm_service import KeepWarmService
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("griptape_nodes")
 
+_keep_warm_service: "KeepWarmService | None" = None
+
 
 def _publish_workflow_request_handler(request: RequestPayload) -> ResultPayload:
     if not isinstance(request, PublishWorkflowRequest):
@@ -27,6 +33,41 @@ def _publish_workflow_request_handler(request: RequestPayload) -> ResultPayload:
     return publisher.publish_workflow()
 
 
+def _start_keep_warm_service() -> None:
+    from griptape_cloud_client.client import AuthenticatedClient
+
+    from griptape_cloud.base.base_griptape_cloud_node import API_KEY_ENV_VAR, DEFAULT_GRIPTAPE_CLOUD_ENDPOINT
+    from griptape_cloud.publish_workflow import GRIPTAPE_CLOUD_LIBRARY_CONFIG_KEY
+    from griptape_cloud.publish_workflow.keep_warm_service import (
+        DEFAULT_MAX_PINGS_PER_HOUR,
+        KeepWarmService,
+        KeepWarmTarget,
+    )
+
+    config_manager = GriptapeNodes.ConfigManager()
+    targets_config = config_manager.get_config_value(
+        f"{GRIPTAPE_CLOUD_LIBRARY_CONFIG_KEY}.GT_CLOUD_KEEP_WARM_STRUCTURES"
+    )
+    if not targets_config:
+        return
+
+    api_key = GriptapeNodes.SecretsManager().get_secret(API_KEY_ENV_VAR)
+    if api_key is None:
+        logger.warning("Keep-warm structures are configured but %s is not set.", API_KEY_ENV_VAR)
+        return
+
+    max_pings_per_hour = config_manager.get_config_value(
+        f"{GRIPTAPE_CLOUD_LIBRARY_CONFIG_KEY}.GT_CLOUD_KEEP_WARM_MAX_PINGS_PER_HOUR"
+    )
+    global _keep_warm_service  # noqa: PLW0603
+    _keep_warm_service = KeepWarmService(
+        gtc_client=AuthenticatedClient(base_url=DEFAULT_GRIPTAPE_CLOUD_ENDPOINT, token=api_key, verify_ssl=False),
+        targets=[KeepWarmTarget.from_config(target) for target in targets_config],
+        max_pings_per_hour=int(max_pings_per_hour or DEFAULT_MAX_PINGS_PER_HOUR),
+    )
+    _keep_warm_service.start()
+
+
 class GriptapeCloudLibraryAdvanced(AdvancedNodeLibrary):
     """Advanced library implementation for the default Griptape Cloud Library."""
 
@@ -48,3 +89,8 @@ class GriptapeCloudLibraryAdvanced(AdvancedNodeLibrary):
                 end_flow_node_library_name=library_data.name,
             ),
         )
+
+        try:
+            _start_keep_warm_service()
+        except Exception as e:
+            logger.error("Failed to start keep-warm service: %s", e)
@@ -1,10 +1,13 @@
 import logging
 import time
+import weakref
 from collections.abc import Generator
 from typing import TYPE_CHECKING, Any
 
 from griptape_cloud_client.api.assets.create_asset import sync as create_asset
 from griptape_cloud_client.api.assets.create_asset_url import sync as create_asset_url
+from griptape_cloud_client.api.assets.delete_asset import sync as delete_asset
+from griptape_cloud_client.api.assets.list_assets import sync as list_assets
 from griptape_cloud_client.api.assistant_runs.create_assistant_run import sync as create_assistant_run
 from griptape_cloud_client.api.assistant_runs.get_assistant_run import sync as get_assistant_run
 from griptape_cloud_client.api.assistants.list_assistants import sync as list_assistants
@@ -17,11 +20,14 @@ from griptape_cloud_client.api.deployments.get_deployment import sync as get_dep
 from griptape_cloud_client.api.deployments.list_structure_deployments import sync as list_structure_deployments
 from griptape_cloud_client.api.events.list_assistant_events import sync as list_assistant_events
 from griptape_cloud_client.api.events.list_events import sync as list_events
+from griptape_cloud_client.api.structure_runs.cancel_structure_run import sync as cancel_structure_run
 from griptape_cloud_client.api.structure_runs.create_structure_run import sync as create_structure_run
 from griptape_cloud_client.api.structure_runs.get_structure_run import sync as get_structure_run
 from griptape_cloud_client.api.structures.list_structures import sync as list_structures
+from griptape_cloud_client.api.threads.create_thread import sync as create_thread
 from griptape_cloud_client.models.assert_url_operation import AssertUrlOperation
 from griptape_cloud_client.models.assistant_event_detail import AssistantEventDetail
+from griptape_cloud_client.models.bucket_detail import BucketDetail
 from griptape_cloud_client.models.client_error_response_content import ClientErrorResponseContent
 from griptape_cloud_client.models.create_asset_request_content import CreateAssetRequestContent
 from griptape_cloud_client.models.create_asset_response_content import (
@@ -43,6 +49,8 @@ from griptape_cloud_client.models.create_structure_run_request_content import (
 from griptape_cloud_client.models.create_structure_run_response_content import (
     CreateStructureRunResponseContent,
 )
+from griptape_cloud_client.models.create_thread_request_content import CreateThreadRequestContent
+from griptape_cloud_client.models.create_thread_response_content import CreateThreadResponseContent
 from griptape_cloud_client.models.deployment_status import DeploymentStatus
 from griptape_cloud_client.models.event_detail import EventDetail
 from griptape_cloud_client.models.get_assistant_run_response_content import (
@@ -53,6 +61,7 @@ from griptape_cloud_client.models.get_deployment_response_content import GetDepl
 from griptape_cloud_client.models.get_structure_run_response_content import (
     GetStructureRunResponseContent,
 )
+from griptape_cloud_client.models.list_assets_response_content import ListAssetsResponseContent
 from griptape_cloud_client.models.list_assistant_events_response_content import (
     ListAssistantEventsResponseContent,
 )
@@ -72,6 +81,10 @@ from griptape_cloud_client.models.update_bucket_request_content import UpdateBuc
 from griptape_cloud_client.models.update_bucket_response_content import UpdateBucketResponseContent
 from griptape_cloud_client.types import UNSET
 
+from griptape_cloud.assets.asset_listing import AssetIndexCache
+from griptape_cloud.assets.asset_url_cache import AssetUrlCache
+from griptape_cloud.buckets.bucket_list_cache import DEFAULT_BUCKET_LIST_MAX_AGE_SECONDS, BucketListCache
+
 if TYPE_CHECKING:
     from griptape_cloud_client.client import AuthenticatedClient
 
@@ -165,12 +178,12 @@ class GriptapeCloudApiMixin:
             logger.error("Error waiting for latest structure deployment: %s", e)
             raise
 
-    def _list_buckets(self) -> ListBucketsResponseContent:
+    def _list_buckets(self, page: int = 1, page_size: int = 100) -> ListBucketsResponseContent:
         try:
             response = list_buckets(
                 client=self.gtc_client,
-                page=1,
-                page_size=100,
+                page=page,
+                page_size=page_size,
             )
             if isinstance(response, ListBucketsResponseContent):
                 return response
@@ -181,6 +194,25 @@ class GriptapeCloudApiMixin:
             logger.error("Error listing buckets: %s", e)
             raise
 
+    def _iter_buckets(self, page_size: int = 100) -> Generator[BucketDetail, None, None]:
+        """Yield every bucket, fetching one page at a time."""
+        page = 1
+        while True:
+            response = self._list_buckets(page=page, page_size=page_size)
+            yield from response.buckets
+            total_pages = getattr(response.pagination, "total_pages", None)
+            if len(response.buckets) < page_size or (isinstance(total_pages, int) and page >= total_pages):
+                return
+            page += 1
+
+    def _list_all_buckets(self, max_age: float = DEFAULT_BUCKET_LIST_MAX_AGE_SECONDS) -> list[BucketDetail]:
+        """Return every bucket from the process-wide listing cache, listing them if it is older than `max_age`."""
+        buckets = BucketListCache.get(max_age)
+        if buckets is None:
+            buckets = list(self._iter_buckets())
+            BucketListCache.set(buckets)
+        return buckets
+
     def _get_bucket(self, bucket_id: str) -> GetBucketResponseContent:
         try:
             response = get_bucket(bucket_id=bucket_id, client=self.gtc_client)
@@ -200,6 +232,7 @@ class GriptapeCloudApiMixin:
                 client=self.gtc_client,
             )
             if isinstance(response, CreateBucketResponseContent):
+                BucketListCache.invalidate()
                 return response
             msg = f"Unexpected response type: {type(response)}"
             logger.error(msg)
@@ -216,6 +249,7 @@ class GriptapeCloudApiMixin:
                 client=self.gtc_client,
             )
             if isinstance(response, UpdateBucketResponseContent):
+                BucketListCache.invalidate()
                 return response
             msg = f"Unexpected response type: {type(response)}"
             logger.error(msg)
@@ -227,6 +261,7 @@ class GriptapeCloudApiMixin:
     def _delete_bucket(self, bucket_id: str) -> None:
         try:
             delete_bucket(bucket_id=bucket_id, client=self.gtc_client)
+            BucketListCache.invalidate()
         except Exception as e:
             logger.error("Error deleting bucket: %s", e)
             raise
@@ -259,12 +294,30 @@ class GriptapeCloudApiMixin:
             logger.error("Error getting assistant run: %s", e)
             raise
 
-    def _create_assistant_run(self, assistant_id: str, args: list[str]) -> CreateAssistantRunResponseContent:
+    def _create_thread(self, name: str) -> CreateThreadResponseContent:
+        try:
+            response = create_thread(
+                body=CreateThreadRequestContent(name=name),
+                client=self.gtc_client,
+            )
+            if isinstance(response, CreateThreadResponseContent):
+                return response
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error creating thread: %s", e)
+            raise
+
+    def _create_assistant_run(
+        self, assistant_id: str, args: list[str], thread_id: str | None = None
+    ) -> CreateAssistantRunResponseContent:
         try:
             response = create_assistant_run(
                 assistant_id=assistant_id,
                 body=CreateAssistantRunRequestContent(
                     args=args,
+                    thread_id=thread_id or UNSET,
                 ),
                 client=self.gtc_client,
             )
@@ -322,6 +375,7 @@ class GriptapeCloudApiMixin:
                 ),
             )
             if isinstance(response, CreateAssetResponseContent):
+                AssetIndexCache.invalidate(bucket_id)
                 return response
             msg = f"Unexpected response type: {type(response)}"
             logger.error(msg)
@@ -331,7 +385,12 @@ class GriptapeCloudApiMixin:
             raise
 
     def _create_asset_url(
-        self, asset_name: str, bucket_id: str, operation: AssertUrlOperation = AssertUrlOperation.GET
+        self,
+        asset_name: str,
+        bucket_id: str,
+        operation: AssertUrlOperation = AssertUrlOperation.GET,
+        *,
+        log_errors: bool = True,
     ) -> CreateAssetUrlResponseContent:
         try:
             response = create_asset_url(
@@ -348,9 +407,57 @@ class GriptapeCloudApiMixin:
             logger.error(msg)
             raise TypeError(msg)  # noqa: TRY301
         except Exception as e:
-            logger.error("Error creating asset URL: %s", e)
+            # Callers that expect a failure and retry, like early upload URL minting, log it themselves.
+            if log_errors:
+                logger.error("Error creating asset URL: %s", e)
+            raise
+
+    def _list_assets(
+        self, bucket_id: str, prefix: str | None = None, page: int = 1, page_size: int = 100
+    ) -> ListAssetsResponseContent:
+        try:
+            response = list_assets(
+                bucket_id=bucket_id,
+                client=self.gtc_client,
+                prefix=prefix or UNSET,
+                page=page,
+                page_size=page_size,
+            )
+            if isinstance(response, ListAssetsResponseContent):
+                return response
+            msg = f"Unexpected response type: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)  # noqa: TRY301
+        except Exception as e:
+            logger.error("Error listing assets: %s", e)
+            raise
+
+    def _delete_asset(self, bucket_id: str, asset_name: str) -> None:
+        try:
+            delete_asset(bucket_id=bucket_id, name=asset_name, client=self.gtc_client)
+            AssetUrlCache.invalidate(bucket_id, asset_name)
+            AssetIndexCache.invalidate(bucket_id)
+        except Exception as e:
+            logger.error("Error deleting asset: %s", e)
             raise
 
+    def _get_cached_asset_url(
+        self,
+        asset_name: str,
+        bucket_id: str,
+        operation: AssertUrlOperation = AssertUrlOperation.GET,
+        *,
+        log_errors: bool = True,
+    ) -> CreateAssetUrlResponseContent:
+        """Return a presigned asset URL from the process-wide cache, minting one if none is valid."""
+        # The cache outlives this node, so it only holds a weak proxy to it for refreshes.
+        api = weakref.proxy(self)
+
+        def create() -> CreateAssetUrlResponseContent:
+            return api._create_asset_url(asset_name, bucket_id, operation, log_errors=log_errors)
+
+        return AssetUrlCache.get_or_create(bucket_id, asset_name, operation, create)
+
     def _list_structures(self) -> ListStructuresResponseContent:
         try:
             response = list_structures(
@@ -397,6 +504,13 @@ class GriptapeCloudApiMixin:
             logger.error("Error getting structure run: %s", e)
             raise
 
+    def _cancel_structure_run(self, structure_run_id: str) -> None:
+        try:
+            cancel_structure_run(structure_run_id=structure_run_id, client=self.gtc_client)
+        except Exception as e:
+            logger.error("Error cancelling structure run: %s", e)
+            raise
+
     def _get_structure_run_bad_statuses(self) -> list[str]:
         return [StructureRunStatus.FAILED, StructureRunStatus.CANCELLED, StructureRunStatus.ERROR]
 
@@ -425,12 +539,14 @@ class GriptapeCloudApiMixin:
         while not run_completed:
             list_events_response = self._list_structure_run_events(structure_run_id=structure_run_id, offset=offset)
             offset = list_events_response.next_offset
-            for event in list_events_response.events:
-                if event.type_ == "StructureRunCompleted" and event.origin == "SYSTEM":
-                    run_completed = True
+            if any(self._is_structure_run_completed_event(event) for event in list_events_response.events):
+                run_completed = True
             yield list_events_response.events
             time.sleep(0.5)
 
+    def _is_structure_run_completed_event(self, event: EventDetail) -> bool:
+        return event.type_ == "StructureRunCompleted" and event.origin == "SYSTEM"
+
     def _is_deployment_ready(self, deployment: GetDeploymentResponseContent | StructureDeploymentDetail) -> bool:
         return deployment.status in [
             DeploymentStatus.SUCCEEDED,
@@ -14,13 +14,18 @@ from griptape_cloud.publish_workflow.parameters.griptape_cloud_structure_config_
 from griptape_cloud.publish_workflow.parameters.griptape_cloud_webhook_config_parameter import (
     GriptapeCloudWebhookConfigParameter,
 )
+from griptape_cloud.utils.run_admission_scheduler import RunAdmissionScheduler, RunPriority
+from griptape_cloud.utils.run_timing import RunTimingTracker
 from griptape_nodes.exe_types.core_types import Parameter, ParameterGroup, ParameterMessage, ParameterMode
 from griptape_nodes.exe_types.node_types import AsyncResult, SuccessFailureNode
 from griptape_nodes.exe_types.param_components.execution_status_component import ExecutionStatusComponent
+from griptape_nodes.traits.options import Options
 
 logger = logging.getLogger("griptape_nodes")
 logger.setLevel(logging.INFO)
 
+RUN_TIMING_METRIC = "published_workflow_run.timing"
+
 
 class PublishedWorkflowExecutionStatus(StrEnum):
     """Status enum for published workflow execution."""
@@ -96,6 +101,14 @@ class GriptapeCloudPublishedWorkflow(SuccessFailureNode, BaseGriptapeCloudNode):
                 allowed_modes={ParameterMode.OUTPUT},
             )
 
+            Parameter(
+                name="timing",
+                output_type="dict",
+                default_value=None,
+                tooltip="Breakdown of the time the structure run spent queued, booting and executing",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+
         structure_run_details_group.ui_options = {"hide": False, "collapsed": True}
         self.add_node_element(structure_run_details_group)
 
@@ -113,6 +126,26 @@ class GriptapeCloudPublishedWorkflow(SuccessFailureNode, BaseGriptapeCloudNode):
         events_group.ui_options = {"hide": False, "collapsed": True}
         self.add_node_element(events_group)
 
+        with ParameterGroup(name="Scheduling") as scheduling_group:
+            Parameter(
+                name="run_priority",
+                type="str",
+                default_value=RunPriority.INTERACTIVE.value,
+                tooltip="Admission priority. Interactive runs are dispatched before batch runs.",
+                traits={Options(choices=[priority.value for priority in RunPriority])},
+            )
+
+            Parameter(
+                name="max_concurrent_runs",
+                type="int",
+                default_value=0,
+                tooltip=(
+                    "Maximum number of in-flight runs of this structure started by this engine. Set to 0 for no limit."
+                ),
+            )
+        scheduling_group.ui_options = {"hide": False, "collapsed": True}
+        self.add_node_element(scheduling_group)
+
         # Add status parameters
         self.status_component = ExecutionStatusComponent(
             self,
@@ -129,8 +162,9 @@ class GriptapeCloudPublishedWorkflow(SuccessFailureNode, BaseGriptapeCloudNode):
         params = []
         params.extend(GriptapeCloudStructureConfigParameter.get_param_names())
         params.extend(GriptapeCloudWebhookConfigParameter.get_param_names())
-        params.extend(["structure_run_id"])
+        params.extend(["structure_run_id", "timing"])
         params.extend(["include_events", "events"])
+        params.extend(["run_priority", "max_concurrent_runs"])
         params.extend(["was_successful", "result_details"])
         params.extend(["exec_in", "exec_out", "failed"])
         return params
@@ -279,19 +313,29 @@ class GriptapeCloudPublishedWorkflow(SuccessFailureNode, BaseGriptapeCloudNode):
                 self.has_successful_deployment = True
 
             # Create and run the structure
-            structure_run = self._create_structure_run(structure_id=self.structure_id, args=args)
-
-            # Poll for events if requested
-            for events in self._poll_structure_run_events(structure_run_id=structure_run.structure_run_id):
-                self.append_value_to_parameter(
-                    parameter_name=self.status_component._result_details.name,
-                    value="\n".join(f"Structure Run Event: {event.payload!s}" for event in events),
-                )
-                if include_events:
-                    self.append_value_to_parameter("events", "\n".join(str(event.payload) for event in events))
+            timing = RunTimingTracker(metric_prefix=RUN_TIMING_METRIC)
+            with RunAdmissionScheduler.get_instance().admit(
+                key=self.structure_id,
+                priority=RunPriority(self.get_parameter_value("run_priority")),
+                max_in_flight_for_key=self.get_parameter_value("max_concurrent_runs"),
+            ):
+                timing.mark_submitted()
+                structure_run = self._create_structure_run(structure_id=self.structure_id, args=args)
+
+                # Poll for events if requested
+                for events in self._poll_structure_run_events(structure_run_id=structure_run.structure_run_id):
+                    timing.observe_events(events)
+                    self.append_value_to_parameter(
+                        parameter_name=self.status_component._result_details.name,
+                        value="\n".join(f"Structure Run Event: {event.payload!s}" for event in events),
+                    )
+                    if include_events:
+                        self.append_value_to_parameter("events", "\n".join(str(event.payload) for event in events))
 
             # Get the final structure run result
             structure_run = self._get_structure_run(structure_run_id=structure_run.structure_run_id)
+            timing.observe_run(structure_run)
+            self.parameter_output_values["timing"] = timing.emit()
 
             if structure_run.status in self._get_structure_run_bad_statuses():
                 details = f"Structure run ended with status: {structure_run.status}"
@@ -35,8 +35,9 @@ from griptape_cloud_client.models.structure_code_type_1 import StructureCodeType
 from griptape_cloud_client.models.update_structure_request_content import UpdateStructureRequestContent
 from griptape_cloud_client.models.update_structure_response_content import UpdateStructureResponseContent
 from griptape_cloud_client.models.webhook_input import WebhookInput
-from httpx import Client
 
+from griptape_cloud.assets.asset_transfer import put_to_presigned_url
+from griptape_cloud.assets.upload_pipeline import ControlPlaneExecutor
 from griptape_cloud.mixins.griptape_cloud_api_mixin import GriptapeCloudApiMixin
 from griptape_cloud.publish_workflow import GRIPTAPE_CLOUD_LIBRARY_CONFIG_KEY
 from griptape_cloud.publish_workflow.griptape_cloud_start_flow import GriptapeCloudStartFlow
@@ -108,7 +109,6 @@ class GriptapeCloudPublisher(GriptapeCloudApiMixin):
     ) -> None:
         self._workflow_name = workflow_name
         self._published_workflow_file_name = published_workflow_file_name
-        self._client = Client()
         self._gtc_client = AuthenticatedClient(
             base_url=self._get_base_url(),
             token=self._get_secret("GT_CLOUD_API_KEY"),
@@ -367,7 +367,7 @@ class GriptapeCloudPublisher(GriptapeCloudApiMixin):
 
         return workflow_input
 
-    def _upload_file_to_data_lake(self, name: str, value: bytes, bucket_id: str) -> None:
+    def _create_data_lake_asset(self, name: str, bucket_id: str) -> CreateAssetResponseContent:
         create_asset_response = create_asset(
             client=self._gtc_client,
             bucket_id=bucket_id,
@@ -380,7 +380,9 @@ class GriptapeCloudPublisher(GriptapeCloudApiMixin):
             msg = self.format_error_message_for_response(msg, create_asset_response)
             logger.error(msg)
             raise TypeError(msg)
+        return create_asset_response
 
+    def _create_data_lake_asset_url(self, name: str, bucket_id: str) -> CreateAssetUrlResponseContent:
         create_asset_url_response = create_asset_url(
             client=self._gtc_client,
             bucket_id=bucket_id,
@@ -392,15 +394,26 @@ class GriptapeCloudPublisher(GriptapeCloudApiMixin):
             msg = self.format_error_message_for_response(msg, create_asset_url_response)
             logger.error(msg)
             raise TypeError(msg)
-        url = create_asset_url_response.url
-        headers = create_asset_url_response.headers
+        return create_asset_url_response
+
+    def _upload_file_to_data_lake(self, name: str, value: bytes, bucket_id: str) -> None:
+        # Mint the URL while the asset is being created rather than after it.
+        url_future = ControlPlaneExecutor.submit(self._create_data_lake_asset_url, name, bucket_id)
+        self._create_data_lake_asset(name, bucket_id)
+        try:
+            create_asset_url_response = url_future.result()
+        except Exception:
+            # The URL may only be mintable once the asset exists, which it now does.
+            create_asset_url_response = self._create_data_lake_asset_url(name, bucket_id)
         try:
-            response = self._client.put(
-                url=url,
-                headers=headers.to_dict(),
-                content=value,
+            # The package is in memory, so it carries a Content-MD5 the store checks on receipt, and its ETag is
+            # checked afterwards.
+            put_to_presigned_url(
+                create_asset_url_response.url,
+                create_asset_url_response.headers.to_dict(),
+                lambda: value,
+                verify_integrity=True,
             )
-            response.raise_for_status()
         except Exception:
             msg = "Failed to upload file to data lake"
             logger.exception(msg)
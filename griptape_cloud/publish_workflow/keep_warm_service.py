@@ -0,0 +1,129 @@
+import json
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from griptape_cloud_client.client import AuthenticatedClient
+
+from griptape_cloud.mixins.griptape_cloud_api_mixin import GriptapeCloudApiMixin
+from griptape_cloud.utils.metrics_sink import MetricsSink
+
+logger = logging.getLogger("griptape_nodes")
+
+# Must match KEEP_WARM_PING_INPUT_KEY in structure.py
+KEEP_WARM_PING_INPUT_KEY = "griptape_cloud_keep_warm_ping"
+DEFAULT_KEEP_WARM_INTERVAL_SECONDS = 300.0
+DEFAULT_MAX_PINGS_PER_HOUR = 60
+DEFAULT_COLD_AFTER_SECONDS = 900.0
+BUDGET_WINDOW_SECONDS = 3600.0
+KEEP_WARM_LATENCY_METRIC = "keep_warm.latency_seconds"
+KEEP_WARM_PINGS_METRIC = "keep_warm.pings"
+KEEP_WARM_SKIPPED_METRIC = "keep_warm.skipped_over_budget"
+
+
+@dataclass
+class KeepWarmTarget:
+    """A published structure to keep warm, pinged every `interval_seconds`."""
+
+    structure_id: str
+    interval_seconds: float = DEFAULT_KEEP_WARM_INTERVAL_SECONDS
+    next_ping_at: float = field(default=0.0, compare=False)
+    last_ping_at: float | None = field(default=None, compare=False)
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | str) -> "KeepWarmTarget":
+        if isinstance(config, str):
+            return cls(structure_id=config)
+        return cls(
+            structure_id=config["structure_id"],
+            interval_seconds=float(config.get("interval_seconds", DEFAULT_KEEP_WARM_INTERVAL_SECONDS)),
+        )
+
+
+class KeepWarmService(GriptapeCloudApiMixin):
+    """Background service that periodically pings published structures to keep their containers warm.
+
+    Pings run the structure with a keep-warm input that `structure.py` recognizes and exits on before
+    loading any libraries. A sliding one hour budget caps the total number of pings across all targets.
+    """
+
+    def __init__(
+        self,
+        gtc_client: AuthenticatedClient,
+        targets: list[KeepWarmTarget],
+        *,
+        max_pings_per_hour: int = DEFAULT_MAX_PINGS_PER_HOUR,
+        cold_after_seconds: float = DEFAULT_COLD_AFTER_SECONDS,
+    ) -> None:
+        self.gtc_client = gtc_client
+        self.targets = targets
+        self.max_pings_per_hour = max_pings_per_hour
+        self.cold_after_seconds = cold_after_seconds
+        self._ping_times: deque[float] = deque()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="griptape-cloud-keep-warm", daemon=True)
+        self._thread.start()
+        logger.info("Started keep-warm service for %d structure(s)", len(self.targets))
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set() and self.targets:
+            target = min(self.targets, key=lambda t: t.next_ping_at)
+            wait_seconds = target.next_ping_at - time.monotonic()
+            if wait_seconds > 0 and self._stop_event.wait(wait_seconds):
+                return
+
+            target.next_ping_at = time.monotonic() + target.interval_seconds
+            if not self._consume_budget():
+                MetricsSink.increment(KEEP_WARM_SKIPPED_METRIC)
+                logger.warning("Keep-warm budget exhausted, skipping ping for structure %s", target.structure_id)
+                continue
+
+            try:
+                self._ping(target)
+            except Exception as e:
+                logger.error("Error pinging structure %s to keep warm: %s", target.structure_id, e)
+
+    def _consume_budget(self) -> bool:
+        now = time.monotonic()
+        while self._ping_times and now - self._ping_times[0] > BUDGET_WINDOW_SECONDS:
+            self._ping_times.popleft()
+        if len(self._ping_times) >= self.max_pings_per_hour:
+            return False
+        self._ping_times.append(now)
+        return True
+
+    def _ping(self, target: KeepWarmTarget) -> float:
+        started_at = time.monotonic()
+        is_cold = target.last_ping_at is None or started_at - target.last_ping_at > self.cold_after_seconds
+
+        structure_run = self._create_structure_run(
+            structure_id=target.structure_id,
+            args=["-i", json.dumps({KEEP_WARM_PING_INPUT_KEY: True})],
+        )
+        for _ in self._poll_structure_run_events(structure_run_id=structure_run.structure_run_id):
+            if self._stop_event.is_set():
+                break
+
+        latency = time.monotonic() - started_at
+        target.last_ping_at = time.monotonic()
+        temperature = "cold" if is_cold else "warm"
+        MetricsSink.increment(KEEP_WARM_PINGS_METRIC)
+        MetricsSink.observe(f"{KEEP_WARM_LATENCY_METRIC}.{temperature}", latency)
+        MetricsSink.observe(f"{KEEP_WARM_LATENCY_METRIC}.{temperature}.{target.structure_id}", latency)
+        logger.info("Keep-warm ping for structure %s took %.2fs (%s)", target.structure_id, latency, temperature)
+        return latency
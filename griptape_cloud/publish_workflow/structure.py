@@ -11,6 +11,8 @@ LIBRARIES = ["REPLACE_LIBRARIES"]
 PICKLE_DEFAULT = "REPLACE_PICKLE_DEFAULT"
 WEBHOOK_MODE_ARGS_COUNT = 4
 START_FLOW_NODE_NAME = "Griptape Cloud Start Flow"
+# Must match KEEP_WARM_PING_INPUT_KEY in keep_warm_service.py
+KEEP_WARM_PING_INPUT_KEY = "griptape_cloud_keep_warm_ping"
 
 
 logging.basicConfig(
@@ -115,6 +117,11 @@ def _parse_argparse_args() -> tuple[dict, bool]:
     return flow_input, pickle_result
 
 
+def _is_keep_warm_ping(flow_input: dict) -> bool:
+    """Whether the flow input is a keep-warm ping that should exit without running the workflow."""
+    return flow_input.get(KEEP_WARM_PING_INPUT_KEY) is True
+
+
 if __name__ == "__main__":
     if len(sys.argv) == WEBHOOK_MODE_ARGS_COUNT and not any(arg.startswith("-") for arg in sys.argv[1:]):
         raw_body = sys.argv[1]
@@ -124,6 +131,11 @@ if __name__ == "__main__":
     else:
         flow_input, pickle_result = _parse_argparse_args()
 
+    if _is_keep_warm_ping(flow_input):
+        # Exit before importing the workflow or registering libraries so pings stay cheap.
+        logger.info("Received keep-warm ping, exiting.")
+        sys.exit(0)
+
     from structure_workflow_executor import StructureWorkflowExecutor
     from workflow import execute_workflow  # type: ignore[attr-defined]
 
@@ -1,11 +1,18 @@
 import logging
+import time
+from contextlib import AbstractContextManager, ExitStack
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, cast
 
 from griptape_cloud_client.types import Unset
 
 from griptape_cloud.base.base_griptape_cloud_node import BaseGriptapeCloudNode
+from griptape_cloud.utils.metrics_sink import MetricsSink
+from griptape_cloud.utils.run_admission_scheduler import RunAdmissionScheduler, RunPriority
+from griptape_cloud.utils.run_timing import RunTimingTracker, is_run_output_event
 from griptape_nodes.exe_types.core_types import Parameter, ParameterGroup, ParameterList, ParameterMode
 from griptape_nodes.exe_types.node_types import AsyncResult, ControlNode
+from griptape_nodes.traits.options import Options
 
 if TYPE_CHECKING:
     from griptape_cloud_client.models.structure_detail import StructureDetail
@@ -13,6 +20,24 @@ if TYPE_CHECKING:
 logger = logging.getLogger("griptape_nodes")
 logger.setLevel(logging.INFO)
 
+DEFAULT_HEDGE_AFTER_SECONDS = 30.0
+HEDGE_PERCENTILE = 95.0
+HEDGE_MIN_SAMPLES = 20
+FIRST_EVENT_METRIC = "structure_run.first_event_seconds"
+HEDGE_FIRED_METRIC = "structure_run.hedge.fired"
+HEDGE_WON_METRIC = "structure_run.hedge.won"
+RUN_TIMING_METRIC = "structure_run.timing"
+
+
+@dataclass
+class _StructureRunState:
+    structure_run_id: str
+    submitted_at: float
+    timing: RunTimingTracker
+    is_hedge: bool = False
+    offset: float | None = None
+    has_first_event: bool = False
+
 
 class RunStructure(BaseGriptapeCloudNode, ControlNode):
     def __init__(self, **kwargs) -> None:
@@ -63,6 +88,16 @@ class RunStructure(BaseGriptapeCloudNode, ControlNode):
             )
         )
 
+        self.add_parameter(
+            Parameter(
+                name="timing",
+                output_type="dict",
+                default_value=None,
+                tooltip="Breakdown of the time the structure run spent queued, booting and executing",
+                allowed_modes={ParameterMode.OUTPUT},
+            )
+        )
+
         with ParameterGroup(name="Events") as events_group:
             Parameter(name="include_events", type="bool", default_value=False, tooltip="Include events details.")
 
@@ -76,6 +111,49 @@ class RunStructure(BaseGriptapeCloudNode, ControlNode):
         events_group.ui_options = {"hide": True}  # Hide the events group by default.
         self.add_node_element(events_group)
 
+        with ParameterGroup(name="Hedging") as hedging_group:
+            Parameter(
+                name="enable_hedging",
+                type="bool",
+                default_value=False,
+                tooltip=(
+                    "Start a duplicate run if the first run has not emitted an event in time, "
+                    "and keep whichever completes first."
+                ),
+            )
+
+            Parameter(
+                name="hedge_after_seconds",
+                type="float",
+                default_value=0.0,
+                tooltip=(
+                    "Seconds to wait for the first event before starting a duplicate run. "
+                    "Set to 0 to use the observed p95 time to first event for this structure."
+                ),
+            )
+        hedging_group.ui_options = {"hide": True}  # Hide the hedging group by default.
+        self.add_node_element(hedging_group)
+
+        with ParameterGroup(name="Scheduling") as scheduling_group:
+            Parameter(
+                name="run_priority",
+                type="str",
+                default_value=RunPriority.INTERACTIVE.value,
+                tooltip="Admission priority. Interactive runs are dispatched before batch runs.",
+                traits={Options(choices=[priority.value for priority in RunPriority])},
+            )
+
+            Parameter(
+                name="max_concurrent_runs",
+                type="int",
+                default_value=0,
+                tooltip=(
+                    "Maximum number of in-flight runs of this structure started by this engine. Set to 0 for no limit."
+                ),
+            )
+        scheduling_group.ui_options = {"hide": True}  # Hide the scheduling group by default.
+        self.add_node_element(scheduling_group)
+
     def validate_before_workflow_run(self) -> list[Exception] | None:
         exceptions = super().validate_before_workflow_run() or []
 
@@ -98,20 +176,129 @@ class RunStructure(BaseGriptapeCloudNode, ControlNode):
         # if there are exceptions, they will display when the user tries to run the flow with the node.
         return exceptions if exceptions else None
 
+    def _get_hedge_after_seconds(self, structure_id: str) -> float:
+        hedge_after_seconds = self.get_parameter_value("hedge_after_seconds")
+        if hedge_after_seconds:
+            return float(hedge_after_seconds)
+
+        metric_name = f"{FIRST_EVENT_METRIC}.{structure_id}"
+        if MetricsSink.get_sample_count(metric_name) < HEDGE_MIN_SAMPLES:
+            return DEFAULT_HEDGE_AFTER_SECONDS
+        return MetricsSink.percentile(metric_name, HEDGE_PERCENTILE) or DEFAULT_HEDGE_AFTER_SECONDS
+
+    def _start_structure_run(self, structure_id: str, args: list[str], *, is_hedge: bool = False) -> _StructureRunState:
+        timing = RunTimingTracker(metric_prefix=RUN_TIMING_METRIC)
+        timing.mark_submitted()
+        structure_run = self._create_structure_run(structure_id=structure_id, args=args)
+        return _StructureRunState(
+            structure_run_id=structure_run.structure_run_id,
+            submitted_at=time.monotonic(),
+            timing=timing,
+            is_hedge=is_hedge,
+        )
+
+    def _run_structure(
+        self, structure_id: str, args: list[str], *, include_events: bool, hedge_slots: ExitStack
+    ) -> _StructureRunState:
+        """Run the structure, hedging with a duplicate run if enabled, and return the state of the winning run.
+
+        The hedged run is only started once it is admitted, and holds its admission slot in `hedge_slots`.
+        """
+        enable_hedging = self.get_parameter_value("enable_hedging")
+        hedge_after_seconds = self._get_hedge_after_seconds(structure_id)
+        runs = [self._start_structure_run(structure_id, args)]
+        hedge_fired = False
+
+        while True:
+            for run in list(runs):
+                list_events_response = self._list_structure_run_events(
+                    structure_run_id=run.structure_run_id, offset=run.offset
+                )
+                run.offset = list_events_response.next_offset
+                events = list_events_response.events
+                run.timing.observe_events(events)
+
+                if not run.has_first_event and any(is_run_output_event(event) for event in events):
+                    # SYSTEM lifecycle events are emitted while the run is still queued or booting.
+                    run.has_first_event = True
+                    MetricsSink.observe(f"{FIRST_EVENT_METRIC}.{structure_id}", time.monotonic() - run.submitted_at)
+                if include_events and events:
+                    self.append_value_to_parameter("events", "\n".join(str(event.payload) for event in events))
+
+                if not any(self._is_structure_run_completed_event(event) for event in events):
+                    continue
+
+                structure_run = self._get_structure_run(structure_run_id=run.structure_run_id)
+                if structure_run.status in self._get_structure_run_bad_statuses() and len(runs) > 1:
+                    # Let the remaining run finish instead of surfacing this failure.
+                    logger.warning("Structure run %s ended with status %s", run.structure_run_id, structure_run.status)
+                    runs.remove(run)
+                    continue
+
+                for loser in runs:
+                    if loser is not run:
+                        try:
+                            self._cancel_structure_run(loser.structure_run_id)
+                        except Exception as e:
+                            # The winning run's output is still good.
+                            logger.error("Error cancelling structure run %s: %s", loser.structure_run_id, e)
+                if run.is_hedge:
+                    MetricsSink.increment(HEDGE_WON_METRIC)
+                    logger.info("Hedged structure run %s completed first", run.structure_run_id)
+                return run
+
+            if (
+                enable_hedging
+                and not hedge_fired
+                and not any(run.has_first_event for run in runs)
+                and time.monotonic() - runs[0].submitted_at > hedge_after_seconds
+                and self._try_admit_hedge(structure_id, hedge_slots)
+            ):
+                hedge_fired = True
+                MetricsSink.increment(HEDGE_FIRED_METRIC)
+                runs.append(self._start_structure_run(structure_id, args, is_hedge=True))
+                logger.info(
+                    "Structure run %s emitted no events after %.1fs, started hedged run %s",
+                    runs[0].structure_run_id,
+                    hedge_after_seconds,
+                    runs[-1].structure_run_id,
+                )
+
+            time.sleep(0.5)
+
+    def _admit(self, structure_id: str, *, blocking: bool = True) -> AbstractContextManager[bool]:
+        return RunAdmissionScheduler.get_instance().admit(
+            key=structure_id,
+            priority=RunPriority(self.get_parameter_value("run_priority")),
+            max_in_flight_for_key=self.get_parameter_value("max_concurrent_runs"),
+            blocking=blocking,
+        )
+
+    def _try_admit_hedge(self, structure_id: str, hedge_slots: ExitStack) -> bool:
+        """Try to admit a hedged run without waiting, holding its slot in `hedge_slots` only if it was admitted."""
+        admission = self._admit(structure_id, blocking=False)
+        if not admission.__enter__():
+            admission.__exit__(None, None, None)
+            return False
+        hedge_slots.push(admission.__exit__)
+        return True
+
     def _process(self) -> None:
         include_events = self.get_parameter_value("include_events")
         structure = cast("StructureDetail", self.get_parameter_value("structure"))
         args = self.get_parameter_value("args")
-        structure_run = self._create_structure_run(structure_id=structure.structure_id, args=args)
+        with self._admit(structure.structure_id), ExitStack() as hedge_slots:
+            run = self._run_structure(
+                structure.structure_id, args, include_events=include_events, hedge_slots=hedge_slots
+            )
 
         output: Any | None = None
 
-        for events in self._poll_structure_run_events(structure_run_id=structure_run.structure_run_id):
-            if include_events:
-                self.append_value_to_parameter("events", "\n".join(str(event.payload) for event in events))
-
-        structure_run = self._get_structure_run(structure_run_id=structure_run.structure_run_id)
+        structure_run = self._get_structure_run(structure_run_id=run.structure_run_id)
+        run.timing.observe_run(structure_run)
         output = structure_run.output if not isinstance(structure_run.output, Unset) else None
+        self.parameter_output_values["structure_run_id"] = run.structure_run_id
+        self.parameter_output_values["timing"] = run.timing.emit()
         self.parameter_output_values["output"] = output
 
     def process(
@@ -0,0 +1 @@
+"""Shared utilities for the Griptape Cloud Library."""
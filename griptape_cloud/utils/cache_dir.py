@@ -0,0 +1,12 @@
+import os
+from pathlib import Path
+
+CACHE_DIR_ENV_VAR = "GT_CLOUD_CACHE_DIR"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "griptape_cloud"
+
+
+def get_cache_dir(*parts: str) -> Path:
+    """Return (and create) a directory for local Griptape Cloud Library state, overridable with GT_CLOUD_CACHE_DIR."""
+    cache_dir = Path(os.getenv(CACHE_DIR_ENV_VAR) or DEFAULT_CACHE_DIR).joinpath(*parts)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
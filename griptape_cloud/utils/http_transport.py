@@ -0,0 +1,226 @@
+import asyncio
+import contextlib
+import logging
+import os
+import threading
+from collections.abc import AsyncIterator, Coroutine, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar, TypeVar
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+MAX_CONNECTIONS_PER_HOST_ENV_VAR = "GT_CLOUD_HTTP_MAX_CONNECTIONS_PER_HOST"
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 32
+DEFAULT_HTTP_TIMEOUT = 300
+KEEPALIVE_EXPIRY_SECONDS = 30.0
+BODY_READ_BLOCK_SIZE = 1024 * 1024
+# Threads that pull request bodies from file-like readers, so hashing and compression stay off the event loop.
+BODY_READ_WORKERS = 64
+
+T = TypeVar("T")
+
+
+def _is_http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+async def _anext_or_none(iterator: AsyncIterator[T]) -> T | None:
+    return await anext(iterator, None)
+
+
+class TransportStream:
+    """Blocking view of a streamed response from `HttpTransport.stream`. Close it, or use it as a context manager."""
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._response = response
+        self._raw_iterator: AsyncIterator[bytes] | None = None
+
+    @property
+    def status_code(self) -> int:
+        return self._response.status_code
+
+    @property
+    def headers(self) -> httpx.Headers:
+        return self._response.headers
+
+    def raise_for_status(self) -> None:
+        self._response.raise_for_status()
+
+    def iter_raw(self, chunk_size: int | None = None) -> Iterator[bytes]:
+        """Yield the body as sent, without decoding its content encoding."""
+        self._raw_iterator = self._response.aiter_raw(chunk_size)
+        while (block := HttpTransport.run(_anext_or_none(self._raw_iterator))) is not None:
+            yield block
+
+    def read(self) -> bytes:
+        return HttpTransport.run(self._response.aread())
+
+    def close(self) -> None:
+        HttpTransport.run(self._aclose())
+
+    async def _aclose(self) -> None:
+        if self._raw_iterator is not None and hasattr(self._raw_iterator, "aclose"):
+            # When another thread is still reading the body, closing the response below ends its read instead.
+            with contextlib.suppress(RuntimeError):
+                await self._raw_iterator.aclose()
+        await self._response.aclose()
+
+    def __enter__(self) -> "TransportStream":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+class HttpTransport:
+    """Process-wide async HTTP transport for presigned URL data transfers, with a blocking facade for worker threads.
+
+    A single event loop thread drives one pooled `httpx.AsyncClient` per host, limited to
+    `GT_CLOUD_HTTP_MAX_CONNECTIONS_PER_HOST` connections. With the 'h2' package installed requests
+    are multiplexed over HTTP/2, so concurrent transfers share a few connections; otherwise they
+    reuse keep-alive HTTP/1.1 connections. Under HTTP/1.1 the limit must leave room for every
+    transfer a caller holds open at once (e.g. a replication's GET and PUT), or they wait on each other.
+    """
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _loop: ClassVar[asyncio.AbstractEventLoop | None] = None
+    _thread: ClassVar[threading.Thread | None] = None
+    # Only touched from the event loop thread.
+    _clients: ClassVar[dict[str, httpx.AsyncClient]] = {}
+
+    @classmethod
+    def request(
+        cls,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, Any] | None = None,
+        content: Any = None,
+        timeout: float = DEFAULT_HTTP_TIMEOUT,
+    ) -> httpx.Response:
+        """Send a request and read its whole response.
+
+        `content` may be bytes-like or a file-like reader, which is streamed with a Content-Length
+        taken from its `__len__`.
+        """
+        return cls.run(cls._send(method, url, headers, content, timeout, stream=False))
+
+    @classmethod
+    def stream(
+        cls, method: str, url: str, *, headers: dict[str, Any] | None = None, timeout: float = DEFAULT_HTTP_TIMEOUT
+    ) -> TransportStream:
+        """Send a request and return its response with the body still to be streamed."""
+        return TransportStream(cls.run(cls._send(method, url, headers, None, timeout, stream=True)))
+
+    @classmethod
+    def run(cls, coroutine: Coroutine[Any, Any, T]) -> T:
+        loop = cls._get_loop()
+        if threading.current_thread() is cls._thread:
+            coroutine.close()
+            msg = "The HTTP transport cannot be waited on from its own event loop thread."
+            raise RuntimeError(msg)
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        with cls._lock:
+            loop, thread = cls._loop, cls._thread
+            cls._loop = None
+            cls._thread = None
+        if loop is None or thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(cls._aclose_clients(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    @classmethod
+    def _get_loop(cls) -> asyncio.AbstractEventLoop:
+        with cls._lock:
+            if cls._loop is None:
+                loop = asyncio.new_event_loop()
+                loop.set_default_executor(
+                    ThreadPoolExecutor(max_workers=BODY_READ_WORKERS, thread_name_prefix="griptape-cloud-http-body")
+                )
+                cls._thread = threading.Thread(target=loop.run_forever, name="griptape-cloud-http", daemon=True)
+                cls._thread.start()
+                cls._loop = loop
+            return cls._loop
+
+    @classmethod
+    def _get_client(cls, url: str) -> httpx.AsyncClient:
+        parts = urlsplit(url)
+        host = f"{parts.scheme}://{parts.netloc}"
+        client = cls._clients.get(host)
+        if client is None:
+            max_connections = int(os.getenv(MAX_CONNECTIONS_PER_HOST_ENV_VAR, str(DEFAULT_MAX_CONNECTIONS_PER_HOST)))
+            http2 = _is_http2_available()
+            client = httpx.AsyncClient(
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                    keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+                ),
+            )
+            cls._clients[host] = client
+            logger.debug(
+                "Opened HTTP/%s connection pool to %s with up to %d connections",
+                "2" if http2 else "1.1",
+                host,
+                max_connections,
+            )
+        return client
+
+    @classmethod
+    async def _send(
+        cls,
+        method: str,
+        url: str,
+        headers: dict[str, Any] | None,
+        content: Any,
+        timeout: float,
+        *,
+        stream: bool,
+    ) -> httpx.Response:
+        client = cls._get_client(url)
+        headers = dict(headers or {})
+        if content is not None and not isinstance(content, bytes):
+            if isinstance(content, bytearray | memoryview):
+                # Stream slices of the buffer, a bytes copy would double the peak memory of a large body.
+                content = memoryview(content).cast("B")
+                body = cls._aiter_buffer(content)
+            else:
+                body = cls._aiter_body(content)
+            if hasattr(content, "__len__") and not any(name.lower() == "content-length" for name in headers):
+                # Presigned PUTs need the length up front, not a chunked body.
+                headers["Content-Length"] = str(len(content))
+            content = body
+        request = client.build_request(method, url, headers=headers, content=content, timeout=timeout)
+        return await client.send(request, stream=stream)
+
+    @staticmethod
+    async def _aiter_body(body: Any) -> AsyncIterator[bytes]:
+        loop = asyncio.get_running_loop()
+        while block := await loop.run_in_executor(None, body.read, BODY_READ_BLOCK_SIZE):
+            yield block
+
+    @staticmethod
+    async def _aiter_buffer(buffer: memoryview) -> AsyncIterator[memoryview]:
+        for offset in range(0, len(buffer), BODY_READ_BLOCK_SIZE):
+            yield buffer[offset : offset + BODY_READ_BLOCK_SIZE]
+
+    @classmethod
+    async def _aclose_clients(cls) -> None:
+        clients = list(cls._clients.values())
+        cls._clients.clear()
+        for client in clients:
+            await client.aclose()
@@ -0,0 +1,66 @@
+import logging
+import math
+import threading
+from collections import defaultdict, deque
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+MAX_SAMPLES_PER_METRIC = 1000
+
+
+class MetricsSink:
+    """Process-wide, in-memory sink for library metrics.
+
+    Counters accumulate for the lifetime of the process. Observations keep the most
+    recent samples per metric so percentiles reflect current behavior.
+    """
+
+    _lock = threading.Lock()
+    _counters: defaultdict[str, float] = defaultdict(float)
+    _samples: defaultdict[str, deque[float]] = defaultdict(lambda: deque(maxlen=MAX_SAMPLES_PER_METRIC))
+
+    @classmethod
+    def increment(cls, name: str, value: float = 1.0) -> None:
+        with cls._lock:
+            cls._counters[name] += value
+        logger.debug("Metric %s += %s", name, value)
+
+    @classmethod
+    def observe(cls, name: str, value: float) -> None:
+        with cls._lock:
+            cls._samples[name].append(value)
+        logger.debug("Metric %s observed %s", name, value)
+
+    @classmethod
+    def get_counter(cls, name: str) -> float:
+        with cls._lock:
+            return cls._counters.get(name, 0.0)
+
+    @classmethod
+    def get_sample_count(cls, name: str) -> int:
+        with cls._lock:
+            return len(cls._samples.get(name, ()))
+
+    @classmethod
+    def percentile(cls, name: str, percentile: float) -> float | None:
+        """Return the nearest-rank percentile (0-100) of the recorded samples, or None if there are none."""
+        with cls._lock:
+            samples = sorted(cls._samples.get(name, ()))
+        if not samples:
+            return None
+        rank = max(math.ceil(percentile / 100 * len(samples)), 1)
+        return samples[rank - 1]
+
+    @classmethod
+    def snapshot(cls) -> dict[str, dict[str, float]]:
+        with cls._lock:
+            counters = dict(cls._counters)
+            sample_counts = {name: float(len(samples)) for name, samples in cls._samples.items()}
+        return {"counters": counters, "sample_counts": sample_counts}
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._counters.clear()
+            cls._samples.clear()
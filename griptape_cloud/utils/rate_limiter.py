@@ -0,0 +1,35 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+
+class RateLimiter:
+    """Thread-safe token bucket that limits calls to `rate_per_second`, allowing bursts of up to `burst` calls.
+
+    A `rate_per_second` of 0 or less disables limiting.
+    """
+
+    def __init__(self, rate_per_second: float, burst: int | None = None) -> None:
+        self.rate_per_second = rate_per_second
+        self.burst = max(1, burst if burst is not None else int(rate_per_second) or 1)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a call is allowed."""
+        if self.rate_per_second <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate_per_second)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_seconds = (1 - self._tokens) / self.rate_per_second
+            time.sleep(wait_seconds)
@@ -0,0 +1,140 @@
+import itertools
+import logging
+import threading
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import ClassVar
+
+from griptape_cloud.publish_workflow import GRIPTAPE_CLOUD_LIBRARY_CONFIG_KEY
+from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+# Library settings holding the engine-wide caps. Unset or 0 means no cap.
+MAX_IN_FLIGHT_RUNS_SETTING = "GT_CLOUD_MAX_IN_FLIGHT_RUNS"
+MAX_IN_FLIGHT_BATCH_RUNS_SETTING = "GT_CLOUD_MAX_IN_FLIGHT_BATCH_RUNS"
+
+
+class RunPriority(StrEnum):
+    """Priority classes for run admission, in dispatch order."""
+
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+
+
+_PRIORITY_RANK = {priority: rank for rank, priority in enumerate(RunPriority)}
+
+
+@dataclass(eq=False)
+class _Ticket:
+    key: str
+    priority: RunPriority
+    max_in_flight_for_key: int | None
+    sequence: int
+
+
+def _get_cap_setting(name: str) -> int | None:
+    value = GriptapeNodes.ConfigManager().get_config_value(f"{GRIPTAPE_CLOUD_LIBRARY_CONFIG_KEY}.{name}")
+    return int(value) if value else None
+
+
+class RunAdmissionScheduler:
+    """Local admission control for Griptape Cloud runs started by this engine.
+
+    A run holds its slot from submission until it completes. Waiting runs are dispatched by
+    priority class first, then by the fewest in-flight runs for their key (e.g. structure ID) so
+    no single structure starves the others, then in arrival order. Dispatch never blocks on a
+    waiting run whose key or class is at its cap, so lower priority work keeps its own cap saturated.
+
+    The engine-wide caps come from the library settings when the scheduler is first used, and are
+    off unless configured, so only per-node `max_concurrent_runs` limits apply by default.
+    """
+
+    _instance: ClassVar["RunAdmissionScheduler | None"] = None
+    _instance_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self, max_in_flight: int | None = None, max_in_flight_per_priority: dict[RunPriority, int] | None = None
+    ) -> None:
+        self.max_in_flight = max_in_flight
+        self.max_in_flight_per_priority = max_in_flight_per_priority or {}
+        self._condition = threading.Condition()
+        self._sequence = itertools.count()
+        self._waiting: list[_Ticket] = []
+        self._in_flight = 0
+        self._in_flight_by_key: defaultdict[str, int] = defaultdict(int)
+        self._in_flight_by_priority: defaultdict[RunPriority, int] = defaultdict(int)
+
+    @classmethod
+    def get_instance(cls) -> "RunAdmissionScheduler":
+        with cls._instance_lock:
+            if cls._instance is None:
+                max_in_flight_batch = _get_cap_setting(MAX_IN_FLIGHT_BATCH_RUNS_SETTING)
+                cls._instance = cls(
+                    max_in_flight=_get_cap_setting(MAX_IN_FLIGHT_RUNS_SETTING),
+                    max_in_flight_per_priority=(
+                        {RunPriority.BATCH: max_in_flight_batch} if max_in_flight_batch is not None else None
+                    ),
+                )
+            return cls._instance
+
+    @contextmanager
+    def admit(
+        self, key: str, priority: RunPriority, max_in_flight_for_key: int | None = None, *, blocking: bool = True
+    ) -> Iterator[bool]:
+        """Block until the run may be dispatched, and hold its slot for the duration of the context.
+
+        With `blocking=False` the context yields False at once, holding no slot, when the run
+        cannot be dispatched right away. Otherwise it yields True.
+        """
+        ticket = _Ticket(
+            key=key,
+            priority=priority,
+            max_in_flight_for_key=max_in_flight_for_key or None,
+            sequence=next(self._sequence),
+        )
+        with self._condition:
+            self._waiting.append(ticket)
+            admitted = self._next_ticket() is ticket
+            if not admitted and blocking:
+                logger.info("Run for '%s' (%s) is waiting for admission", key, priority)
+                self._condition.wait_for(lambda: self._next_ticket() is ticket)
+                admitted = True
+            self._waiting.remove(ticket)
+            if admitted:
+                self._in_flight += 1
+                self._in_flight_by_key[key] += 1
+                self._in_flight_by_priority[priority] += 1
+                # Another waiting run may also be dispatchable now.
+                self._condition.notify_all()
+        if not admitted:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._in_flight_by_key[key] -= 1
+                self._in_flight_by_priority[priority] -= 1
+                self._condition.notify_all()
+
+    def _has_capacity(self, ticket: _Ticket) -> bool:
+        if self.max_in_flight is not None and self._in_flight >= self.max_in_flight:
+            return False
+        priority_cap = self.max_in_flight_per_priority.get(ticket.priority)
+        if priority_cap is not None and self._in_flight_by_priority[ticket.priority] >= priority_cap:
+            return False
+        return ticket.max_in_flight_for_key is None or self._in_flight_by_key[ticket.key] < ticket.max_in_flight_for_key
+
+    def _next_ticket(self) -> _Ticket | None:
+        """Return the waiting ticket that should be dispatched next, if any has capacity."""
+        ordered = sorted(
+            self._waiting,
+            key=lambda t: (_PRIORITY_RANK[t.priority], self._in_flight_by_key[t.key], t.sequence),
+        )
+        return next((ticket for ticket in ordered if self._has_capacity(ticket)), None)
@@ -0,0 +1,110 @@
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from griptape_cloud_client.types import Unset
+
+from griptape_cloud.utils.metrics_sink import MetricsSink
+
+logger = logging.getLogger("griptape_nodes")
+logger.setLevel(logging.INFO)
+
+STRUCTURE_RUN_STARTED_EVENT_TYPES = frozenset({"StructureRunStarting", "StructureRunRunning"})
+STRUCTURE_RUN_COMPLETED_EVENT_TYPES = frozenset({"StructureRunCompleted"})
+ASSISTANT_RUN_STARTED_EVENT_TYPES = frozenset({"StartStructureRunEvent"})
+ASSISTANT_RUN_COMPLETED_EVENT_TYPES = frozenset({"FinishStructureRunEvent"})
+
+
+def is_run_output_event(event: Any) -> bool:
+    """Whether an event was emitted by the run itself, rather than being a SYSTEM lifecycle event."""
+    return event.origin != "SYSTEM"
+
+
+def _to_epoch_seconds(value: Any) -> float | None:
+    if value is None or isinstance(value, Unset):
+        return None
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return datetime.fromisoformat(str(value)).timestamp()
+    except ValueError:
+        return None
+
+
+def _duration(start: float | None, end: float | None) -> float | None:
+    if start is None or end is None:
+        return None
+    return max(end - start, 0.0)
+
+
+@dataclass
+class RunTimingTracker:
+    """Derives a submit -> queued -> started -> first event -> completed breakdown for a run.
+
+    The submit time is taken from the local clock, every other timestamp comes from the run
+    and its events, so the submit to queued duration includes any local/server clock skew.
+    """
+
+    metric_prefix: str
+    started_event_types: frozenset[str] = STRUCTURE_RUN_STARTED_EVENT_TYPES
+    completed_event_types: frozenset[str] = STRUCTURE_RUN_COMPLETED_EVENT_TYPES
+    submitted_at: float | None = None
+    queued_at: float | None = None
+    started_at: float | None = None
+    first_event_at: float | None = None
+    completed_at: float | None = None
+
+    def mark_submitted(self) -> None:
+        self.submitted_at = time.time()
+
+    def observe_events(self, events: list[Any]) -> None:
+        for event in events:
+            timestamp = _to_epoch_seconds(getattr(event, "timestamp", None))
+            if timestamp is None:
+                continue
+            if event.type_ in self.started_event_types:
+                self.started_at = self.started_at or timestamp
+            elif event.type_ in self.completed_event_types:
+                self.completed_at = timestamp
+            elif is_run_output_event(event) and self.first_event_at is None:
+                self.first_event_at = timestamp
+
+    def observe_run(self, run: Any) -> None:
+        """Fill in timestamps from the run itself, using completion time only if no event reported it.
+
+        The run's start time splits queue from execution time. Without one, the start event or
+        the first event is used instead.
+        """
+        self.queued_at = _to_epoch_seconds(getattr(run, "created_at", None)) or self.queued_at
+        self.started_at = _to_epoch_seconds(getattr(run, "started_at", None)) or self.started_at
+        if self.completed_at is None:
+            self.completed_at = _to_epoch_seconds(getattr(run, "completed_at", None))
+
+    def to_dict(self) -> dict[str, float | None]:
+        # A run without a reported start event is treated as starting with its first event.
+        started_at = self.started_at or self.first_event_at
+        return {
+            "submitted_at": self.submitted_at,
+            "queued_at": self.queued_at,
+            "started_at": self.started_at,
+            "first_event_at": self.first_event_at,
+            "completed_at": self.completed_at,
+            "submit_seconds": _duration(self.submitted_at, self.queued_at),
+            "queue_seconds": _duration(self.queued_at, started_at),
+            "boot_seconds": _duration(self.started_at, self.first_event_at),
+            "execution_seconds": _duration(self.first_event_at or started_at, self.completed_at),
+            "total_seconds": _duration(self.submitted_at, self.completed_at),
+        }
+
+    def emit(self) -> dict[str, float | None]:
+        """Record the breakdown durations in the MetricsSink and return the full breakdown."""
+        timing = self.to_dict()
+        for name, value in timing.items():
+            if name.endswith("_seconds") and value is not None:
+                MetricsSink.observe(f"{self.metric_prefix}.{name}", value)
+        logger.info("Run timing breakdown for %s: %s", self.metric_prefix, timing)
+        return timing
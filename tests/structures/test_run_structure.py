@@ -0,0 +1,68 @@
+from contextlib import ExitStack, contextmanager
+from types import SimpleNamespace
+
+from griptape_cloud.structures import run_structure
+from griptape_cloud.structures.run_structure import RunStructure
+
+
+def _system_event(type_: str) -> SimpleNamespace:
+    return SimpleNamespace(type_=type_, origin="SYSTEM", timestamp=None, payload={})
+
+
+def test_hedge_fires_when_run_only_emits_system_events(monkeypatch) -> None:
+    clock = [0.0]
+    monkeypatch.setattr(run_structure.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(run_structure.time, "sleep", lambda seconds: clock.__setitem__(0, clock[0] + seconds))
+
+    node = RunStructure.__new__(RunStructure)
+    parameters = {"enable_hedging": True, "hedge_after_seconds": 2.0}
+    created_run_ids = []
+
+    def create_structure_run(structure_id: str, args: list[str]) -> SimpleNamespace:
+        created_run_ids.append(f"run-{len(created_run_ids)}")
+        return SimpleNamespace(structure_run_id=created_run_ids[-1])
+
+    def list_structure_run_events(structure_run_id: str, offset: int | None) -> SimpleNamespace:
+        assert clock[0] < 60, "the hedged run was never started"
+        if structure_run_id == "run-1":
+            return SimpleNamespace(events=[_system_event("StructureRunCompleted")], next_offset=1)
+        return SimpleNamespace(events=[_system_event("StructureRunQueued")], next_offset=1)
+
+    @contextmanager
+    def admit(structure_id: str, *, blocking: bool = True):
+        yield True
+
+    monkeypatch.setattr(node, "get_parameter_value", parameters.get, raising=False)
+    monkeypatch.setattr(node, "_create_structure_run", create_structure_run, raising=False)
+    monkeypatch.setattr(node, "_list_structure_run_events", list_structure_run_events, raising=False)
+    monkeypatch.setattr(node, "_is_structure_run_completed_event", lambda e: e.type_ == "StructureRunCompleted")
+    monkeypatch.setattr(node, "_get_structure_run", lambda structure_run_id: SimpleNamespace(status="SUCCEEDED"))
+    monkeypatch.setattr(node, "_get_structure_run_bad_statuses", lambda: ["FAILED", "ERROR", "CANCELLED"])
+    monkeypatch.setattr(node, "_cancel_structure_run", lambda structure_run_id: None, raising=False)
+    monkeypatch.setattr(node, "_admit", admit)
+
+    with ExitStack() as hedge_slots:
+        run = node._run_structure("structure-id", [], include_events=False, hedge_slots=hedge_slots)
+
+    assert created_run_ids == ["run-0", "run-1"]
+    assert run.is_hedge
+    assert run.structure_run_id == "run-1"
+
+
+def test_hedge_slot_is_only_held_when_admitted(monkeypatch) -> None:
+    node = RunStructure.__new__(RunStructure)
+    exits = []
+
+    @contextmanager
+    def admit(structure_id: str, *, blocking: bool = True):
+        try:
+            yield False
+        finally:
+            exits.append(structure_id)
+
+    monkeypatch.setattr(node, "_admit", admit)
+
+    with ExitStack() as hedge_slots:
+        assert not node._try_admit_hedge("structure-id", hedge_slots)
+        assert exits == ["structure-id"]
+    assert exits == ["structure-id"]
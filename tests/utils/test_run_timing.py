@@ -0,0 +1,32 @@
+from types import SimpleNamespace
+
+from griptape_cloud.utils.run_timing import RunTimingTracker
+
+
+def _event(type_: str, timestamp: float, origin: str = "USER") -> SimpleNamespace:
+    return SimpleNamespace(type_=type_, origin=origin, timestamp=timestamp)
+
+
+def test_observe_run_splits_queue_and_execution_at_started_at() -> None:
+    tracker = RunTimingTracker(metric_prefix="test")
+    tracker.observe_events([_event("TextChunkEvent", 130.0)])
+    tracker.observe_run(SimpleNamespace(created_at=100.0, started_at=110.0, completed_at=150.0))
+
+    timing = tracker.to_dict()
+
+    assert timing["queue_seconds"] == 10.0
+    assert timing["boot_seconds"] == 20.0
+    assert timing["execution_seconds"] == 20.0
+
+
+def test_observe_run_without_started_at_falls_back_to_first_event() -> None:
+    tracker = RunTimingTracker(metric_prefix="test")
+    tracker.observe_events([_event("TextChunkEvent", 130.0)])
+    tracker.observe_run(SimpleNamespace(created_at=100.0, started_at=None, completed_at=150.0))
+
+    timing = tracker.to_dict()
+
+    assert timing["started_at"] is None
+    assert timing["queue_seconds"] == 30.0
+    assert timing["boot_seconds"] is None
+    assert timing["execution_seconds"] == 20.0